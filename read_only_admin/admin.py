@@ -4,32 +4,110 @@
 # read_only_admin/admin.py
 
 
-from functools import partial
 from collections import OrderedDict
-from typing import Any, Dict, List, Type, Tuple, Union, Callable, Optional
+from functools import partial, update_wrapper
+from contextlib import ExitStack, contextmanager
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Callable,
+    Iterator,
+    Optional,
+    Sequence,
+)
 
-from django.db.models import Model
-from django.http import HttpRequest
+from django.db import router
+from django.urls import URLPattern, path
+from django.db.models import Model, QuerySet
 from django import __version__ as django_version
 from django.core.handlers.wsgi import WSGIRequest
-from django.contrib.admin.views.main import ChangeList
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_permission_codename
-from django.contrib.admin.utils import flatten_fieldsets
 from django.contrib.admin.filters import SimpleListFilter
-from django.contrib.admin import ModelAdmin, TabularInline
-from django.forms.models import BaseModelFormSet, modelformset_factory
+from django.contrib.admin.utils import unquote, flatten_fieldsets
+from django.core.exceptions import ValidationError, PermissionDenied
+from django.contrib.admin import AdminSite, ModelAdmin, TabularInline
+from django.http import Http404, HttpRequest, HttpResponse, StreamingHttpResponse
+from django.forms.models import (
+    BaseModelFormSet,
+    BaseInlineFormSet,
+    modelformset_factory,
+)
+from django.contrib.admin.views.main import (
+    ALL_VAR,
+    PAGE_VAR,
+    ORDER_VAR,
+    SEARCH_VAR,
+    ChangeList,
+)
 
 from read_only_admin.conf import settings
-from read_only_admin.utils import get_read_only_permission_codename
+from read_only_admin.routers import use_replica
+from read_only_admin.registry import get_registry_entry
+from read_only_admin.signals import register_versioned_model
+from read_only_admin.admission import AdmissionDenied, admission
+from read_only_admin.search import BaseSearchBackend, get_search_backend
+from read_only_admin.filters import CACHED_FILTERS, CachedFieldListFilter
+from read_only_admin.indexes import get_ordering_field, is_indexed_ordering
+from read_only_admin.serializers import dumps, stream_results, get_values_fields
+from read_only_admin.db import QueryBudgetExceeded, query_budget, read_only_transaction
+from read_only_admin.streaming import (
+    ClosingIterator,
+    StreamedResultList,
+    is_streaming,
+    stream_changelist,
+)
+from read_only_admin.resolver import (
+    is_read_only,
+    get_read_only_fields,
+    has_read_only_permission,
+    aget_read_only_content_types,
+)
 
 
 __all__: List[str] = [
+    "SAFE_METHODS",
     "ReadonlyAdmin",
     "ReadonlyStackedInline",
     "ReadonlyTabularInline",
 ]
 
 
+SAFE_METHODS: Tuple[str, ...] = ("GET", "HEAD", "OPTIONS")
+UNSORTABLE_REASON: str = _(
+    "Sorting by this column is disabled because it isn't backed by a database index."
+)
+
+
+async def _arun(
+    request: HttpRequest, method: Callable, **kwargs: Dict[str, Any]  # type: ignore
+) -> Any:
+    """
+    Resolve read only permissions without blocking event loop and run sync admin method in thread.
+
+    :param request: django HTTP request object
+    :type request: HttpRequest
+    :param method: sync admin method
+    :type method: Callable
+    :param kwargs: method args
+    :type kwargs: Dict[str, Any]
+    :return: method result
+    :rtype: Any
+    """  # noqa: E501
+    # lazy import, asgiref is not required by django 2.2
+    from asgiref.sync import sync_to_async
+
+    await aget_read_only_content_types(user=request.user)
+
+    return await sync_to_async(method)(request=request, **kwargs)
+
+
 class ReadonlyChangeList(ChangeList):
     """Readonly admin change list."""
 
@@ -87,6 +165,36 @@ class ReadonlyChangeList(ChangeList):
         :param kwargs: additional args
         :type kwargs: Dict[str, Any]
         """  # noqa: E501
+        self.sorting_restricted: bool = bool(
+            settings.READ_ONLY_ADMIN_INDEXED_SORTING
+        ) and is_read_only(user=request.user, model=model)
+        self.unsortable_reasons: Dict[Union[Callable, str], str] = {}  # type: ignore
+        if self.sorting_restricted:
+            for field_name in sortable_by:
+                ordering_field = get_ordering_field(
+                    model=model, model_admin=model_admin, field_name=field_name
+                )
+                if ordering_field and not is_indexed_ordering(
+                    model=model, ordering_field=ordering_field
+                ):
+                    self.unsortable_reasons[field_name] = UNSORTABLE_REASON
+            sortable_by = [  # type: ignore
+                field_name
+                for field_name in sortable_by
+                if field_name not in self.unsortable_reasons
+            ]
+        read_only_fields: Tuple[str, ...] = get_read_only_fields(
+            user=request.user, model=model
+        )
+        if read_only_fields:
+            list_editable = [
+                field_name
+                for field_name in list_editable
+                if field_name not in read_only_fields
+            ]
+        # results are got during initialization
+        self.readonly: bool = is_read_only(user=request.user, model=model)
+        self.streaming: bool = False
         # dealing with Django 4.x backward incompatibility
         if django_version.startswith("4"):
             super(ReadonlyChangeList, self).__init__(
@@ -122,26 +230,59 @@ class ReadonlyChangeList(ChangeList):
                 sortable_by=sortable_by,
             )
 
-        self.readonly = False
+    def get_results(self, request: WSGIRequest) -> None:
+        """
+        Overridden to keep rows of streamed change list out of memory, they are loaded only while streaming.
 
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-                self.readonly = True
+        :param request: django WSGI request object
+        :type request: WSGIRequest
+        """  # noqa: E501
+        super(ReadonlyChangeList, self).get_results(request)
+        # list editable change lists build formset from results, so they aren't streamed
+        if not self.list_editable and is_streaming(cl=self):
+            self.result_list = StreamedResultList(
+                queryset=self.result_list, count=self.result_count
+            )
+
+    def get_ordering_field(
+        self, field_name: Union[Callable, str]  # type: ignore
+    ) -> Any:
+        """
+        Overridden to ignore ordering by not sortable columns from query string when sorting is restricted.
+
+        :param field_name: change list column
+        :type field_name: Union[Callable, str]
+        :return: ordering field name or expression
+        :rtype: Any
+        """  # noqa: E501
+        if self.sorting_restricted and field_name in self.unsortable_reasons:
+
+            return None
+
+        return super(ReadonlyChangeList, self).get_ordering_field(field_name=field_name)
 
 
 class ReadonlyAdmin(ModelAdmin):  # type: ignore
     """Readonly admin."""
 
     change_form_template: str = "read_only_admin/change_form.html"
+    change_list_template: str = "read_only_admin/change_list.html"
+    # expose read only users JSON list and detail endpoints
+    json_views: bool = False
+    # cache read only change lists rows HTML until this model field value changes
+    row_cache_version_field: Optional[str] = None
+
+    def __init__(self, model: Type[Model], admin_site: AdminSite) -> None:
+        """
+        Overridden to track model data changes for cached filters choices.
+
+        :param model: django model
+        :type model: Type[Model]
+        :param admin_site: admin site
+        :type admin_site: AdminSite
+        """
+        super(ReadonlyAdmin, self).__init__(model, admin_site)
+        register_versioned_model(model=model)
 
     def get_changelist(  # pylint: disable=R0201
         self, request: HttpRequest, **kwargs: Dict[str, Any]
@@ -164,6 +305,8 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
         """
         Empty FormSet class for use on the changelist page if list_editable and readonly permission is used.
 
+        Fields read only for user are excluded from FormSet.
+
         :param request: django HTTP request object
         :type request: HttpRequest
         :param kwargs: additional args
@@ -171,37 +314,68 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
         :return: FormSet for changelist
         :rtype: BaseModelFormSet
         """  # noqa: E501
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-                defaults = {
-                    "formfield_callback": partial(
-                        self.formfield_for_dbfield, request=request
-                    )
-                }
-                defaults.update(kwargs)  # type: ignore
-
-                return modelformset_factory(
-                    self.model,
-                    self.get_changelist_form(request),
-                    extra=0,
-                    fields=(),
-                    **defaults,  # type: ignore
+        if is_read_only(user=request.user, model=self.model):
+            fields: Union[List[str], Tuple[str, ...]] = ()
+        else:
+            read_only_fields: Tuple[str, ...] = get_read_only_fields(
+                user=request.user, model=self.model
+            )
+            if not read_only_fields:
+
+                return super(ReadonlyAdmin, self).get_changelist_formset(
+                    request=request, **kwargs
                 )
 
-        return super(ReadonlyAdmin, self).get_changelist_formset(
-            request=request, **kwargs
+            fields = [
+                field for field in self.list_editable if field not in read_only_fields
+            ]
+
+        defaults = {
+            "formfield_callback": partial(self.formfield_for_dbfield, request=request)
+        }
+        defaults.update(kwargs)  # type: ignore
+
+        return modelformset_factory(
+            self.model,
+            self.get_changelist_form(request),
+            extra=0,
+            fields=fields,
+            **defaults,  # type: ignore
         )
 
-    def get_readonly_fields(  # noqa: CCR001
+    def get_list_filter(  # type: ignore  # noqa: CCR001
+        self, request: HttpRequest
+    ) -> Union[List[Union[str, Tuple[str, Any], Any]], Tuple[Any, ...]]:
+        """
+        Overridden to use cached filters choices for read only users if enabled.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: list filter
+        :rtype: Union[List[Union[str, Tuple[str, Any], Any]], Tuple[Any, ...]]
+        """
+        list_filter: Sequence[Any] = super(ReadonlyAdmin, self).get_list_filter(
+            request=request
+        )
+        if settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT is None or not is_read_only(
+            user=request.user, model=self.model
+        ):
+
+            return list_filter  # type: ignore
+
+        cached: List[Union[str, Tuple[str, Any], Any]] = []
+        for item in list_filter:
+            if isinstance(item, str):
+                cached.append((item, CachedFieldListFilter))
+            elif isinstance(item, (list, tuple)):
+                cached.append((item[0], CACHED_FILTERS.get(item[1], item[1])))
+            else:
+                # custom list filters are used as is
+                cached.append(item)
+
+        return cached
+
+    def get_readonly_fields(  # noqa: CCR001, CFQ004
         self, request: HttpRequest, obj: Optional[Model] = None
     ) -> Union[List[str], Tuple[str]]:
         """
@@ -209,6 +383,8 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
 
         Get from: https://github.com/anupamshakya7/django-admin-hack/.
 
+        Fields read only by field level permissions are added for other users.
+
         :param request: django HTTP request object
         :type request: HttpRequest
         :param obj: an object
@@ -216,34 +392,30 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
         :return: readonly fields
         :rtype: Union[List[str], Tuple[str]]
         """
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-                if self.get_fieldsets(request=request, obj=obj):
-
-                    return flatten_fieldsets(  # type: ignore
-                        self.get_fieldsets(request=request, obj=obj)
-                    )
-                else:
-
-                    return list(
-                        set(
-                            [field.name for field in self.opts.local_fields]
-                            + [  # noqa: W503
-                                field.name for field in self.opts.local_many_to_many
-                            ]
-                        )
-                    )
+        if is_read_only(user=request.user, model=self.model):
+            # generated fieldsets are built from form, which asks read only fields
+            if self.fieldsets or self.fields:
+
+                return flatten_fieldsets(  # type: ignore
+                    self.get_fieldsets(request=request, obj=obj)
+                )
+            else:
+
+                return list(get_registry_entry(model=self.model).fields)
+
+        readonly_fields: Union[List[str], Tuple[str]] = super(  # type: ignore
+            ReadonlyAdmin, self
+        ).get_readonly_fields(request=request, obj=obj)
+        read_only_fields: Tuple[str, ...] = get_read_only_fields(
+            user=request.user, model=self.model
+        )
+        if read_only_fields:
+
+            return list(readonly_fields) + [
+                field for field in read_only_fields if field not in readonly_fields
+            ]
 
-        return self.readonly_fields  # type: ignore
+        return readonly_fields
 
     def get_actions(  # noqa: CCR001
         self, request: HttpRequest
@@ -259,14 +431,11 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
         :rtype: OrderedDict[str, Any]
         """  # noqa: E501
         actions = super(ReadonlyAdmin, self).get_actions(request)
-        label: str = self.model._meta.app_label
-        model: str = self.model.__name__.lower()
-        perm = f"{label}.{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_{model}"  # noqa: E501
         if (  # noqa: SIM102
-            request.user.has_perm(perm) and not request.user.is_superuser
+            is_read_only(user=request.user, model=self.model)
+            and "delete_selected" in actions  # noqa: W503
         ):
-            if "delete_selected" in actions:
-                del actions["delete_selected"]
+            del actions["delete_selected"]
 
         return (
             OrderedDict()
@@ -274,6 +443,798 @@ class ReadonlyAdmin(ModelAdmin):  # type: ignore
             else actions
         )
 
+    def get_model_perms(self, request: HttpRequest) -> Dict[str, bool]:
+        """
+        Overridden to return view only permissions for read only models without add, change and delete checks.
+
+        In view permission mode read only permission is checked by its name from read only registry.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: model permissions
+        :rtype: Dict[str, bool]
+        """  # noqa: E501
+        if is_read_only(user=request.user, model=self.model):
+            # read only permission name comes from registry instead of being re-derived
+            permission: str = get_registry_entry(model=self.model).permission
+            view: bool = (  # noqa: ECE001
+                settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE
+                and request.user.has_perm(permission)  # noqa: W503
+            ) or super(ReadonlyAdmin, self).has_view_permission(request=request)
+
+            return {"add": False, "change": False, "delete": False, "view": view}
+
+        return super(ReadonlyAdmin, self).get_model_perms(request=request)
+
+    def has_view_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Overridden to treat read only permission as view permission in view permission mode.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user view permission
+        :rtype: bool
+        """  # noqa: E501
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and has_read_only_permission(
+            user=request.user, model=self.model
+        ):
+
+            return True
+
+        return super(ReadonlyAdmin, self).has_view_permission(request=request, obj=obj)
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Overridden to deny changes to read only users in view permission mode, so django view only path is used.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user change permission
+        :rtype: bool
+        """  # noqa: E501
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and is_read_only(
+            user=request.user, model=self.model
+        ):
+
+            return False
+
+        return super(ReadonlyAdmin, self).has_change_permission(
+            request=request, obj=obj
+        )
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        """
+        Overridden to deny additions to read only users in view permission mode.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: has user add permission
+        :rtype: bool
+        """
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and is_read_only(
+            user=request.user, model=self.model
+        ):
+
+            return False
+
+        return super(ReadonlyAdmin, self).has_add_permission(request=request)
+
+    def has_delete_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Overridden to deny deletions to read only users in view permission mode.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user delete permission
+        :rtype: bool
+        """
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and is_read_only(
+            user=request.user, model=self.model
+        ):
+
+            return False
+
+        return super(ReadonlyAdmin, self).has_delete_permission(
+            request=request, obj=obj
+        )
+
+    def get_replica_database(self, request: HttpRequest) -> Optional[str]:
+        """
+        Get replica database alias for read only user safe requests.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: replica database alias
+        :rtype: Optional[str]
+        """
+        if (
+            settings.READ_ONLY_ADMIN_REPLICA_DATABASE
+            and request.method in SAFE_METHODS  # noqa: W503
+            and is_read_only(user=request.user, model=self.model)  # noqa: W503
+        ):
+
+            return settings.READ_ONLY_ADMIN_REPLICA_DATABASE
+
+        return None
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:  # type: ignore
+        """
+        Overridden to read from replica database for read only users.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: admin queryset
+        :rtype: QuerySet
+        """
+        queryset: QuerySet = super(ReadonlyAdmin, self).get_queryset(  # type: ignore
+            request=request
+        )
+        using: Optional[str] = self.get_replica_database(request=request)
+
+        return queryset.using(using) if using else queryset
+
+    def get_search_results(
+        self, request: HttpRequest, queryset: QuerySet, search_term: str  # type: ignore
+    ) -> Tuple[QuerySet, bool]:  # type: ignore
+        """
+        Overridden to search read only users change lists using configured search backend index.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param queryset: change list queryset
+        :type queryset: QuerySet
+        :param search_term: search term
+        :type search_term: str
+        :return: filtered queryset and may it have duplicates
+        :rtype: Tuple[QuerySet, bool]
+        """  # noqa: E501
+        backend: Optional[BaseSearchBackend] = get_search_backend()
+        if (
+            backend is not None
+            and search_term  # noqa: W503
+            and is_read_only(user=request.user, model=self.model)  # noqa: W503
+        ):
+            results: Optional[QuerySet] = backend.search(  # type: ignore
+                queryset=queryset,
+                search_fields=self.get_search_fields(request=request),
+                search_term=search_term,
+            )
+            if results is not None:
+
+                return results, False
+
+        return super(ReadonlyAdmin, self).get_search_results(
+            request=request, queryset=queryset, search_term=search_term
+        )
+
+    @contextmanager
+    def read_only_view(self, request: HttpRequest) -> Iterator[bool]:
+        """
+        Context for admin views executed for read only users.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :yield: is replica, read only transaction or query budget used
+        :rtype: Iterator[bool]
+        """
+        using: Optional[str] = self.get_replica_database(request=request)
+        read_only: bool = is_read_only(user=request.user, model=self.model)
+        transaction: bool = settings.READ_ONLY_ADMIN_READ_ONLY_TRANSACTION and read_only
+        budget: bool = bool(settings.READ_ONLY_ADMIN_QUERY_BUDGET) and read_only
+
+        with ExitStack() as stack:
+            stack.enter_context(use_replica(using=using))
+            if transaction:
+                stack.enter_context(
+                    read_only_transaction(using=router.db_for_write(self.model))
+                )
+            if budget:
+                stack.enter_context(
+                    query_budget(
+                        using=[router.db_for_read(self.model)],
+                        timeout=settings.READ_ONLY_ADMIN_QUERY_BUDGET,
+                    )
+                )
+            yield bool(using) or transaction or budget
+
+    def is_read_only_request(self, request: HttpRequest) -> bool:
+        """
+        Check is request made by read only user and reject not safe ones.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: is request made by read only user
+        :rtype: bool
+        :raises PermissionDenied: not safe request made by read only user
+        """
+        if not is_read_only(user=request.user, model=self.model):
+
+            return False
+
+        if request.method not in SAFE_METHODS:
+
+            raise PermissionDenied
+
+        return True
+
+    def _read_only_response(
+        self, request: HttpRequest, view: Callable, **kwargs: Dict[str, Any]  # type: ignore  # noqa: E501
+    ) -> HttpResponse:
+        """
+        Run admin view in read only context, response is rendered inside it only if context changes queries.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param view: admin view
+        :type view: Callable
+        :param kwargs: view args
+        :type kwargs: Dict[str, Any]
+        :return: response
+        :rtype: HttpResponse
+        """  # noqa: E501
+        try:
+            with self.read_only_view(request=request) as active:
+                response: HttpResponse = view(request, **kwargs)
+                # template response render is lazy and must be done inside context,
+                # otherwise it's left lazy for subclasses changing context data
+                if active and hasattr(response, "render") and not response.is_rendered:  # type: ignore  # noqa: E501
+                    response.render()  # type: ignore
+        except QueryBudgetExceeded:
+
+            return self.query_budget_exceeded_response(request=request)
+
+        return response
+
+    def query_budget_exceeded_response(self, request: HttpRequest) -> HttpResponse:
+        """
+        Response for read only user request which queries exceeded time budget.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: query budget exceeded response
+        :rtype: HttpResponse
+        """
+        context: Dict[str, Any] = {
+            **self.admin_site.each_context(request),  # type: ignore
+            "title": _("Query too expensive"),
+            "opts": self.model._meta,
+            "back_url": request.path,
+        }
+
+        return TemplateResponse(
+            request=request,
+            template="read_only_admin/query_budget_exceeded.html",
+            context=context,
+            status=503,
+        )
+
+    def is_expensive_request(self, request: HttpRequest) -> bool:
+        """
+        Check is read only user request expensive: show all or not filtered large model change list.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: is request expensive
+        :rtype: bool
+        """  # noqa: E501
+        if (
+            settings.READ_ONLY_ADMIN_ADMISSION_LIMIT is None
+            and settings.READ_ONLY_ADMIN_ADMISSION_GLOBAL_LIMIT is None  # noqa: W503
+        ) or not is_read_only(user=request.user, model=self.model):
+
+            return False
+
+        if ALL_VAR in request.GET:
+
+            return True
+
+        large: List[str] = settings.READ_ONLY_ADMIN_ADMISSION_LARGE_MODELS
+
+        # not filtered change list counts all table rows
+        return self.model._meta.label_lower in [
+            label.lower() for label in large
+        ] and not (set(request.GET) - {PAGE_VAR, ORDER_VAR})
+
+    def admission_denied_response(self, request: HttpRequest) -> HttpResponse:
+        """
+        Fast response for expensive request rejected because of concurrency limit.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: busy response
+        :rtype: HttpResponse
+        """
+        response: HttpResponse = HttpResponse(
+            content=str(_("Server is busy, please retry later.")),
+            content_type="text/plain; charset=utf-8",
+            status=503,
+        )
+        response["Retry-After"] = str(settings.READ_ONLY_ADMIN_ADMISSION_RETRY_AFTER)
+
+        return response
+
+    def _admitted_response(
+        self, request: HttpRequest, view: Callable, **kwargs: Dict[str, Any]  # type: ignore  # noqa: E501
+    ) -> HttpResponse:
+        """
+        Run admin view in read only context, taking concurrency limit slot for expensive requests.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param view: admin view
+        :type view: Callable
+        :param kwargs: view args
+        :type kwargs: Dict[str, Any]
+        :return: rendered response
+        :rtype: HttpResponse
+        """  # noqa: E501
+        if not self.is_expensive_request(request=request):
+
+            return self._read_only_response(request=request, view=view, **kwargs)
+
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(admission())
+            except AdmissionDenied:
+
+                return self.admission_denied_response(request=request)
+
+            response: HttpResponse = self._read_only_response(
+                request=request, view=view, **kwargs
+            )
+            if isinstance(response, StreamingHttpResponse):
+                # keep slot taken until rows are streamed
+                response.streaming_content = ClosingIterator(
+                    iterator=response.streaming_content, stack=stack.pop_all()
+                )
+
+        return response
+
+    def _changelist_view(
+        self, request: HttpRequest, extra_context: Optional[Dict[str, Any]] = None
+    ) -> HttpResponse:
+        """
+        Change list view streaming read only show all change lists rows.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param extra_context: additional template context
+        :type extra_context: Optional[Dict[str, Any]]
+        :return: change list view response
+        :rtype: HttpResponse
+        """
+        response: HttpResponse = super(ReadonlyAdmin, self).changelist_view(
+            request=request, extra_context=extra_context
+        )
+        cl: Optional[ChangeList] = (getattr(response, "context_data", None) or {}).get(
+            "cl"
+        )
+        if cl is None or not is_streaming(cl=cl):
+
+            return response
+
+        cl.streaming = True  # type: ignore
+        response.render()  # type: ignore
+
+        return StreamingHttpResponse(
+            streaming_content=self._stream_changelist(
+                request=request,
+                cl=cl,
+                content=response.content.decode(response.charset),  # type: ignore
+            ),
+            content_type=response["Content-Type"],
+            status=response.status_code,
+        )
+
+    def _stream_changelist(
+        self, request: HttpRequest, cl: ChangeList, content: str
+    ) -> Iterator[str]:
+        """
+        Stream change list rows in read only context, response is consumed after view returned.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param cl: change list
+        :type cl: ChangeList
+        :param content: change list page rendered with marker row
+        :type content: str
+        :yield: page parts
+        :rtype: Iterator[str]
+        """  # noqa: E501
+        with self.read_only_view(request=request):
+            yield from stream_changelist(cl=cl, content=content)
+
+    def changelist_view(  # type: ignore
+        self, request: HttpRequest, extra_context: Optional[Dict[str, Any]] = None
+    ) -> HttpResponse:
+        """
+        Overridden to run view in read only context and limit expensive requests concurrency.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param extra_context: additional template context
+        :type extra_context: Optional[Dict[str, Any]]
+        :return: change list view response
+        :rtype: HttpResponse
+        """  # noqa: E501
+        # reject list editable saves and actions before any form processing,
+        # actions are run only if they are allowed by disabling empty actions
+        if request.method == "POST" and (
+            settings.READ_ONLY_ADMIN_EMPTY_ACTIONS
+            or "action" not in request.POST  # noqa: W503
+            or "_save" in request.POST  # noqa: W503
+        ):
+            self.is_read_only_request(request=request)
+
+        return self._admitted_response(
+            request=request,
+            view=self._changelist_view,
+            extra_context=extra_context,  # type: ignore
+        )
+
+    def changeform_view(
+        self,
+        request: HttpRequest,
+        object_id: Optional[str] = None,
+        form_url: str = "",
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> HttpResponse:
+        """
+        Overridden to run view in read only context.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param object_id: object ID
+        :type object_id: Optional[str]
+        :param form_url: form URL
+        :type form_url: str
+        :param extra_context: additional template context
+        :type extra_context: Optional[Dict[str, Any]]
+        :return: change form view response
+        :rtype: HttpResponse
+        """
+        # read only users views run without write transaction, django wraps only
+        # public changeform_view in transaction.atomic, its body is not in stubs
+        return self._read_only_response(
+            request=request,
+            view=self._changeform_view  # type: ignore
+            if self.is_read_only_request(request=request)
+            else super(ReadonlyAdmin, self).changeform_view,  # noqa: W503
+            object_id=object_id,  # type: ignore
+            form_url=form_url,  # type: ignore
+            extra_context=extra_context,  # type: ignore
+        )
+
+    def history_view(
+        self,
+        request: HttpRequest,
+        object_id: str,
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> HttpResponse:
+        """
+        Overridden to run view in read only context.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param object_id: object ID
+        :type object_id: str
+        :param extra_context: additional template context
+        :type extra_context: Optional[Dict[str, Any]]
+        :return: history view response
+        :rtype: HttpResponse
+        """
+        return self._read_only_response(
+            request=request,
+            view=super(ReadonlyAdmin, self).history_view,
+            object_id=object_id,  # type: ignore
+            extra_context=extra_context,  # type: ignore
+        )
+
+    def delete_view(
+        self,
+        request: HttpRequest,
+        object_id: str,
+        extra_context: Optional[Dict[str, Any]] = None,
+    ) -> HttpResponse:
+        """
+        Overridden to run view in read only context.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param object_id: object ID
+        :type object_id: str
+        :param extra_context: additional template context
+        :type extra_context: Optional[Dict[str, Any]]
+        :return: delete view response
+        :rtype: HttpResponse
+        """
+        # read only users views run without write transaction, django wraps only
+        # public delete_view in transaction.atomic, its body is not in stubs
+        return self._read_only_response(
+            request=request,
+            view=self._delete_view  # type: ignore
+            if self.is_read_only_request(request=request)
+            else super(ReadonlyAdmin, self).delete_view,  # noqa: W503
+            object_id=object_id,  # type: ignore
+            extra_context=extra_context,  # type: ignore
+        )
+
+    def get_urls(self) -> List[URLPattern]:  # noqa: CFQ004
+        """
+        Overridden to add JSON endpoints if enabled.
+
+        :return: admin URLs
+        :rtype: List[URLPattern]
+        """
+        urls: List[URLPattern] = super(ReadonlyAdmin, self).get_urls()
+        if not self.json_views:
+
+            return urls
+
+        def wrap(view: Callable) -> Callable:  # type: ignore
+            def wrapper(*args: List[Any], **kwargs: Dict[str, Any]) -> HttpResponse:
+                return self.admin_site.admin_view(view)(*args, **kwargs)
+
+            wrapper.model_admin = self  # type: ignore
+
+            return update_wrapper(wrapper, view)
+
+        opts = self.model._meta
+        info: str = f"{opts.app_label}_{opts.model_name}"
+
+        return [
+            path("json/", wrap(self.json_list_view), name=f"{info}_json_list"),
+            path(
+                "<path:object_id>/json/",
+                wrap(self.json_detail_view),
+                name=f"{info}_json_detail",
+            ),
+        ] + urls
+
+    def has_json_permission(self, request: HttpRequest) -> bool:
+        """
+        Check can user use JSON endpoints: only read only users with view permission can.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: can user use JSON endpoints
+        :rtype: bool
+        """  # noqa: E501
+        return self.is_read_only_request(
+            request=request
+        ) and self.has_view_or_change_permission(  # type: ignore
+            request=request
+        )
+
+    def get_json_list_fields(self, request: HttpRequest) -> List[str]:
+        """
+        Get JSON list endpoint fields, model fields from list display.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: fields names
+        :rtype: List[str]
+        """
+        return get_values_fields(
+            model=self.model, fields=self.get_list_display(request=request)
+        )
+
+    def get_json_detail_fields(self, request: HttpRequest) -> List[str]:
+        """
+        Get JSON detail endpoint fields, model fields from read only fields.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: fields names
+        :rtype: List[str]
+        """
+        return get_values_fields(
+            model=self.model, fields=self.get_readonly_fields(request=request)
+        )
+
+    def _json_list_view(self, request: HttpRequest) -> HttpResponse:  # noqa: CCR001
+        """
+        JSON list endpoint, searched and ordered like change list.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: JSON page or streamed JSON of all rows
+        :rtype: HttpResponse
+        """
+        queryset, may_have_duplicates = self.get_search_results(
+            request=request,
+            queryset=self.get_queryset(request=request),
+            search_term=request.GET.get(SEARCH_VAR, ""),
+        )
+        if may_have_duplicates:
+            queryset = queryset.distinct()
+        ordering: List[Any] = list(  # noqa: ECE001
+            self.get_ordering(request=request) or self.model._meta.ordering or []
+        )
+        pk_name: str = self.model._meta.pk.name
+        # pagination needs deterministic ordering
+        if not {"pk", "-pk", pk_name, f"-{pk_name}"} & {
+            field for field in ordering if isinstance(field, str)
+        }:
+            ordering.append("-pk")
+        rows: QuerySet = queryset.order_by(*ordering).values(  # type: ignore
+            *self.get_json_list_fields(request=request)
+        )
+
+        # like change list, all rows are shown only up to list_max_show_all
+        if ALL_VAR in request.GET and rows.count() <= self.list_max_show_all:
+
+            # django accepts str chunks too
+            content: Iterator[Any] = self._stream_json(request=request, rows=rows)
+
+            return StreamingHttpResponse(  # type: ignore
+                streaming_content=content, content_type="application/json"
+            )
+
+        try:
+            page: int = max(int(request.GET.get(PAGE_VAR, 1)), 1)
+        except ValueError:
+            page = 1
+        start: int = (page - 1) * self.list_per_page
+        # one more row tells is there next page without counting all rows
+        results: List[Dict[str, Any]] = list(  # noqa: ECE001
+            rows[start : start + self.list_per_page + 1]  # noqa: E203
+        )
+
+        return HttpResponse(
+            content=dumps(
+                data={
+                    "results": results[: self.list_per_page],
+                    "page": page,
+                    "has_next": len(results) > self.list_per_page,
+                }
+            ),
+            content_type="application/json",
+        )
+
+    def _stream_json(self, request: HttpRequest, rows: QuerySet) -> Iterator[str]:  # type: ignore  # noqa: E501
+        """
+        Stream JSON list rows in read only context, response is consumed after view returned.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param rows: rows queryset
+        :type rows: QuerySet
+        :yield: JSON document parts
+        :rtype: Iterator[str]
+        """  # noqa: E501
+        with self.read_only_view(request=request):
+            yield from stream_results(
+                rows=rows.iterator(
+                    chunk_size=settings.READ_ONLY_ADMIN_STREAMING_CHUNK_SIZE
+                )
+            )
+
+    def _json_detail_view(self, request: HttpRequest, object_id: str) -> HttpResponse:
+        """
+        JSON detail endpoint.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param object_id: object ID
+        :type object_id: str
+        :return: JSON object
+        :rtype: HttpResponse
+        :raises Http404: object not found
+        """
+        try:
+            pk: Any = self.model._meta.pk.to_python(unquote(object_id))  # noqa: ECE001
+        except ValidationError:
+
+            raise Http404
+
+        row: Optional[Dict[str, Any]] = (  # noqa: ECE001
+            self.get_queryset(request=request)
+            .filter(pk=pk)
+            .values(*self.get_json_detail_fields(request=request))
+            .first()
+        )
+        if row is None:
+
+            raise Http404
+
+        return HttpResponse(content=dumps(data=row), content_type="application/json")
+
+    def json_list_view(self, request: HttpRequest) -> HttpResponse:
+        """
+        Read only users JSON list endpoint, paginated by "p" parameter or streamed with "all" one.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: JSON list response
+        :rtype: HttpResponse
+        :raises PermissionDenied: user is not read only or has no view permission
+        """  # noqa: E501
+        if not self.has_json_permission(request=request):
+
+            raise PermissionDenied
+
+        return self._admitted_response(request=request, view=self._json_list_view)
+
+    def json_detail_view(self, request: HttpRequest, object_id: str) -> HttpResponse:
+        """
+        Read only users JSON detail endpoint.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param object_id: object ID
+        :type object_id: str
+        :return: JSON detail response
+        :rtype: HttpResponse
+        :raises PermissionDenied: user is not read only or has no view permission
+        """
+        if not self.has_json_permission(request=request):
+
+            raise PermissionDenied
+
+        return self._read_only_response(
+            request=request,
+            view=self._json_detail_view,
+            object_id=object_id,  # type: ignore
+        )
+
+    async def aget_changelist_formset(
+        self, request: HttpRequest, **kwargs: Dict[str, Any]
+    ) -> Type[BaseModelFormSet]:
+        """
+        Async version of get_changelist_formset.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param kwargs: additional args
+        :type kwargs: Dict[str, Any]
+        :return: FormSet for changelist
+        :rtype: BaseModelFormSet
+        """
+        return await _arun(
+            request=request, method=self.get_changelist_formset, **kwargs
+        )
+
+    async def aget_readonly_fields(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> Union[List[str], Tuple[str]]:
+        """
+        Async version of get_readonly_fields.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: readonly fields
+        :rtype: Union[List[str], Tuple[str]]
+        """
+        return await _arun(
+            request=request, method=self.get_readonly_fields, obj=obj  # type: ignore
+        )
+
+    async def aget_actions(self, request: HttpRequest) -> "OrderedDict[str, Any]":
+        """
+        Async version of get_actions.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: admin actions
+        :rtype: OrderedDict[str, Any]
+        """
+        return await _arun(request=request, method=self.get_actions)
+
 
 class ReadonlyInline(TabularInline):  # type: ignore
     """Readonly admin inline."""
@@ -291,6 +1252,10 @@ class ReadonlyInline(TabularInline):  # type: ignore
         :return: has user add permission
         :rtype: bool
         """
+        if is_read_only(user=request.user, model=self.model):
+
+            return False
+
         if self.opts.auto_created:
             # We're checking the rights to an auto-created intermediate model,
             # which doesn't have its own individual permissions. The user needs
@@ -298,20 +1263,6 @@ class ReadonlyInline(TabularInline):  # type: ignore
             # be able to do anything with the intermediate model.
             return self.has_change_permission(request, obj)
 
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-
-                return False
-
         codename = get_permission_codename("add", self.opts)
 
         return request.user.has_perm(f"{self.opts.app_label}.{codename}")
@@ -327,6 +1278,10 @@ class ReadonlyInline(TabularInline):  # type: ignore
         :return: has user delete permission
         :rtype: bool
         """
+        if is_read_only(user=request.user, model=self.model):
+
+            return False
+
         if self.opts.auto_created:
             # We're checking the rights to an auto-created intermediate model,
             # which doesn't have its own individual permissions. The user needs
@@ -334,30 +1289,94 @@ class ReadonlyInline(TabularInline):  # type: ignore
             # be able to do anything with the intermediate model.
             return self.has_change_permission(request, obj)
 
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-
-                return False
-
         codename = get_permission_codename("delete", self.opts)
 
         return request.user.has_perm(f"{self.opts.app_label}.{codename}")
 
+    def has_view_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Overridden to treat read only permission as view permission in view permission mode.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user view permission
+        :rtype: bool
+        """  # noqa: E501
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and has_read_only_permission(
+            user=request.user, model=self.model
+        ):
+
+            return True
+
+        return super(ReadonlyInline, self).has_view_permission(request=request, obj=obj)
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Overridden to deny changes to read only users in view permission mode, so django view only path is used.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user change permission
+        :rtype: bool
+        """  # noqa: E501
+        if settings.READ_ONLY_ADMIN_VIEW_PERMISSION_MODE and is_read_only(
+            user=request.user, model=self.model
+        ):
+
+            return False
+
+        return super(ReadonlyInline, self).has_change_permission(
+            request=request, obj=obj
+        )
+
+    def get_formset(
+        self, request: HttpRequest, obj: Optional[Model] = None, **kwargs: Any
+    ) -> Type[BaseInlineFormSet]:
+        """
+        Overridden to use inline foreign key name resolved at startup by read only registry.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :param kwargs: additional arguments
+        :type kwargs: Any
+        :return: inline formset class
+        :rtype: Type[BaseInlineFormSet]
+        """  # noqa: E501
+        if not self.fk_name and "fk_name" not in kwargs:
+            label: str = self.model._meta.label_lower
+            names: Set[str] = {
+                fk_name
+                for model, fk_name in get_registry_entry(
+                    model=self.parent_model
+                ).inlines
+                if model == label and fk_name is not None
+            }
+            # ambiguous foreign keys are left to django to report
+            if len(names) == 1:
+                kwargs["fk_name"] = names.pop()
+
+        return super(ReadonlyInline, self).get_formset(
+            request=request, obj=obj, **kwargs
+        )
+
     def get_readonly_fields(self, request, obj=None) -> Union[List[str], Tuple[str]]:
         """
         Get readonly fields.
 
         Get from: https://github.com/anupamshakya7/django-admin-hack/.
 
+        Fields read only by field level permissions are added for other users.
+
         :param request: django HTTP request object
         :type request: HttpRequest
         :param obj: an object
@@ -365,28 +1384,74 @@ class ReadonlyInline(TabularInline):  # type: ignore
         :return: readonly fields
         :rtype: Union[List[str], Tuple[str]]
         """
-        for permission in request.user.get_all_permissions():
-            head, sep, tail = permission.partition(  # pylint: disable=W0612
-                "."
-            )  # type: str, str, str
-            if (
-                get_read_only_permission_codename(model=self.model.__name__.lower())
-                == tail  # noqa: W503
-            ) and (
-                request.user.has_perm(permission)
-                and not request.user.is_superuser  # noqa: W503
-            ):
-
-                return list(
-                    set(
-                        [field.name for field in self.opts.local_fields]
-                        + [  # noqa: W503
-                            field.name for field in self.opts.local_many_to_many
-                        ]
-                    )
-                )
+        if is_read_only(user=request.user, model=self.model):
+
+            return list(get_registry_entry(model=self.model).fields)
+
+        readonly_fields: Union[List[str], Tuple[str]] = super(  # type: ignore
+            ReadonlyInline, self
+        ).get_readonly_fields(request=request, obj=obj)
+        read_only_fields: Tuple[str, ...] = get_read_only_fields(
+            user=request.user, model=self.model
+        )
+        if read_only_fields:
+
+            return list(readonly_fields) + [
+                field for field in read_only_fields if field not in readonly_fields
+            ]
+
+        return readonly_fields
+
+    async def ahas_add_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Async version of has_add_permission.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user add permission
+        :rtype: bool
+        """
+        return await _arun(
+            request=request, method=self.has_add_permission, obj=obj  # type: ignore
+        )
+
+    async def ahas_delete_permission(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> bool:
+        """
+        Async version of has_delete_permission.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: has user delete permission
+        :rtype: bool
+        """
+        return await _arun(
+            request=request, method=self.has_delete_permission, obj=obj  # type: ignore
+        )
+
+    async def aget_readonly_fields(
+        self, request: HttpRequest, obj: Optional[Model] = None
+    ) -> Union[List[str], Tuple[str]]:
+        """
+        Async version of get_readonly_fields.
 
-        return self.readonly_fields  # type: ignore
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param obj: an object
+        :type obj: Model
+        :return: readonly fields
+        :rtype: Union[List[str], Tuple[str]]
+        """
+        return await _arun(
+            request=request, method=self.get_readonly_fields, obj=obj  # type: ignore
+        )
 
 
 class ReadonlyStackedInline(ReadonlyInline):
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/admission.py
+
+
+from threading import Lock, BoundedSemaphore
+from contextlib import suppress, contextmanager
+from typing import Any, Dict, List, Iterator, Optional
+
+from django.dispatch import receiver
+from django.core.signals import setting_changed
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import get_cache
+
+
+__all__: List[str] = ["AdmissionDenied", "admission", "reset_admission"]
+
+
+ADMISSION_CACHE_KEY: str = "read_only_admin:admission"
+# slots leaked by killed workers are freed when counter expires
+ADMISSION_CACHE_TIMEOUT: int = 3600
+
+_lock: Lock = Lock()
+_semaphore: Optional[BoundedSemaphore] = None
+
+
+class AdmissionDenied(Exception):  # noqa: N818
+    """Expensive operations concurrency limit reached."""
+
+    ...
+
+
+def _get_semaphore() -> Optional[BoundedSemaphore]:
+    """
+    Get per process expensive operations semaphore.
+
+    :return: semaphore
+    :rtype: Optional[BoundedSemaphore]
+    """
+    global _semaphore  # pylint: disable=W0603
+
+    if settings.READ_ONLY_ADMIN_ADMISSION_LIMIT is None:
+
+        return None
+
+    if _semaphore is None:
+        with _lock:
+            if _semaphore is None:
+                _semaphore = BoundedSemaphore(
+                    value=settings.READ_ONLY_ADMIN_ADMISSION_LIMIT
+                )
+
+    return _semaphore  # noqa: R504
+
+
+def _acquire_global() -> bool:
+    """
+    Take slot in cache backed counter shared between processes.
+
+    :return: is slot taken
+    :rtype: bool
+    """
+    cache = get_cache()
+    cache.add(ADMISSION_CACHE_KEY, 0, ADMISSION_CACHE_TIMEOUT)
+    try:
+        value: int = cache.incr(ADMISSION_CACHE_KEY)
+    except ValueError:
+        # counter expired right now
+        cache.add(ADMISSION_CACHE_KEY, 1, ADMISSION_CACHE_TIMEOUT)
+
+        return True
+
+    if value > settings.READ_ONLY_ADMIN_ADMISSION_GLOBAL_LIMIT:
+        _release_global()
+
+        return False
+
+    return True
+
+
+def _release_global() -> None:
+    """Free slot in cache backed counter shared between processes."""
+    # counter already expired
+    with suppress(ValueError):
+        get_cache().decr(ADMISSION_CACHE_KEY)
+
+
+@contextmanager
+def admission() -> Iterator[None]:  # noqa: CCR001
+    """
+    Run expensive operation if concurrency limits allow it, never waits for free slot.
+
+    :yield: nothing
+    :rtype: Iterator[None]
+    :raises AdmissionDenied: concurrency limit reached
+    """  # noqa: E501
+    semaphore: Optional[BoundedSemaphore] = _get_semaphore()
+    if semaphore is not None and not semaphore.acquire(blocking=False):
+
+        raise AdmissionDenied
+
+    try:
+        if settings.READ_ONLY_ADMIN_ADMISSION_GLOBAL_LIMIT is not None:
+            if not _acquire_global():
+
+                raise AdmissionDenied
+
+            try:
+                yield
+            finally:
+                _release_global()
+        else:
+            yield
+    finally:
+        if semaphore is not None:
+            semaphore.release()
+
+
+@receiver(setting_changed)
+def reset_admission(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Recreate per process semaphore when limit setting changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    global _semaphore  # pylint: disable=W0603
+
+    if setting == "READ_ONLY_ADMIN_ADMISSION_LIMIT":
+        _semaphore = None
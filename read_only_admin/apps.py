@@ -18,3 +18,26 @@ class DjangoReadOnlyAdminConfig(AppConfig):
 
     name: str = "read_only_admin"
     verbose_name: str = _("Django read only admin")
+
+    def ready(self) -> None:
+        """Register checks, connect signals, build read only and search registries and read only fields index and warm up templates."""  # noqa: E501
+        # lazy imports to keep application loading cheap
+        from django.core import checks
+        from django.db.models import signals
+
+        from read_only_admin.conf import settings
+        from read_only_admin.checks import check_cache
+        from read_only_admin.utils import warm_up_templates
+        from read_only_admin.search import build_search_registry
+        from read_only_admin.registry import build_registry, build_field_index
+        from read_only_admin.signals import connect_signals, add_readonly_permissions
+
+        checks.register(check_cache)
+        signals.post_migrate.connect(add_readonly_permissions)
+        build_registry()
+        build_field_index()
+        build_search_registry()
+        # data change receivers are connected to enabled features models only
+        connect_signals()
+        if settings.READ_ONLY_ADMIN_WARM_UP_TEMPLATES:
+            warm_up_templates()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/backends.py
+
+
+from typing import Any, List, Tuple, Optional, FrozenSet
+
+from django.http import HttpRequest
+from django.core.exceptions import PermissionDenied, FieldDoesNotExist
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import make_key, get_cache, get_permissions_generation
+
+
+__all__: List[str] = ["ReadOnlyPermissionBackend", "make_permissions_key"]
+
+
+PERMISSIONS_CACHE_ATTRIBUTE: str = "_read_only_admin_permissions_cache"
+
+
+def make_permissions_key(user_obj: Any, generation: str) -> str:
+    """
+    Make user read only permissions index cache key.
+
+    :param user_obj: user object
+    :type user_obj: Any
+    :param generation: users permissions generation token
+    :type generation: str
+    :return: cache key
+    :rtype: str
+    """
+    return make_key("permissions", user_obj._meta.label_lower, user_obj.pk, generation)
+
+
+class ReadOnlyPermissionBackend:
+    """
+    Answer read only permissions checks from cached per-user index and leave all other permissions to next backends.
+
+    Must be placed first in AUTHENTICATION_BACKENDS, so slow backends (LDAP, etc.) are never asked about read only permissions.
+    """  # noqa: E501
+
+    def authenticate(  # pylint: disable=R0201
+        self, request: Optional[HttpRequest], **credentials: Any
+    ) -> None:
+        """
+        Never authenticate users, this backend only checks permissions.
+
+        :param request: django HTTP request object
+        :type request: Optional[HttpRequest]
+        :param credentials: user credentials
+        :type credentials: Any
+        """
+
+    def get_user(self, user_id: Any) -> None:  # pylint: disable=R0201
+        """
+        Never load users, this backend only checks permissions.
+
+        :param user_id: user primary key
+        :type user_id: Any
+        """
+
+    def get_read_only_permissions(  # pylint: disable=R0201  # noqa: CCR001
+        self, user_obj: Any
+    ) -> Optional[FrozenSet[Tuple[str, str]]]:
+        """
+        Get user read only permissions index, cached on user object and in read only admin cache.
+
+        Cached index is valid until any users, groups or permissions assignment change.
+
+        :param user_obj: user object
+        :type user_obj: Any
+        :return: read only permissions application labels and code names, nothing if user model has no permissions
+        :rtype: Optional[FrozenSet[Tuple[str, str]]]
+        """  # noqa: E501
+        # lazy import to prevent circular imports
+        from read_only_admin.resolver import _get_permissions_from_db
+
+        if not user_obj.is_active or user_obj.is_anonymous:
+
+            return frozenset()
+
+        if hasattr(user_obj, PERMISSIONS_CACHE_ATTRIBUTE):
+
+            return getattr(user_obj, PERMISSIONS_CACHE_ATTRIBUTE)
+
+        key: str = make_permissions_key(
+            user_obj=user_obj, generation=get_permissions_generation()
+        )
+        permissions: Optional[FrozenSet[Tuple[str, str]]] = get_cache().get(key)
+        if permissions is None:
+            try:
+                permissions = frozenset(_get_permissions_from_db(user=user_obj))
+            except FieldDoesNotExist:
+                # custom user model without permissions mixin
+                permissions = None
+            else:
+                get_cache().set(
+                    key, permissions, settings.READ_ONLY_ADMIN_BACKEND_CACHE_TIMEOUT
+                )
+        setattr(user_obj, PERMISSIONS_CACHE_ATTRIBUTE, permissions)
+
+        return permissions
+
+    def get_all_permissions(self, user_obj: Any, obj: Any = None) -> FrozenSet[str]:
+        """
+        Get user read only permissions names.
+
+        :param user_obj: user object
+        :type user_obj: Any
+        :param obj: object for object level permissions
+        :type obj: Any
+        :return: read only permissions names
+        :rtype: FrozenSet[str]
+        """
+        permissions: Optional[
+            FrozenSet[Tuple[str, str]]
+        ] = self.get_read_only_permissions(user_obj=user_obj)
+        if obj is not None or not permissions:
+
+            return frozenset()
+
+        return frozenset(
+            f"{app_label}.{codename}" for app_label, codename in permissions
+        )
+
+    def has_perm(self, user_obj: Any, perm: str, obj: Any = None) -> Optional[bool]:
+        """
+        Check read only permission, other permissions are left to next backends.
+
+        Missing read only permission stops backends chain.
+
+        :param user_obj: user object
+        :type user_obj: Any
+        :param perm: permission name
+        :type perm: str
+        :param obj: object for object level permissions
+        :type obj: Any
+        :return: has user read only permission, nothing for other permissions
+        :rtype: Optional[bool]
+        :raises PermissionDenied: user has no read only permission
+        """
+        app_label, sep, codename = perm.partition(  # pylint: disable=W0612
+            "."
+        )  # type: str, str, str
+        if obj is not None or not codename.startswith(  # noqa: ECE001
+            f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_"
+        ):
+
+            return None
+
+        permissions: Optional[
+            FrozenSet[Tuple[str, str]]
+        ] = self.get_read_only_permissions(user_obj=user_obj)
+        if permissions is None:
+
+            return None
+
+        if (app_label, codename) in permissions:
+
+            return True
+
+        raise PermissionDenied
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/cache.py
+
+
+from uuid import uuid4
+from hashlib import sha256
+from typing import Any, Dict, List, Type
+
+from django.db.models import Model
+from django.core.cache import BaseCache, caches
+from django.utils.module_loading import import_string
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = [
+    "get_cache",
+    "make_key",
+    "get_model_version",
+    "bump_model_version",
+    "get_permissions_generation",
+    "get_permissions_models",
+    "is_permissions_generation_used",
+    "bump_permissions_generation",
+]
+
+
+PERMISSIONS_GENERATION_KEY: str = "read_only_admin:permissions_generation"
+
+
+def get_cache() -> BaseCache:
+    """
+    Get read only admin cache.
+
+    :return: cache
+    :rtype: BaseCache
+    """
+    return caches[settings.READ_ONLY_ADMIN_CACHE]
+
+
+def make_key(prefix: str, *parts: Any) -> str:
+    """
+    Make cache key safe for any cache backend from arbitrary parts.
+
+    :param prefix: key prefix
+    :type prefix: str
+    :param parts: key parts
+    :type parts: Any
+    :return: cache key
+    :rtype: str
+    """
+    digest: str = sha256(  # noqa: ECE001
+        "\x00".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+
+    return f"read_only_admin:{prefix}:{digest}"
+
+
+def get_model_version(model: Type[Model]) -> str:
+    """
+    Get model data version token, changed on each model data change.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: version token
+    :rtype: str
+    """
+    cache: BaseCache = get_cache()
+    key: str = f"read_only_admin:version:{model._meta.label_lower}"
+    # random token can't collide with previous ones after eviction
+    cache.add(key, uuid4().hex, None)
+
+    return cache.get(key, "")
+
+
+def bump_model_version(sender: Type[Model], **kwargs: Dict[str, Any]) -> None:
+    """
+    Change models data version tokens on data change signals.
+
+    :param sender: signal sender model class
+    :type sender: Type[Model]
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT is None or str(
+        kwargs.get("action", "")
+    ).startswith("pre_"):
+
+        return
+
+    models: List[Type[Model]] = [sender]
+    # many to many changes touch both sides
+    if kwargs.get("instance") is not None:
+        models.append(kwargs["instance"].__class__)  # type: ignore
+    if kwargs.get("model") is not None:
+        models.append(kwargs["model"])  # type: ignore
+
+    get_cache().set_many(  # noqa: ECE001
+        {
+            f"read_only_admin:version:{model._meta.label_lower}": uuid4().hex
+            for model in models
+        },
+        None,
+    )
+
+
+def get_permissions_generation() -> str:
+    """
+    Get users permissions generation token, changed on each permissions assignment change.
+
+    :return: generation token
+    :rtype: str
+    """  # noqa: E501
+    cache: BaseCache = get_cache()
+    cache.add(PERMISSIONS_GENERATION_KEY, uuid4().hex, None)
+
+    return cache.get(PERMISSIONS_GENERATION_KEY, "")
+
+
+def get_permissions_models() -> List[Type[Model]]:
+    """
+    Get models which data changes change users permissions.
+
+    :return: groups, permissions and their assignments models
+    :rtype: List[Type[Model]]
+    """
+    # lazy imports to prevent apps loading problems
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import Group, Permission
+
+    user_model = get_user_model()
+    models: List[Type[Model]] = [Group, Permission, Group.permissions.through]
+
+    return models + [
+        getattr(user_model, name).through
+        for name in ["groups", "user_permissions"]
+        if hasattr(user_model, name)
+    ]
+
+
+def is_permissions_generation_used() -> bool:
+    """
+    Check is users permissions generation used: by permissions backend cache, shared index or session snapshot.
+
+    :return: is generation used
+    :rtype: bool
+    """  # noqa: E501
+    # lazy imports to prevent circular imports
+    from read_only_admin.backends import ReadOnlyPermissionBackend
+
+    if settings.READ_ONLY_ADMIN_SESSION_SNAPSHOT or (
+        settings.READ_ONLY_ADMIN_SHARED_INDEX is not None
+    ):
+
+        return True
+
+    return settings.READ_ONLY_ADMIN_BACKEND_CACHE_TIMEOUT is not None and any(
+        issubclass(import_string(path), ReadOnlyPermissionBackend)
+        for path in settings.AUTHENTICATION_BACKENDS
+    )
+
+
+def bump_permissions_generation(sender: Type[Model], **kwargs: Dict[str, Any]) -> None:
+    """
+    Change users permissions generation token on permissions and groups changes signals.
+
+    :param sender: signal sender model class
+    :type sender: Type[Model]
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """  # noqa: E501
+    if str(kwargs.get("action", "")).startswith("pre_"):
+
+        return
+
+    if sender in get_permissions_models():
+        get_cache().set(PERMISSIONS_GENERATION_KEY, uuid4().hex, None)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/checks.py
+
+
+from typing import Any, Dict, List, Tuple, Optional
+
+from django.core import checks
+from django.core.cache import BaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import get_cache, is_permissions_generation_used
+
+
+__all__: List[str] = ["check_cache"]
+
+
+# these backends are not shared between processes
+NOT_SHARED_CACHES: Tuple[type, ...] = (LocMemCache, DummyCache)
+
+
+def check_cache(
+    app_configs: Optional[List[Any]] = None, **kwargs: Dict[str, Any]
+) -> List[checks.CheckMessage]:
+    """
+    Check read only admin cache is shared between processes if users permissions generation is used.
+
+    :param app_configs: checked applications configs
+    :type app_configs: Optional[List[Any]]
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    :return: check messages
+    :rtype: List[checks.CheckMessage]
+    """  # noqa: E501
+    if not is_permissions_generation_used():
+
+        return []
+
+    cache: BaseCache = get_cache()
+    if not isinstance(cache, NOT_SHARED_CACHES):
+
+        return []
+
+    return [  # noqa: ECE001
+        checks.Warning(
+            f"READ_ONLY_ADMIN_CACHE {settings.READ_ONLY_ADMIN_CACHE!r} uses {cache.__class__.__name__}, which is not shared between processes.",  # noqa: E501
+            hint="Permissions changes made in one process won't invalidate permissions backend cache, shared index or session snapshots of other processes. Use shared cache backend (like memcached, redis or database) or disable these features.",  # noqa: E501
+            obj=settings.READ_ONLY_ADMIN_CACHE,
+            id="read_only_admin.W001",
+        )
+    ]
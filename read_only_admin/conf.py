@@ -4,7 +4,7 @@
 # read_only_admin/conf.py
 
 
-from typing import List
+from typing import Dict, List, Optional
 
 from appconf import AppConf
 from django.conf import settings
@@ -23,6 +23,76 @@ class DjangoReadOnlyAdminAppConf(AppConf):
         settings, "READ_ONLY_ADMIN_PERMISSION_NAME_PREFIX", "Read only"
     )
     EMPTY_ACTIONS: bool = getattr(settings, "READ_ONLY_ADMIN_EMPTY_ACTIONS", True)
+    VIEW_PERMISSION_MODE: bool = getattr(
+        settings, "READ_ONLY_ADMIN_VIEW_PERMISSION_MODE", False
+    )
+    FIELD_PERMISSIONS: Dict[str, List[str]] = getattr(
+        settings, "READ_ONLY_ADMIN_FIELD_PERMISSIONS", {}
+    )
+    REPLICA_DATABASE: Optional[str] = getattr(
+        settings, "READ_ONLY_ADMIN_REPLICA_DATABASE", None
+    )
+    READ_ONLY_TRANSACTION: bool = getattr(
+        settings, "READ_ONLY_ADMIN_READ_ONLY_TRANSACTION", False
+    )
+    QUERY_BUDGET: Optional[float] = getattr(
+        settings, "READ_ONLY_ADMIN_QUERY_BUDGET", None
+    )
+    ADMISSION_LIMIT: Optional[int] = getattr(
+        settings, "READ_ONLY_ADMIN_ADMISSION_LIMIT", None
+    )
+    ADMISSION_GLOBAL_LIMIT: Optional[int] = getattr(
+        settings, "READ_ONLY_ADMIN_ADMISSION_GLOBAL_LIMIT", None
+    )
+    ADMISSION_RETRY_AFTER: int = getattr(
+        settings, "READ_ONLY_ADMIN_ADMISSION_RETRY_AFTER", 5
+    )
+    ADMISSION_LARGE_MODELS: List[str] = getattr(
+        settings, "READ_ONLY_ADMIN_ADMISSION_LARGE_MODELS", []
+    )
+    SESSION_SNAPSHOT: bool = getattr(
+        settings, "READ_ONLY_ADMIN_SESSION_SNAPSHOT", False
+    )
+    CACHE: str = getattr(settings, "READ_ONLY_ADMIN_CACHE", "default")
+    SHARED_INDEX: Optional[str] = getattr(
+        settings, "READ_ONLY_ADMIN_SHARED_INDEX", None
+    )
+    SHARED_INDEX_CHECK_INTERVAL: float = getattr(
+        settings, "READ_ONLY_ADMIN_SHARED_INDEX_CHECK_INTERVAL", 5
+    )
+    BACKEND_CACHE_TIMEOUT: Optional[int] = getattr(
+        settings, "READ_ONLY_ADMIN_BACKEND_CACHE_TIMEOUT", 3600
+    )
+    FILTERS_CACHE_TIMEOUT: Optional[int] = getattr(
+        settings, "READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT", None
+    )
+    ROW_CACHE_TIMEOUT: Optional[int] = getattr(
+        settings, "READ_ONLY_ADMIN_ROW_CACHE_TIMEOUT", 3600
+    )
+    INDEXED_SORTING: bool = getattr(settings, "READ_ONLY_ADMIN_INDEXED_SORTING", False)
+    INDEXED_SORTING_INTROSPECTION: bool = getattr(
+        settings, "READ_ONLY_ADMIN_INDEXED_SORTING_INTROSPECTION", False
+    )
+    STREAMING: bool = getattr(settings, "READ_ONLY_ADMIN_STREAMING", False)
+    STREAMING_CHUNK_SIZE: int = getattr(
+        settings, "READ_ONLY_ADMIN_STREAMING_CHUNK_SIZE", 1000
+    )
+    SEARCH_BACKEND: Optional[str] = getattr(
+        settings, "READ_ONLY_ADMIN_SEARCH_BACKEND", None
+    )
+    SEARCH_DATABASE: str = getattr(
+        settings, "READ_ONLY_ADMIN_SEARCH_DATABASE", "default"
+    )
+    DEGRADED_MODE: bool = getattr(settings, "READ_ONLY_ADMIN_DEGRADED_MODE", False)
+    DEGRADED_MODE_FILE: Optional[str] = getattr(
+        settings, "READ_ONLY_ADMIN_DEGRADED_MODE_FILE", None
+    )
+    DEGRADED_MODE_CACHE_KEY: Optional[str] = getattr(
+        settings, "READ_ONLY_ADMIN_DEGRADED_MODE_CACHE_KEY", None
+    )
+    WARM_UP_TEMPLATES: bool = getattr(
+        settings, "READ_ONLY_ADMIN_WARM_UP_TEMPLATES", False
+    )
 
     class Meta:
         """Config settings."""
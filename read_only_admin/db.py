@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/db.py
+
+
+from time import monotonic
+from functools import partial
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, List, Tuple, Callable, Iterator, Optional
+
+from django.db.utils import DatabaseError
+from django.db import connections, transaction
+
+
+__all__: List[str] = ["QueryBudgetExceeded", "read_only_transaction", "query_budget"]
+
+
+# PostgreSQL query_canceled SQLSTATE and MySQL ER_QUERY_TIMEOUT error code
+POSTGRESQL_QUERY_CANCELED: str = "57014"
+MYSQL_QUERY_TIMEOUT: int = 3024
+# SQLite virtual machine instructions between deadline checks
+SQLITE_PROGRESS_HANDLER_INSTRUCTIONS: int = 1000
+
+
+class QueryBudgetExceeded(DatabaseError):
+    """Request queries time budget exceeded."""
+
+    ...
+
+
+@contextmanager
+def read_only_transaction(using: str) -> Iterator[None]:
+    """
+    Database enforced read only context where backend supports it.
+
+    SQLite connection is switched to query only mode, PostgreSQL and MySQL
+    run a READ ONLY transaction unless already inside one, other backends
+    run as is.
+
+    :param using: database alias
+    :type using: str
+    :yield: nothing
+    :rtype: Iterator[None]
+    """
+    connection = connections[using]
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA query_only = ON")
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA query_only = OFF")
+    elif (
+        connection.vendor in ["postgresql", "mysql"]
+        and not connection.in_atomic_block  # noqa: W503
+    ):
+        with transaction.atomic(using=using):
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION READ ONLY")
+            yield
+    else:
+        yield
+
+
+def _is_timeout_error(vendor: str, error: DatabaseError) -> bool:  # noqa: CFQ004
+    """
+    Check is database error caused by query timeout.
+
+    :param vendor: database vendor
+    :type vendor: str
+    :param error: database error
+    :type error: DatabaseError
+    :return: is error caused by query timeout
+    :rtype: bool
+    """
+    if vendor == "postgresql":
+
+        return getattr(error.__cause__, "pgcode", None) == POSTGRESQL_QUERY_CANCELED
+
+    if vendor == "mysql":
+
+        return bool(error.args) and error.args[0] == MYSQL_QUERY_TIMEOUT
+
+    if vendor == "sqlite":
+
+        return "interrupted" in str(error)
+
+    return False
+
+
+@contextmanager
+def _statement_timeout(using: str, deadline: float) -> Iterator[None]:  # noqa: CCR001
+    """
+    Database enforced statement timeout context where backend supports it.
+
+    :param using: database alias
+    :type using: str
+    :param deadline: monotonic clock deadline
+    :type deadline: float
+    :yield: nothing
+    :rtype: Iterator[None]
+    """
+    connection = connections[using]
+    timeout: int = max(int((deadline - monotonic()) * 1000), 1)
+
+    if connection.vendor == "sqlite":
+        connection.ensure_connection()
+        connection.connection.set_progress_handler(
+            lambda: int(monotonic() > deadline), SQLITE_PROGRESS_HANDLER_INSTRUCTIONS
+        )
+        try:
+            yield
+        finally:
+            if connection.connection is not None:
+                connection.connection.set_progress_handler(
+                    None, SQLITE_PROGRESS_HANDLER_INSTRUCTIONS
+                )
+    elif connection.vendor == "postgresql" and connection.in_atomic_block:
+        # reverted with transaction, which can be aborted by timeout
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL statement_timeout = {timeout}")
+        yield
+    elif connection.vendor in ["postgresql", "mysql"]:
+        variable: str = (
+            "statement_timeout"
+            if connection.vendor == "postgresql"
+            else "max_execution_time"  # noqa: W503
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET SESSION {variable} = {timeout}")
+        try:
+            yield
+        finally:
+            if connection.connection is not None:
+                with connection.cursor() as cursor:
+                    cursor.execute(f"SET SESSION {variable} = DEFAULT")
+    else:
+        yield
+
+
+@contextmanager
+def query_budget(using: List[str], timeout: float) -> Iterator[None]:  # noqa: CCR001
+    """
+    Limit queries time inside context.
+
+    No query is started after budget runs out and running ones are cut off by
+    database: PostgreSQL statement_timeout, MySQL max_execution_time and SQLite
+    progress handler.
+
+    :param using: databases aliases
+    :type using: List[str]
+    :param timeout: budget in seconds
+    :type timeout: float
+    :yield: nothing
+    :rtype: Iterator[None]
+    :raises QueryBudgetExceeded: budget exceeded
+    """
+    deadline: float = monotonic() + timeout
+
+    def wrapper(
+        vendor: str,
+        execute: Callable,  # type: ignore
+        sql: str,
+        params: Optional[Tuple[Any, ...]],
+        many: bool,
+        context: Dict[str, Any],
+    ) -> Any:
+        if monotonic() > deadline:
+
+            raise QueryBudgetExceeded(f"Query time budget of {timeout}s exceeded.")
+
+        try:
+
+            return execute(sql, params, many, context)
+        except DatabaseError as error:
+            if _is_timeout_error(vendor=vendor, error=error):
+
+                raise QueryBudgetExceeded(
+                    f"Query time budget of {timeout}s exceeded."
+                ) from error
+
+            raise
+
+    with ExitStack() as stack:
+        for alias in dict.fromkeys(using):
+            stack.enter_context(_statement_timeout(using=alias, deadline=deadline))
+            stack.enter_context(
+                connections[alias].execute_wrapper(  # type: ignore
+                    partial(wrapper, connections[alias].vendor)
+                )
+            )
+        yield
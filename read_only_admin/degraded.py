@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/degraded.py
+
+
+import os
+from typing import List
+
+from django.core.cache import caches
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = ["is_degraded_mode"]
+
+
+def is_degraded_mode() -> bool:  # noqa: CFQ004
+    """
+    Check is site-wide read only degraded mode enabled.
+
+    Mode can be enabled by setting, file flag or cache key, checked in this order.
+
+    :return: is degraded mode enabled
+    :rtype: bool
+    """  # noqa: E501
+    if settings.READ_ONLY_ADMIN_DEGRADED_MODE:
+
+        return True
+
+    if settings.READ_ONLY_ADMIN_DEGRADED_MODE_FILE and os.path.exists(
+        settings.READ_ONLY_ADMIN_DEGRADED_MODE_FILE
+    ):
+
+        return True
+
+    if settings.READ_ONLY_ADMIN_DEGRADED_MODE_CACHE_KEY:
+
+        return bool(
+            caches[settings.READ_ONLY_ADMIN_CACHE].get(
+                settings.READ_ONLY_ADMIN_DEGRADED_MODE_CACHE_KEY
+            )
+        )
+
+    return False
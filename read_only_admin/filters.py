@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/filters.py
+
+
+from typing import Any, Dict, List, Type, Tuple, Callable
+
+from django.http import HttpRequest
+from django.db.models import Field, Model
+from django.contrib.admin import ModelAdmin
+from django.utils.translation import get_language
+from django.contrib.admin.options import BaseModelAdmin
+from django.contrib.admin.filters import (
+    FieldListFilter,
+    RelatedFieldListFilter,
+    AllValuesFieldListFilter,
+    RelatedOnlyFieldListFilter,
+)
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import make_key, get_cache, get_model_version
+
+
+__all__: List[str] = [
+    "get_cache_scope",
+    "CachedRelatedFieldListFilter",
+    "CachedRelatedOnlyFieldListFilter",
+    "CachedAllValuesFieldListFilter",
+    "CachedFieldListFilter",
+]
+
+
+def get_cache_scope(model_admin: ModelAdmin, request: HttpRequest) -> Any:  # type: ignore  # noqa: E501
+    """
+    Get scope of values cached for admin change list: admins with overridden queryset may show different rows to each user.
+
+    :param model_admin: django related admin
+    :type model_admin: ModelAdmin
+    :param request: django HTTP request object
+    :type request: HttpRequest
+    :return: user primary key, nothing for admins with default queryset
+    :rtype: Any
+    """  # noqa: E501
+    # lazy import to prevent circular imports
+    from read_only_admin.admin import ReadonlyAdmin
+
+    # generated read only admins put ReadonlyAdmin before wrapped admin class,
+    # so queryset can be overridden anywhere in MRO
+    scoped: bool = any(  # noqa: ECE001
+        "get_queryset" in vars(klass)
+        for klass in type(model_admin).__mro__
+        if klass not in {ReadonlyAdmin, ModelAdmin, BaseModelAdmin}
+    )
+
+    return request.user.pk if scoped else None
+
+
+def _get_or_set(  # noqa: CFQ002
+    filter_class: Type[FieldListFilter],
+    model_admin: ModelAdmin,  # type: ignore
+    request: HttpRequest,
+    field_path: str,
+    models: List[Type[Model]],
+    default: Callable,  # type: ignore
+) -> Any:
+    """
+    Get filter choices from cache or compute and cache it.
+
+    :param filter_class: filter class
+    :type filter_class: Type[FieldListFilter]
+    :param model_admin: django related admin
+    :type model_admin: ModelAdmin
+    :param request: django HTTP request object
+    :type request: HttpRequest
+    :param field_path: filter field path
+    :type field_path: str
+    :param models: models which data choices depends on
+    :type models: List[Type[Model]]
+    :param default: choices computing function
+    :type default: Callable
+    :return: choices
+    :rtype: Any
+    """
+    key: str = make_key(
+        "filter",
+        model_admin.model._meta.label_lower,
+        filter_class.__name__,
+        field_path,
+        get_language(),
+        get_cache_scope(model_admin=model_admin, request=request),
+        *[get_model_version(model=model) for model in models],
+    )
+
+    return get_cache().get_or_set(
+        key, default, settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT
+    )
+
+
+class CachedRelatedFieldListFilter(RelatedFieldListFilter):
+    """Related field list filter with cached choices."""
+
+    def field_choices(
+        self, field: Field, request: HttpRequest, model_admin: ModelAdmin  # type: ignore  # noqa: E501
+    ) -> List[Tuple[Any, str]]:
+        """
+        Overridden to cache choices.
+
+        :param field: filter field
+        :type field: Field
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param model_admin: django related admin
+        :type model_admin: ModelAdmin
+        :return: choices
+        :rtype: List[Tuple[Any, str]]
+        """
+        return _get_or_set(
+            filter_class=self.__class__,
+            model_admin=model_admin,
+            request=request,
+            field_path=self.field_path,
+            models=[field.related_model],  # type: ignore
+            default=lambda: super(CachedRelatedFieldListFilter, self).field_choices(
+                field, request, model_admin  # type: ignore
+            ),
+        )
+
+
+class CachedRelatedOnlyFieldListFilter(RelatedOnlyFieldListFilter):
+    """Related only field list filter with cached choices."""
+
+    def field_choices(
+        self, field: Field, request: HttpRequest, model_admin: ModelAdmin  # type: ignore  # noqa: E501
+    ) -> List[Tuple[Any, str]]:
+        """
+        Overridden to cache choices.
+
+        :param field: filter field
+        :type field: Field
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param model_admin: django related admin
+        :type model_admin: ModelAdmin
+        :return: choices
+        :rtype: List[Tuple[Any, str]]
+        """
+        return _get_or_set(
+            filter_class=self.__class__,
+            model_admin=model_admin,
+            request=request,
+            field_path=self.field_path,
+            models=[model_admin.model, field.related_model],  # type: ignore
+            default=lambda: super(CachedRelatedOnlyFieldListFilter, self).field_choices(
+                field, request, model_admin  # type: ignore
+            ),
+        )
+
+
+class CachedAllValuesFieldListFilter(AllValuesFieldListFilter):
+    """All values field list filter with cached choices."""
+
+    def __init__(  # noqa: CFQ002
+        self,
+        field: Field,  # type: ignore
+        request: HttpRequest,
+        params: Dict[str, str],
+        model: Type[Model],
+        model_admin: ModelAdmin,  # type: ignore
+        field_path: str,
+    ) -> None:
+        """
+        Overridden to cache choices.
+
+        :param field: filter field
+        :type field: Field
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param params: lookup params
+        :type params: Dict[str, str]
+        :param model: django related model
+        :type model: Type[Model]
+        :param model_admin: django related admin
+        :type model_admin: ModelAdmin
+        :param field_path: filter field path
+        :type field_path: str
+        """
+        super(CachedAllValuesFieldListFilter, self).__init__(
+            field, request, params, model, model_admin, field_path  # type: ignore
+        )
+        lookup_choices = self.lookup_choices
+        self.lookup_choices = _get_or_set(
+            filter_class=self.__class__,
+            model_admin=model_admin,
+            request=request,
+            field_path=field_path,
+            models=[model, field.model],
+            default=lambda: list(lookup_choices),
+        )
+
+
+CACHED_FILTERS: Dict[Type[FieldListFilter], Type[FieldListFilter]] = {
+    RelatedFieldListFilter: CachedRelatedFieldListFilter,
+    RelatedOnlyFieldListFilter: CachedRelatedOnlyFieldListFilter,
+    AllValuesFieldListFilter: CachedAllValuesFieldListFilter,
+}
+
+
+class CachedFieldListFilter(FieldListFilter):
+    """Choose django default filter for field and replace it with cached version where available."""  # noqa: E501
+
+    def __new__(  # type: ignore  # noqa: CFQ002
+        cls,
+        field: Field,  # type: ignore
+        request: HttpRequest,
+        params: Dict[str, str],
+        model: Type[Model],
+        model_admin: ModelAdmin,  # type: ignore
+        field_path: str,
+    ) -> FieldListFilter:
+        """
+        Create filter instance same way as FieldListFilter.create does.
+
+        :param field: filter field
+        :type field: Field
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param params: lookup params
+        :type params: Dict[str, str]
+        :param model: django related model
+        :type model: Type[Model]
+        :param model_admin: django related admin
+        :type model_admin: ModelAdmin
+        :param field_path: filter field path
+        :type field_path: str
+        :return: filter instance
+        :rtype: FieldListFilter
+        """
+        filters: List[Any] = FieldListFilter._field_list_filters  # type: ignore
+        # last registered filter accepts any field
+        for test, list_filter_class in filters:  # noqa: R503
+            if test(field):
+                list_filter_class = CACHED_FILTERS.get(
+                    list_filter_class, list_filter_class
+                )
+
+                return list_filter_class(
+                    field, request, params, model, model_admin, field_path=field_path
+                )
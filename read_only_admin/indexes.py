@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/indexes.py
+
+
+from functools import lru_cache
+from typing import Any, Set, Dict, List, Type, Union, Callable, FrozenSet
+
+from django.dispatch import receiver
+from django.db import router, connections
+from django.contrib.admin import ModelAdmin
+from django.core.signals import setting_changed
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, UniqueConstraint
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = [
+    "get_indexed_fields",
+    "get_ordering_field",
+    "is_indexed_ordering",
+    "clear_indexed_fields",
+]
+
+
+def _get_meta_indexed_fields(model: Type[Model]) -> Set[str]:  # noqa: CCR001
+    """
+    Get names of fields leading model indexes declared in model meta.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: fields names
+    :rtype: Set[str]
+    """
+    opts = model._meta
+    fields: Set[str] = {"pk"}
+
+    for field in opts.concrete_fields:
+        # ordering by relation uses related model ordering if it has one
+        if (field.primary_key or field.unique or field.db_index) and (  # noqa: ECE001
+            not field.is_relation or not field.related_model._meta.ordering
+        ):
+            fields.add(field.name)
+    for index in opts.indexes:
+        # only leading column of composite index can be used for sorting
+        if index.fields:
+            fields.add(index.fields[0].lstrip("-"))
+    for constraint in opts.constraints:
+        if (
+            isinstance(constraint, UniqueConstraint)
+            and constraint.fields  # noqa: W503
+            and constraint.condition is None  # noqa: W503
+        ):
+            fields.add(constraint.fields[0])
+    for together in [opts.unique_together, getattr(opts, "index_together", ())]:
+        for names in together:
+            fields.add(names[0])
+
+    return fields
+
+
+def _get_introspected_indexed_fields(model: Type[Model]) -> Set[str]:
+    """
+    Get names of fields leading model table indexes existing in database.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: fields names
+    :rtype: Set[str]
+    """
+    connection = connections[router.db_for_read(model)]
+    with connection.cursor() as cursor:
+        constraints: Dict[str, Dict[str, Any]] = connection.introspection.get_constraints(  # type: ignore  # noqa: E501
+            cursor, model._meta.db_table
+        )
+    columns: Set[str] = {
+        constraint["columns"][0]
+        for constraint in constraints.values()
+        if constraint["columns"]
+        and (  # noqa: W503
+            constraint["index"] or constraint["unique"] or constraint["primary_key"]
+        )
+    }
+
+    return {
+        field.name for field in model._meta.concrete_fields if field.column in columns
+    }
+
+
+@lru_cache(maxsize=None)
+def get_indexed_fields(model: Type[Model]) -> FrozenSet[str]:
+    """
+    Get names of model fields which can be used for sorting without full table scan.
+
+    Result is cached for process lifetime, so database introspection is done once per model.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: fields names
+    :rtype: FrozenSet[str]
+    """  # noqa: E501
+    fields: Set[str] = _get_meta_indexed_fields(model=model)
+    if settings.READ_ONLY_ADMIN_INDEXED_SORTING_INTROSPECTION:
+        fields.update(_get_introspected_indexed_fields(model=model))
+
+    return frozenset(fields)
+
+
+def get_ordering_field(  # noqa: CCR001
+    model: Type[Model],
+    model_admin: ModelAdmin,  # type: ignore
+    field_name: Union[Callable, str],  # type: ignore
+) -> Any:
+    """
+    Get model field name or expression used for ordering by change list column, like django change list does.
+
+    :param model: model class
+    :type model: Type[Model]
+    :param model_admin: model admin
+    :type model_admin: ModelAdmin
+    :param field_name: change list column
+    :type field_name: Union[Callable, str]
+    :return: ordering field name or expression
+    :rtype: Any
+    """  # noqa: E501
+    try:
+
+        return model._meta.get_field(field_name).name
+    except FieldDoesNotExist:
+        attr: Any
+        if callable(field_name):
+            attr = field_name
+        elif hasattr(model_admin, field_name):
+            attr = getattr(model_admin, field_name)
+        else:
+            attr = getattr(model, field_name, None)
+        if isinstance(attr, property) and hasattr(attr, "fget"):
+            attr = attr.fget
+
+        return getattr(attr, "admin_order_field", None)
+
+
+def is_indexed_ordering(model: Type[Model], ordering_field: Any) -> bool:
+    """
+    Check is ordering by field backed by database index.
+
+    :param model: model class
+    :type model: Type[Model]
+    :param ordering_field: ordering field name or expression
+    :type ordering_field: Any
+    :return: is ordering backed by database index
+    :rtype: bool
+    """
+    return isinstance(ordering_field, str) and ordering_field.lstrip(
+        "-"
+    ) in get_indexed_fields(model=model)
+
+
+@receiver(setting_changed)
+def clear_indexed_fields(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Clear memoized indexed fields when introspection setting changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if setting == "READ_ONLY_ADMIN_INDEXED_SORTING_INTROSPECTION":
+        get_indexed_fields.cache_clear()
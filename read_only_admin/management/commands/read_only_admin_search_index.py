@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/management/commands/read_only_admin_search_index.py
+
+
+from typing import Any, Dict, List, Type, Tuple, Optional
+
+from django.apps import apps
+from django.db.models import Model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from read_only_admin.search import (
+    BaseSearchBackend,
+    get_search_backend,
+    build_search_registry,
+)
+
+
+__all__: List[str] = ["Command"]
+
+
+class Command(BaseCommand):
+    """Build read only change lists search index."""
+
+    help: str = "Build read only change lists search index from scratch, later changes are indexed on save and delete."  # noqa: A003,E501
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Add command arguments.
+
+        :param parser: command arguments parser
+        :type parser: CommandParser
+        """
+        parser.add_argument(
+            "models",
+            nargs="*",
+            metavar="app_label.ModelName",
+            help="Index only given models.",
+        )
+
+    def handle(  # noqa: CCR001
+        self, *args: List[Any], **options: Dict[str, Any]
+    ) -> None:
+        """
+        Build search index.
+
+        :param args: additional args
+        :type args: List[Any]
+        :param options: command options
+        :type options: Dict[str, Any]
+        :raises CommandError: search backend is not configured or model is not indexed
+        """  # noqa: E501
+        backend: Optional[BaseSearchBackend] = get_search_backend()
+        if backend is None:
+
+            raise CommandError("READ_ONLY_ADMIN_SEARCH_BACKEND is not configured.")
+
+        registry = build_search_registry()
+        labels: List[str] = [label.lower() for label in options["models"]] or list(
+            registry
+        )
+        models: List[Tuple[Type[Model], Tuple[str, ...]]] = []
+        for label in labels:
+            if label not in registry:
+
+                raise CommandError(
+                    f"{label} is not registered with read only admin search fields."
+                )
+
+            models.append((apps.get_model(label), registry[label]))
+
+        for model, fields in models:
+            count: int = backend.build(model=model, search_fields=fields)
+            self.stdout.write(f"{model._meta.label_lower}: {count} indexed")
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/management/commands/read_only_admin_warm_up.py
+
+
+from datetime import timedelta
+from typing import Any, Set, Dict, List, Tuple, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from django.db import connections
+from django.utils import timezone
+from django.db.models import QuerySet
+from django.contrib.auth import get_backends, get_user_model
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import get_cache, get_permissions_generation
+from read_only_admin.backends import ReadOnlyPermissionBackend, make_permissions_key
+
+
+__all__: List[str] = ["Command"]
+
+
+class Command(BaseCommand):
+    """Warm up read only permissions cache."""
+
+    help: str = "Precompute and cache read only permissions of active staff users, used by ReadOnlyPermissionBackend."  # noqa: A003,E501
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """
+        Add command arguments.
+
+        :param parser: command arguments parser
+        :type parser: CommandParser
+        """
+        parser.add_argument(
+            "--since-last-login",
+            type=int,
+            metavar="DAYS",
+            help="Warm up only users logged in during last given days.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Users processed per batch, 500 by default.",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Process batches in given number of threads, 1 by default.",
+        )
+
+    def get_queryset(self, since_last_login: Any) -> QuerySet:  # type: ignore
+        """
+        Get users to warm up.
+
+        :param since_last_login: last login days limit
+        :type since_last_login: Any
+        :return: users queryset
+        :rtype: QuerySet
+        """
+        queryset: QuerySet = get_user_model().objects.filter(  # type: ignore
+            is_active=True, is_staff=True, is_superuser=False
+        )
+        if since_last_login is not None:
+            queryset = queryset.filter(
+                last_login__gte=timezone.now() - timedelta(days=since_last_login)
+            )
+
+        return queryset.order_by("pk")
+
+    def get_batches(
+        self, queryset: QuerySet, batch_size: int  # type: ignore
+    ) -> Iterator[List[Any]]:
+        """
+        Split users to batches without loading all of them to memory.
+
+        :param queryset: users queryset
+        :type queryset: QuerySet
+        :param batch_size: users per batch
+        :type batch_size: int
+        :yield: users batch
+        :rtype: Iterator[List[Any]]
+        """
+        batch: List[Any] = []
+        for user in queryset.iterator(chunk_size=batch_size):
+            batch.append(user)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def warm_up(self, users: List[Any], generation: str) -> int:
+        """
+        Cache read only permissions of users batch using two queries.
+
+        :param users: users batch
+        :type users: List[Any]
+        :param generation: users permissions generation token
+        :type generation: str
+        :return: warmed up users count
+        :rtype: int
+        """
+        user_model = get_user_model()
+        prefix: str = f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_"
+        permissions: Dict[Any, Set[Tuple[str, str]]] = {
+            user.pk: set() for user in users
+        }
+
+        for name, suffix in [("user_permissions", ""), ("groups", "__permissions")]:
+            field = user_model._meta.get_field(name)
+            source: str = field.m2m_field_name()  # type: ignore
+            related: str = f"{field.m2m_reverse_field_name()}{suffix}"  # type: ignore
+            rows = (  # noqa: ECE001
+                field.remote_field.through.objects.filter(  # type: ignore
+                    **{
+                        f"{source}__in": list(permissions),
+                        f"{related}__codename__startswith": prefix,
+                    }
+                )
+                .values_list(
+                    source,
+                    f"{related}__content_type__app_label",
+                    f"{related}__codename",
+                )
+                .order_by()
+            )
+            for pk, app_label, codename in rows:
+                permissions[pk].add((app_label, codename))
+
+        get_cache().set_many(
+            {
+                make_permissions_key(user_obj=user, generation=generation): frozenset(
+                    permissions[user.pk]
+                )
+                for user in users
+            },
+            settings.READ_ONLY_ADMIN_BACKEND_CACHE_TIMEOUT,
+        )
+
+        return len(users)
+
+    def warm_up_in_thread(self, users: List[Any], generation: str) -> int:
+        """
+        Cache read only permissions of users batch in worker thread.
+
+        :param users: users batch
+        :type users: List[Any]
+        :param generation: users permissions generation token
+        :type generation: str
+        :return: warmed up users count
+        :rtype: int
+        """
+        try:
+
+            return self.warm_up(users=users, generation=generation)
+        finally:
+            # worker threads database connections are never reused
+            connections.close_all()
+
+    def warm_up_in_threads(
+        self, batches: Iterator[List[Any]], generation: str, threads: int
+    ) -> int:
+        """
+        Cache read only permissions of users batches in threads, keeping only one batch per thread in memory.
+
+        :param batches: users batches
+        :type batches: Iterator[List[Any]]
+        :param generation: users permissions generation token
+        :type generation: str
+        :param threads: threads count
+        :type threads: int
+        :return: warmed up users count
+        :rtype: int
+        """  # noqa: E501
+        count: int = 0
+        futures: Set[Future] = set()  # type: ignore
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            for users in batches:
+                # next batch is loaded only when some thread is free
+                if len(futures) >= threads:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    count += sum(future.result() for future in done)
+                futures.add(
+                    executor.submit(
+                        self.warm_up_in_thread, users=users, generation=generation
+                    )
+                )
+
+        return count + sum(future.result() for future in futures)
+
+    def handle(self, *args: List[Any], **options: Dict[str, Any]) -> None:
+        """
+        Warm up read only permissions cache.
+
+        :param args: additional args
+        :type args: List[Any]
+        :param options: command options
+        :type options: Dict[str, Any]
+        :raises CommandError: backend is not configured or user model has no permissions
+        """  # noqa: E501
+        if not any(
+            isinstance(backend, ReadOnlyPermissionBackend) for backend in get_backends()
+        ):
+
+            raise CommandError("ReadOnlyPermissionBackend is not configured.")
+
+        user_model = get_user_model()
+        if not all(
+            hasattr(user_model, name) for name in ["groups", "user_permissions"]
+        ):
+
+            raise CommandError(f"{user_model._meta.label} has no permissions.")
+
+        generation: str = get_permissions_generation()
+        batches: Iterator[List[Any]] = self.get_batches(
+            queryset=self.get_queryset(since_last_login=options["since_last_login"]),
+            batch_size=options["batch_size"],  # type: ignore
+        )
+
+        if options["threads"] > 1:  # type: ignore
+            count: int = self.warm_up_in_threads(
+                batches=batches,
+                generation=generation,
+                threads=options["threads"],  # type: ignore
+            )
+        else:
+            count = sum(
+                self.warm_up(users=users, generation=generation) for users in batches
+            )
+
+        self.stdout.write(f"{count} users warmed up")
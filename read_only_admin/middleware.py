@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/middleware.py
+
+
+from typing import List, Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from read_only_admin.conf import settings
+from read_only_admin.snapshot import SESSION_KEY, save_snapshot, restore_snapshot
+
+
+__all__: List[str] = ["ReadOnlyAdminSnapshotMiddleware"]
+
+
+class ReadOnlyAdminSnapshotMiddleware:
+    """
+    Keep read only permissions snapshot in session, so read only checks don't query database.
+
+    Must be placed after session and authentication middlewares.
+    """  # noqa: E501
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """
+        Remember next handler.
+
+        :param get_response: next handler
+        :type get_response: Callable[[HttpRequest], HttpResponse]
+        """
+        self.get_response: Callable[[HttpRequest], HttpResponse] = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """
+        Restore snapshot before view and save fresh one after it if it was computed.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: response
+        :rtype: HttpResponse
+        """
+        if not settings.READ_ONLY_ADMIN_SESSION_SNAPSHOT:
+
+            return self.get_response(request)
+
+        restored: bool = SESSION_KEY in request.session and restore_snapshot(
+            request=request
+        )
+        response: HttpResponse = self.get_response(request)
+        # snapshot is saved on the first request which resolved read only permissions,
+        # user loaded by authentication middleware is cached on request
+        if not restored and hasattr(request, "_cached_user"):
+            save_snapshot(request=request)
+
+        return response
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/operations.py
+
+
+import warnings
+from contextlib import suppress
+from collections import defaultdict
+from typing import Any, Set, Dict, List, Tuple, DefaultDict
+
+from django.conf import settings as django_settings
+from django.core.exceptions import FieldDoesNotExist
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = ["convert_read_only_permissions"]
+
+
+NATIVE_ACTIONS: Tuple[str, ...] = ("add", "change", "delete")
+
+# owner kind, owner ID and read only permission ID
+Conversion = Tuple[str, int, int]
+
+
+def _get_grants(
+    field: Any, permissions: Set[int], using: str
+) -> DefaultDict[int, Set[int]]:
+    """
+    Get owners grants of given permissions.
+
+    :param field: owner permissions field
+    :type field: Any
+    :param permissions: permissions IDs
+    :type permissions: Set[int]
+    :param using: database alias
+    :type using: str
+    :return: owners permissions IDs
+    :rtype: DefaultDict[int, Set[int]]
+    """
+    owner: str = field.m2m_field_name()
+    grants: DefaultDict[int, Set[int]] = defaultdict(set)
+    for owner_id, permission_id in (
+        field.remote_field.through.objects.using(using)  # noqa: ECE001
+        .filter(permission_id__in=permissions)
+        .values_list(f"{owner}_id", "permission_id")
+    ):
+        grants[owner_id].add(permission_id)
+
+    return grants
+
+
+def _get_memberships(user_model: Any, using: str) -> DefaultDict[int, Set[int]]:
+    """
+    Get users groups.
+
+    :param user_model: migration state user model
+    :type user_model: Any
+    :param using: database alias
+    :type using: str
+    :return: users groups IDs
+    :rtype: DefaultDict[int, Set[int]]
+    """
+    memberships: DefaultDict[int, Set[int]] = defaultdict(set)
+    # custom user model without permissions mixin
+    with suppress(FieldDoesNotExist):
+        field = user_model._meta.get_field("groups")
+        through = field.remote_field.through
+        user: str = field.m2m_field_name()
+        group: str = field.m2m_reverse_field_name()
+        for user_id, group_id in through.objects.using(using).values_list(
+            f"{user}_id", f"{group}_id"
+        ):
+            memberships[user_id].add(group_id)
+
+    return memberships
+
+
+def _get_remaining(
+    user_id: int,
+    grants: Dict[str, DefaultDict[int, Set[int]]],
+    memberships: DefaultDict[int, Set[int]],
+    revoked: DefaultDict[Tuple[str, int], Set[int]],
+) -> Set[int]:
+    """
+    Get user permissions left after planned revocations, directly granted or inherited from groups.
+
+    :param user_id: user ID
+    :type user_id: int
+    :param grants: groups and users grants
+    :type grants: Dict[str, DefaultDict[int, Set[int]]]
+    :param memberships: users groups
+    :type memberships: DefaultDict[int, Set[int]]
+    :param revoked: planned revocations
+    :type revoked: DefaultDict[Tuple[str, int], Set[int]]
+    :return: permissions IDs
+    :rtype: Set[int]
+    """  # noqa: E501
+    permissions: Set[int] = grants["user"][user_id] - revoked[("user", user_id)]
+    for group_id in memberships[user_id]:
+        permissions |= grants["group"][group_id] - revoked[("group", group_id)]
+
+    return permissions
+
+
+def _get_unsafe(
+    conversions: Set[Conversion],
+    grants: Dict[str, DefaultDict[int, Set[int]]],
+    memberships: DefaultDict[int, Set[int]],
+    writes: Dict[int, Set[int]],
+) -> Set[Conversion]:
+    """
+    Get conversions after which affected users still have add, change or delete permission of same model, directly or from groups.
+
+    :param conversions: planned conversions
+    :type conversions: Set[Conversion]
+    :param grants: groups and users grants
+    :type grants: Dict[str, DefaultDict[int, Set[int]]]
+    :param memberships: users groups
+    :type memberships: DefaultDict[int, Set[int]]
+    :param writes: read only permissions models add, change and delete permissions
+    :type writes: Dict[int, Set[int]]
+    :return: conversions which would grant write access
+    :rtype: Set[Conversion]
+    """  # noqa: E501
+    revoked: DefaultDict[Tuple[str, int], Set[int]] = defaultdict(set)
+    for kind, owner_id, permission_id in conversions:
+        revoked[(kind, owner_id)] |= writes[permission_id]
+    members: DefaultDict[int, Set[int]] = defaultdict(set)
+    for user_id, group_id in [
+        (user_id, group_id)
+        for user_id, groups in memberships.items()
+        for group_id in groups
+    ]:
+        members[group_id].add(user_id)
+
+    return {
+        (kind, owner_id, permission_id)
+        for kind, owner_id, permission_id in conversions
+        if any(
+            _get_remaining(
+                user_id=user_id,
+                grants=grants,
+                memberships=memberships,
+                revoked=revoked,
+            )
+            & writes[permission_id]  # noqa: W503
+            for user_id in ({owner_id} if kind == "user" else members[owner_id])
+        )
+    }
+
+
+def convert_read_only_permissions(  # noqa: CCR001
+    apps: Any, schema_editor: Any
+) -> None:
+    """
+    Convert users and groups read only permissions grants to django view permission grants, usable as RunPython migration code.
+
+    Model read only permission is replaced by model view permission and add, change and delete permissions of that model are revoked.
+    Models without view permission in database are skipped.
+    Grants after which some user still has add, change or delete permission of same model, directly or from groups, are kept and reported by warning.
+
+    :param apps: migration state applications registry
+    :type apps: Any
+    :param schema_editor: migration schema editor
+    :type schema_editor: Any
+    """  # noqa: E501
+    using: str = schema_editor.connection.alias
+    Permission = apps.get_model("auth", "Permission")  # noqa: N806
+    Group = apps.get_model("auth", "Group")  # noqa: N806
+    User = apps.get_model(django_settings.AUTH_USER_MODEL)  # noqa: N806
+
+    prefix: str = f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_"
+    read_only: Dict[int, Tuple[int, str]] = {  # noqa: ECE001
+        pk: (content_type_id, codename[len(prefix) :])  # noqa: E203
+        for pk, content_type_id, codename in Permission.objects.using(using)
+        .filter(codename__startswith=prefix)
+        .exclude(codename__contains="__")
+        .values_list("pk", "content_type_id", "codename")
+    }
+    native: Dict[Tuple[int, str], int] = {  # noqa: ECE001
+        (content_type_id, codename): pk
+        for pk, content_type_id, codename in Permission.objects.using(using)
+        .filter(content_type_id__in={value[0] for value in read_only.values()})
+        .values_list("pk", "content_type_id", "codename")
+    }
+    writes: Dict[int, Set[int]] = {  # noqa: ECE001
+        pk: {
+            native[(content_type_id, f"{action}_{model}")]
+            for action in NATIVE_ACTIONS
+            if (content_type_id, f"{action}_{model}") in native
+        }
+        for pk, (content_type_id, model) in read_only.items()
+    }
+    views: Dict[int, int] = {  # noqa: ECE001
+        pk: native[(content_type_id, f"view_{model}")]
+        for pk, (content_type_id, model) in read_only.items()
+        if (content_type_id, f"view_{model}") in native
+    }
+    fields: Dict[str, Any] = {"group": Group._meta.get_field("permissions")}
+    # custom user model without permissions mixin
+    with suppress(FieldDoesNotExist):
+        fields["user"] = User._meta.get_field("user_permissions")
+    permissions: Set[int] = set(read_only).union(*writes.values())
+    grants: Dict[str, DefaultDict[int, Set[int]]] = {
+        "group": defaultdict(set),
+        "user": defaultdict(set),
+    }
+    for kind, field in fields.items():
+        grants[kind] = _get_grants(field=field, permissions=permissions, using=using)
+    memberships: DefaultDict[int, Set[int]] = _get_memberships(
+        user_model=User, using=using
+    )
+
+    conversions: Set[Conversion] = {
+        (kind, owner_id, permission_id)
+        for kind, owners in grants.items()
+        for owner_id, granted in owners.items()
+        for permission_id in granted & views.keys()
+    }
+    skipped: Set[Conversion] = set()
+    # each skipped conversion leaves more permissions to other owners
+    unsafe: Set[Conversion] = _get_unsafe(
+        conversions=conversions, grants=grants, memberships=memberships, writes=writes
+    )
+    while unsafe:
+        conversions -= unsafe
+        skipped |= unsafe
+        unsafe = _get_unsafe(
+            conversions=conversions,
+            grants=grants,
+            memberships=memberships,
+            writes=writes,
+        )
+
+    for kind, owner_id, permission_id in conversions:
+        through = fields[kind].remote_field.through
+        owner: str = fields[kind].m2m_field_name()
+        revoked: List[int] = [permission_id, *writes[permission_id]]
+        through.objects.using(using).filter(  # noqa: ECE001
+            **{f"{owner}_id": owner_id}, permission_id__in=revoked
+        ).delete()
+        through.objects.using(using).get_or_create(  # noqa: ECE001
+            **{f"{owner}_id": owner_id, "permission_id": views[permission_id]}
+        )
+
+    if skipped:
+        kept: str = ", ".join(  # noqa: ECE001
+            f"{kind} {owner_id} {read_only[permission_id][1]}"
+            for kind, owner_id, permission_id in sorted(skipped)
+        )
+        warnings.warn(
+            f"Read only permissions kept to not grant add, change or delete permissions inherited directly or from groups: {kept}.",  # noqa: E501
+            RuntimeWarning,
+        )
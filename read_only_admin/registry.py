@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/registry.py
+
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Type, Tuple, Mapping, Optional, NamedTuple
+
+from django.db.models import Model
+from django.dispatch import receiver
+from django.core.signals import setting_changed
+from django.forms.models import _get_foreign_key
+
+from read_only_admin.conf import settings
+from read_only_admin.utils import get_read_only_permission_codename
+
+
+__all__: List[str] = [
+    "ReadonlyModel",
+    "build_registry",
+    "get_registry",
+    "get_registry_entry",
+    "build_field_index",
+    "get_field_index",
+    "rebuild_registry",
+]
+
+
+class ReadonlyModel(NamedTuple):
+    """Read only model registry entry."""
+
+    permission: str
+    fields: Tuple[str, ...]
+    inlines: Tuple[Tuple[str, Optional[str]], ...]
+
+
+_registry: Mapping[str, ReadonlyModel] = MappingProxyType({})
+_field_index: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+
+def _get_fields(model: Type[Model]) -> Tuple[str, ...]:
+    """
+    Get model local and many to many fields names in definition order.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: fields names
+    :rtype: Tuple[str, ...]
+    """
+    return tuple(
+        dict.fromkeys(
+            [field.name for field in model._meta.local_fields]
+            + [field.name for field in model._meta.local_many_to_many]  # noqa: W503
+        )
+    )
+
+
+def _get_fk_name(
+    parent: Type[Model], model: Type[Model], fk_name: Optional[str]
+) -> Optional[str]:
+    """
+    Get inline model foreign key name to parent model.
+
+    :param parent: parent model class
+    :type parent: Type[Model]
+    :param model: inline model class
+    :type model: Type[Model]
+    :param fk_name: explicit foreign key name
+    :type fk_name: Optional[str]
+    :return: foreign key name
+    :rtype: Optional[str]
+    """
+    try:
+        fk = _get_foreign_key(parent, model, fk_name=fk_name, can_fail=True)
+    except ValueError:
+
+        return None
+
+    return fk.name if fk else None
+
+
+def _create_entry(
+    model: Type[Model], inlines: Tuple[Tuple[str, Optional[str]], ...] = ()
+) -> ReadonlyModel:
+    """
+    Create read only model registry entry.
+
+    :param model: model class
+    :type model: Type[Model]
+    :param inlines: inline models labels and foreign keys names
+    :type inlines: Tuple[Tuple[str, Optional[str]], ...]
+    :return: registry entry
+    :rtype: ReadonlyModel
+    """
+    codename: str = get_read_only_permission_codename(model=model._meta.model_name)
+
+    return ReadonlyModel(
+        permission=f"{model._meta.app_label}.{codename}",
+        fields=_get_fields(model=model),
+        inlines=inlines,
+    )
+
+
+def build_registry() -> Mapping[str, ReadonlyModel]:  # noqa: CCR001
+    """
+    Build read only registry for all models registered with read only admins or inlines on all admin sites.
+
+    Only models meta is inspected, no database queries or forms construction is done.
+
+    :return: read only registry
+    :rtype: Mapping[str, ReadonlyModel]
+    """  # noqa: E501
+    global _registry  # pylint: disable=W0603
+
+    # lazy imports to prevent apps loading problems
+    from django.contrib.admin.sites import all_sites
+
+    from read_only_admin.admin import ReadonlyAdmin, ReadonlyInline
+
+    models: Dict[Type[Model], Dict[Tuple[Type[Model], Optional[str]], None]] = {}
+
+    for site in list(all_sites):
+        for model, model_admin in site._registry.items():
+            inlines: List[Tuple[Type[Model], Optional[str]]] = [  # noqa: ECE001
+                (inline.model, inline.fk_name)
+                for inline in model_admin.inlines
+                if issubclass(inline, ReadonlyInline)
+            ]
+            for inline_model, _ in inlines:
+                models.setdefault(inline_model, {})
+            if isinstance(model_admin, ReadonlyAdmin) or inlines:
+                # same model can be registered on many sites with different inlines
+                models.setdefault(model, {}).update(dict.fromkeys(inlines))
+
+    # entries and foreign keys are resolved once per model, not per admin
+    registry: Dict[str, ReadonlyModel] = {
+        model._meta.label_lower: _create_entry(
+            model=model,
+            inlines=tuple(
+                dict.fromkeys(
+                    (
+                        inline_model._meta.label_lower,
+                        _get_fk_name(parent=model, model=inline_model, fk_name=fk_name),
+                    )
+                    for inline_model, fk_name in inlines
+                )
+            ),
+        )
+        for model, inlines in models.items()
+    }
+    _registry = MappingProxyType(registry)
+
+    return _registry  # noqa: R504
+
+
+def get_registry() -> Mapping[str, ReadonlyModel]:
+    """
+    Get read only registry.
+
+    :return: read only registry
+    :rtype: Mapping[str, ReadonlyModel]
+    """
+    return _registry
+
+
+def get_registry_entry(model: Type[Model]) -> ReadonlyModel:
+    """
+    Get model read only registry entry, models registered after startup are computed on the fly.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: registry entry
+    :rtype: ReadonlyModel
+    """  # noqa: E501
+    entry: Optional[ReadonlyModel] = _registry.get(model._meta.label_lower)
+
+    return entry if entry is not None else _create_entry(model=model)
+
+
+def build_field_index() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Build read only fields index: models opt-in fields, field position is it's bit in users read only fields masks.
+
+    :return: read only fields index
+    :rtype: Mapping[str, Tuple[str, ...]]
+    """  # noqa: E501
+    global _field_index  # pylint: disable=W0603
+
+    permissions: Dict[str, List[str]] = settings.READ_ONLY_ADMIN_FIELD_PERMISSIONS
+    _field_index = MappingProxyType(
+        {
+            label.lower(): tuple(dict.fromkeys(fields))
+            for label, fields in permissions.items()
+        }
+    )
+
+    return _field_index  # noqa: R504
+
+
+def get_field_index(label: str) -> Tuple[str, ...]:
+    """
+    Get model read only fields index entry.
+
+    :param label: "app_label.model_name" model label
+    :type label: str
+    :return: model opt-in fields
+    :rtype: Tuple[str, ...]
+    """
+    return _field_index.get(label, ())
+
+
+@receiver(setting_changed)
+def rebuild_registry(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Rebuild read only registry and fields index when related settings changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if setting == "READ_ONLY_ADMIN_PERMISSION_PREFIX" and _registry:
+        build_registry()
+    elif setting == "READ_ONLY_ADMIN_FIELD_PERMISSIONS":
+        build_field_index()
@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/resolver.py
+
+
+from contextlib import suppress
+from typing import (
+    Any,
+    Set,
+    Dict,
+    List,
+    Type,
+    Tuple,
+    Union,
+    Iterable,
+    Optional,
+    FrozenSet,
+)
+
+from django.db.models import Q, Model, QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.contrib.auth import get_backends, get_user_model
+from django.contrib.auth.backends import ModelBackend, AllowAllUsersModelBackend
+
+from read_only_admin.conf import settings
+from read_only_admin.registry import get_field_index
+from read_only_admin.degraded import is_degraded_mode
+from read_only_admin.shared_index import SharedIndex, get_shared_index
+
+
+__all__: List[str] = [
+    "get_read_only_content_types",
+    "is_read_only",
+    "has_read_only_permission",
+    "get_read_only_fields_mask",
+    "get_read_only_fields",
+    "aget_read_only_content_types",
+    "ais_read_only",
+]
+
+
+READ_ONLY_CACHE_ATTRIBUTE: str = "_read_only_admin_cache"
+READ_ONLY_FIELDS_CACHE_ATTRIBUTE: str = "_read_only_admin_fields_cache"
+DEGRADED_MODE_CACHE_ATTRIBUTE: str = "_read_only_admin_degraded_mode"
+MODEL_BACKENDS: Tuple[Type[ModelBackend], ...] = (
+    ModelBackend,
+    AllowAllUsersModelBackend,
+)
+
+
+def _get_model_natural_key(model: Union[Type[Model], Model, str]) -> Tuple[str, str]:
+    """
+    Get model content type natural key.
+
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: content type natural key
+    :rtype: Tuple[str, str]
+    """
+    if isinstance(model, str):
+        app_label, sep, model_name = model.lower().partition(  # pylint: disable=W0612
+            "."
+        )  # type: str, str, str
+
+        return app_label, model_name
+
+    return model._meta.app_label, model._meta.model_name  # type: ignore
+
+
+def _is_model_backends_only() -> bool:
+    """
+    Check are all configured authentication backends django model backends.
+
+    :return: are all backends model backends
+    :rtype: bool
+    """
+    return all(type(backend) in MODEL_BACKENDS for backend in get_backends())
+
+
+def _get_permissions_from_db(user: Any) -> Iterable[Tuple[str, str]]:
+    """
+    Get user read only permissions (own and from groups) in one query.
+
+    :param user: user object
+    :type user: Any
+    :return: read only permissions application labels and code names
+    :rtype: Iterable[Tuple[str, str]]
+    """
+    # lazy import to prevent apps loading problems
+    from django.contrib.auth.models import Permission
+
+    user_model = get_user_model()
+    user_query: str = user_model._meta.get_field(
+        "user_permissions"
+    ).related_query_name()
+    group_query: str = f"group__{user_model._meta.get_field('groups').related_query_name()}"  # noqa: E501, ECE001
+
+    return (  # noqa: ECE001
+        Permission.objects.filter(
+            Q(pk__in=Permission.objects.filter(**{user_query: user}).values("pk"))
+            | Q(  # noqa: W503
+                pk__in=Permission.objects.filter(**{group_query: user}).values("pk")
+            ),
+            codename__startswith=f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_",
+        )
+        .values_list("content_type__app_label", "codename")
+        .order_by()
+        .distinct()
+    )
+
+
+def _get_permissions_from_backends(
+    user: Any,
+) -> Iterable[Tuple[str, str]]:
+    """
+    Get user read only permissions using authentication backends API.
+
+    :param user: user object
+    :type user: Any
+    :return: read only permissions application labels and code names
+    :rtype: Iterable[Tuple[str, str]]
+    """
+    prefix: str = f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_"
+    permissions: Set[Tuple[str, str]] = set()
+
+    for permission in user.get_all_permissions():
+        app_label, sep, codename = permission.partition(  # pylint: disable=W0612
+            "."
+        )  # type: str, str, str
+        if codename.startswith(prefix):
+            permissions.add((app_label, codename))
+
+    return permissions
+
+
+def _get_permissions(user: Any) -> Iterable[Tuple[str, str]]:  # noqa: CCR001
+    """
+    Get user read only permissions using the cheapest available way.
+
+    :param user: user object
+    :type user: Any
+    :return: read only permissions application labels and code names
+    :rtype: Iterable[Tuple[str, str]]
+    """
+    # lazy import to prevent circular imports
+    from read_only_admin.backends import ReadOnlyPermissionBackend
+
+    backends: List[Any] = get_backends()
+    for backend in backends:
+        if isinstance(backend, ReadOnlyPermissionBackend):
+            permissions: Optional[
+                FrozenSet[Tuple[str, str]]
+            ] = backend.get_read_only_permissions(user_obj=user)
+            if permissions is not None:
+
+                return permissions
+
+    if _is_model_backends_only():
+        # custom user model without permissions mixin falls back to backends
+        with suppress(FieldDoesNotExist):
+
+            return _get_permissions_from_db(user=user)
+
+    return _get_permissions_from_backends(user=user)
+
+
+def _get_content_types_from_shared_index(
+    user: Any,
+) -> Optional[FrozenSet[Tuple[str, str]]]:
+    """
+    Get user read only content types natural keys from shared index without database and cache lookups.
+
+    Index is built from database, so it's used only when permissions are resolved from database.
+
+    :param user: user object
+    :type user: Any
+    :return: read only content types natural keys, nothing if index is disabled or not usable
+    :rtype: Optional[FrozenSet[Tuple[str, str]]]
+    """  # noqa: E501
+    # lazy import to prevent circular imports
+    from read_only_admin.backends import ReadOnlyPermissionBackend
+
+    if settings.READ_ONLY_ADMIN_SHARED_INDEX is None or not (
+        _is_model_backends_only()
+        or any(  # noqa: W503
+            isinstance(backend, ReadOnlyPermissionBackend) for backend in get_backends()
+        )
+    ):
+
+        return None
+
+    index: Optional[SharedIndex] = get_shared_index()
+    if index is None:
+
+        return None
+
+    return index.get(user_id=user.pk)
+
+
+def _is_resolvable(user: Any) -> bool:
+    """
+    Check can user have read only permissions at all.
+
+    :param user: user object
+    :type user: Any
+    :return: can user have read only permissions
+    :rtype: bool
+    """
+    return user.is_active and not user.is_anonymous and not user.is_superuser
+
+
+def _is_degraded(user: Any) -> bool:
+    """
+    Check is degraded mode enabled, result is cached on user object.
+
+    :param user: user object
+    :type user: Any
+    :return: is degraded mode enabled
+    :rtype: bool
+    """
+    if not hasattr(user, DEGRADED_MODE_CACHE_ATTRIBUTE):
+        setattr(user, DEGRADED_MODE_CACHE_ATTRIBUTE, is_degraded_mode())
+
+    return getattr(user, DEGRADED_MODE_CACHE_ATTRIBUTE)
+
+
+def _set_cache(
+    user: Any, permissions: Iterable[Tuple[str, str]]
+) -> FrozenSet[Tuple[str, str]]:
+    """
+    Convert read only permissions to content types natural keys and read only fields masks and cache them on user object.
+
+    :param user: user object
+    :type user: Any
+    :param permissions: read only permissions application labels and code names
+    :type permissions: Iterable[Tuple[str, str]]
+    :return: read only content types natural keys
+    :rtype: FrozenSet[Tuple[str, str]]
+    """  # noqa: E501
+    prefix: int = len(f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_")
+    content_types: Set[Tuple[str, str]] = set()
+    masks: Dict[Tuple[str, str], int] = {}
+
+    for app_label, codename in permissions:
+        model, sep, field = codename[prefix:].partition("__")
+        if not sep:
+            content_types.add((app_label, model))
+            continue
+
+        fields: Tuple[str, ...] = get_field_index(label=f"{app_label}.{model}")
+        if field in fields:
+            masks[(app_label, model)] = masks.get(
+                (app_label, model), 0
+            ) | 1 << fields.index(field)
+
+    setattr(user, READ_ONLY_CACHE_ATTRIBUTE, frozenset(content_types))
+    setattr(user, READ_ONLY_FIELDS_CACHE_ATTRIBUTE, masks)
+
+    return getattr(user, READ_ONLY_CACHE_ATTRIBUTE)
+
+
+def get_read_only_content_types(  # noqa: CFQ004
+    user: Any,
+) -> FrozenSet[Tuple[str, str]]:
+    """
+    Get content types natural keys of models on which user has read only permission.
+
+    Result is cached on user object, like django model backend does. Shared index is used if enabled.
+
+    :param user: user object
+    :type user: Any
+    :return: read only content types natural keys
+    :rtype: FrozenSet[Tuple[str, str]]
+    """  # noqa: E501
+    if not _is_resolvable(user=user):
+
+        return frozenset()
+
+    if hasattr(user, READ_ONLY_CACHE_ATTRIBUTE):
+
+        return getattr(user, READ_ONLY_CACHE_ATTRIBUTE)
+
+    content_types: Optional[
+        FrozenSet[Tuple[str, str]]
+    ] = _get_content_types_from_shared_index(user=user)
+    if content_types is not None:
+        setattr(user, READ_ONLY_CACHE_ATTRIBUTE, content_types)
+
+        return content_types
+
+    return _set_cache(user=user, permissions=_get_permissions(user=user))
+
+
+def is_read_only(user: Any, model: Union[Type[Model], Model, str]) -> bool:
+    """
+    Check is user has read only permission on model.
+
+    :param user: user object
+    :type user: Any
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: is model read only for user
+    :rtype: bool
+    """
+    if not _is_resolvable(user=user):
+
+        return False
+
+    # degraded mode makes everything read only without any permissions lookup
+    if _is_degraded(user=user):
+
+        return True
+
+    return _get_model_natural_key(model=model) in get_read_only_content_types(user=user)
+
+
+def has_read_only_permission(user: Any, model: Union[Type[Model], Model, str]) -> bool:
+    """
+    Check is user granted read only permission on model, unlike is_read_only degraded mode is ignored.
+
+    :param user: user object
+    :type user: Any
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: is user granted read only permission
+    :rtype: bool
+    """  # noqa: E501
+    return _get_model_natural_key(model=model) in get_read_only_content_types(user=user)
+
+
+def get_read_only_fields_mask(user: Any, model: Union[Type[Model], Model, str]) -> int:
+    """
+    Get user read only fields mask of model, bits are positions of fields in read only fields index.
+
+    Masks of all models are resolved once with read only content types and cached on user object.
+
+    :param user: user object
+    :type user: Any
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: read only fields mask
+    :rtype: int
+    """  # noqa: E501
+    natural_key: Tuple[str, str] = _get_model_natural_key(model=model)
+    if not _is_resolvable(user=user) or not get_field_index(
+        label=".".join(natural_key)
+    ):
+
+        return 0
+
+    if not hasattr(user, READ_ONLY_FIELDS_CACHE_ATTRIBUTE):
+        _set_cache(user=user, permissions=_get_permissions(user=user))
+
+    return getattr(user, READ_ONLY_FIELDS_CACHE_ATTRIBUTE).get(natural_key, 0)
+
+
+def get_read_only_fields(
+    user: Any, model: Union[Type[Model], Model, str]
+) -> Tuple[str, ...]:
+    """
+    Get names of model fields read only for user.
+
+    :param user: user object
+    :type user: Any
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: read only fields names
+    :rtype: Tuple[str, ...]
+    """
+    mask: int = get_read_only_fields_mask(user=user, model=model)
+    if not mask:
+
+        return ()
+
+    return tuple(
+        field
+        for bit, field in enumerate(
+            get_field_index(label=".".join(_get_model_natural_key(model=model)))
+        )
+        if mask >> bit & 1
+    )
+
+
+async def aget_read_only_content_types(  # noqa: CCR001, CFQ004
+    user: Any,
+) -> FrozenSet[Tuple[str, str]]:
+    """
+    Async version of get_read_only_content_types.
+
+    Use async ORM when it's available (django 4.1+) and thread executor otherwise.
+
+    :param user: user object
+    :type user: Any
+    :return: read only content types natural keys
+    :rtype: FrozenSet[Tuple[str, str]]
+    """  # noqa: E501
+    # lazy import, asgiref is not required by django 2.2
+    from asgiref.sync import sync_to_async
+
+    if not _is_resolvable(user=user):
+
+        return frozenset()
+
+    if hasattr(user, READ_ONLY_CACHE_ATTRIBUTE):
+
+        return getattr(user, READ_ONLY_CACHE_ATTRIBUTE)
+
+    if settings.READ_ONLY_ADMIN_SHARED_INDEX is not None:
+        content_types: Optional[FrozenSet[Tuple[str, str]]] = await sync_to_async(
+            _get_content_types_from_shared_index
+        )(user=user)
+        if content_types is not None:
+            setattr(user, READ_ONLY_CACHE_ATTRIBUTE, content_types)
+
+            return content_types
+
+    if hasattr(QuerySet, "aiterator") and _is_model_backends_only():
+        try:
+            queryset = _get_permissions_from_db(user=user)
+        except FieldDoesNotExist:
+            # custom user model without permissions mixin
+            pass
+        else:
+
+            return _set_cache(
+                user=user,
+                permissions=[permission async for permission in queryset],  # type: ignore  # noqa: E501
+            )
+
+    return _set_cache(
+        user=user,
+        permissions=await sync_to_async(lambda: list(_get_permissions(user=user)))(),
+    )
+
+
+async def ais_read_only(user: Any, model: Union[Type[Model], Model, str]) -> bool:
+    """
+    Async version of is_read_only.
+
+    :param user: user object
+    :type user: Any
+    :param model: model class, model instance or "app_label.model_name" string
+    :type model: Union[Type[Model], Model, str]
+    :return: is model read only for user
+    :rtype: bool
+    """
+    # lazy import, asgiref is not required by django 2.2
+    from asgiref.sync import sync_to_async
+
+    if not _is_resolvable(user=user):
+
+        return False
+
+    # degraded mode check can touch cache, so run it in thread once
+    if not hasattr(user, DEGRADED_MODE_CACHE_ATTRIBUTE):
+        await sync_to_async(_is_degraded)(user=user)
+
+    if _is_degraded(user=user):
+
+        return True
+
+    return _get_model_natural_key(model=model) in await aget_read_only_content_types(
+        user=user
+    )
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/routers.py
+
+
+from contextvars import ContextVar
+from contextlib import contextmanager
+from typing import Any, Dict, List, Type, Iterator, Optional
+
+from django.db.models import Model
+from django.db.utils import DEFAULT_DB_ALIAS
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = ["ReadOnlyAdminRouter", "use_replica"]
+
+
+_replica: "ContextVar[Optional[str]]" = ContextVar(
+    "read_only_admin_replica", default=None
+)
+
+
+@contextmanager
+def use_replica(using: Optional[str]) -> Iterator[None]:
+    """
+    Route ORM reads to replica database inside context.
+
+    :param using: replica database alias, nothing will be routed if empty
+    :type using: Optional[str]
+    :yield: nothing
+    :rtype: Iterator[None]
+    """
+    token = _replica.set(using)
+    try:
+        yield
+    finally:
+        _replica.reset(token)
+
+
+class ReadOnlyAdminRouter:
+    """Route read only admin users reads to replica database and never route writes there."""  # noqa: E501
+
+    def db_for_read(  # pylint: disable=R0201
+        self, model: Type[Model], **hints: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Suggest the database that should be used for read operations.
+
+        :param model: model class
+        :type model: Type[Model]
+        :param hints: routing hints
+        :type hints: Dict[str, Any]
+        :return: replica database alias inside read only admin context
+        :rtype: Optional[str]
+        """
+        return _replica.get()
+
+    def db_for_write(  # pylint: disable=R0201
+        self, model: Type[Model], **hints: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Suggest the database that should be used for writes.
+
+        Objects loaded from replica remember it, so redirect their writes back to primary.
+
+        :param model: model class
+        :type model: Type[Model]
+        :param hints: routing hints
+        :type hints: Dict[str, Any]
+        :return: primary database alias for objects loaded from replica
+        :rtype: Optional[str]
+        """  # noqa: E501
+        instance: Optional[Model] = hints.get("instance")  # type: ignore
+        if (
+            settings.READ_ONLY_ADMIN_REPLICA_DATABASE
+            and instance is not None  # noqa: W503
+            and instance._state.db  # noqa: W503
+            == settings.READ_ONLY_ADMIN_REPLICA_DATABASE  # noqa: W503
+        ):
+
+            return DEFAULT_DB_ALIAS
+
+        return None
+
+    def allow_relation(  # pylint: disable=R0201
+        self, obj1: Model, obj2: Model, **hints: Dict[str, Any]
+    ) -> Optional[bool]:
+        """
+        Allow relations between primary and replica objects.
+
+        :param obj1: first object
+        :type obj1: Model
+        :param obj2: second object
+        :type obj2: Model
+        :param hints: routing hints
+        :type hints: Dict[str, Any]
+        :return: is relation allowed
+        :rtype: Optional[bool]
+        """
+        databases = {DEFAULT_DB_ALIAS, settings.READ_ONLY_ADMIN_REPLICA_DATABASE}
+        if obj1._state.db in databases and obj2._state.db in databases:
+
+            return True
+
+        return None
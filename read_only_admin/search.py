@@ -0,0 +1,509 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/search.py
+
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Type, Tuple, Mapping, Iterable, Iterator, Optional
+
+from django.db import connections
+from django.dispatch import receiver
+from django.core.signals import setting_changed
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+from django.utils.text import smart_split, unescape_string_literal
+from django.db.models import Model, QuerySet, AutoField, IntegerField
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = [
+    "BaseSearchBackend",
+    "SQLiteFTS5SearchBackend",
+    "get_search_backend",
+    "build_search_registry",
+    "get_search_registry",
+    "update_search_index",
+    "delete_search_index",
+    "clear_search_backend",
+]
+
+
+_search_registry: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
+
+
+def _get_search_field_path(field: str) -> str:
+    """
+    Strip admin search lookup prefix from search field.
+
+    :param field: admin search field
+    :type field: str
+    :return: field path
+    :rtype: str
+    """
+    return field.lstrip("^=@")
+
+
+class BaseSearchBackend:
+    """Read only change lists search backend interface."""
+
+    def search(
+        self, queryset: QuerySet, search_fields: Iterable[str], search_term: str  # type: ignore  # noqa: E501
+    ) -> Optional[QuerySet]:  # type: ignore
+        """
+        Filter queryset by search term using precomputed index.
+
+        :param queryset: change list queryset
+        :type queryset: QuerySet
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        :param search_term: search term
+        :type search_term: str
+        :return: filtered queryset or None to fall back to django admin search
+        :rtype: Optional[QuerySet]
+        """
+        raise NotImplementedError
+
+    def build(self, model: Type[Model], search_fields: Iterable[str]) -> int:
+        """
+        Build model search index from scratch.
+
+        :param model: model class
+        :type model: Type[Model]
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        :return: indexed objects count
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def update(self, instance: Model, search_fields: Iterable[str]) -> None:
+        """
+        Add or replace object in search index.
+
+        :param instance: model instance
+        :type instance: Model
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        """
+        raise NotImplementedError
+
+    def delete(self, instance: Model) -> None:
+        """
+        Remove object from search index.
+
+        :param instance: model instance
+        :type instance: Model
+        """
+        raise NotImplementedError
+
+
+class SQLiteFTS5SearchBackend(BaseSearchBackend):
+    """
+    SQLite FTS5 search backend.
+
+    Index is stored in READ_ONLY_ADMIN_SEARCH_DATABASE SQLite database as one FTS5 table per model with objects primary keys as row ids.
+
+    When index lives in other database than searched objects, at most max_results matched primary keys are passed to objects database, django admin search is used for wider matches.
+    """  # noqa: E501
+
+    batch_size: int = 1000
+    max_results: int = 1000
+
+    @property
+    def using(self) -> str:
+        """
+        Get search index database alias.
+
+        :return: database alias
+        :rtype: str
+        """
+        return settings.READ_ONLY_ADMIN_SEARCH_DATABASE
+
+    def get_table(self, model: Type[Model]) -> str:  # pylint: disable=R0201
+        """
+        Get model search index table name.
+
+        :param model: model class
+        :type model: Type[Model]
+        :return: table name
+        :rtype: str
+        """
+        return f"read_only_admin_search_{model._meta.db_table}"
+
+    def is_supported(self, model: Type[Model]) -> bool:  # pylint: disable=R0201
+        """
+        Check can model be indexed, FTS5 row ids are integers only.
+
+        :param model: model class
+        :type model: Type[Model]
+        :return: can model be indexed
+        :rtype: bool
+        """
+        return isinstance(model._meta.pk, (AutoField, IntegerField))
+
+    def is_indexed(self, model: Type[Model]) -> bool:
+        """
+        Check is model search index built.
+
+        :param model: model class
+        :type model: Type[Model]
+        :return: is index built
+        :rtype: bool
+        """
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [self.get_table(model=model)],
+            )
+
+            return cursor.fetchone() is not None
+
+    def get_match(  # pylint: disable=R0201  # noqa: CCR001
+        self, search_term: str
+    ) -> str:
+        """
+        Convert admin search term to FTS5 query, each search term bit is matched as quoted prefix.
+
+        :param search_term: search term
+        :type search_term: str
+        :return: FTS5 query
+        :rtype: str
+        """  # noqa: E501
+        bits: List[str] = []
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            bit = bit.replace('"', '""')
+            if bit:
+                bits.append(f'"{bit}"*')
+
+        return " ".join(bits)
+
+    def search(  # noqa: CFQ004
+        self, queryset: QuerySet, search_fields: Iterable[str], search_term: str  # type: ignore  # noqa: E501
+    ) -> Optional[QuerySet]:  # type: ignore
+        """
+        Filter queryset by search term using FTS5 index.
+
+        :param queryset: change list queryset
+        :type queryset: QuerySet
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        :param search_term: search term
+        :type search_term: str
+        :return: filtered queryset or None to fall back to django admin search
+        :rtype: Optional[QuerySet]
+        """
+        match: str = self.get_match(search_term=search_term)
+        if (
+            not search_fields
+            or not match  # noqa: W503
+            or not self.is_supported(model=queryset.model)  # noqa: W503
+            or not self.is_indexed(model=queryset.model)  # noqa: W503
+        ):
+
+            return None
+
+        table: str = connections[self.using].ops.quote_name(  # noqa: ECE001
+            self.get_table(model=queryset.model)
+        )
+        sql: str = f"SELECT rowid FROM {table} WHERE {table} MATCH %s"  # nosec
+        if queryset.db == self.using:
+
+            return queryset.filter(pk__in=RawSQL(sql, (match,)))  # nosec
+
+        # index lives in another database, so subquery can't be used
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"{sql} LIMIT %s", [match, self.max_results + 1])
+            pks: List[int] = [row[0] for row in cursor.fetchall()]
+
+        # too many primary keys for one query parameters list
+        if len(pks) > self.max_results:
+
+            return None
+
+        return queryset.filter(pk__in=pks)
+
+    def build(self, model: Type[Model], search_fields: Iterable[str]) -> int:
+        """
+        Build model search index from scratch.
+
+        :param model: model class
+        :type model: Type[Model]
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        :return: indexed objects count
+        :rtype: int
+        """
+        fields: List[str] = [
+            _get_search_field_path(field=field) for field in search_fields
+        ]
+        connection = connections[self.using]
+        table: str = connection.ops.quote_name(self.get_table(model=model))
+        columns: str = ", ".join(connection.ops.quote_name(field) for field in fields)
+        count: int = 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({columns})")
+            rows: List[List[Any]] = []
+            for row in self._get_rows(
+                rows=model._base_manager.values_list("pk", *fields)  # type: ignore
+                .order_by("pk")
+                .iterator(chunk_size=self.batch_size)
+            ):
+                rows.append(row)
+                if len(rows) == self.batch_size:
+                    count += self._insert(
+                        cursor=cursor, table=table, columns=columns, rows=rows
+                    )
+                    rows = []
+            count += self._insert(
+                cursor=cursor, table=table, columns=columns, rows=rows
+            )
+
+        return count
+
+    def update(self, instance: Model, search_fields: Iterable[str]) -> None:
+        """
+        Add or replace object in FTS5 index.
+
+        :param instance: model instance
+        :type instance: Model
+        :param search_fields: admin search fields
+        :type search_fields: Iterable[str]
+        """
+        model: Type[Model] = instance.__class__
+        if not self.is_indexed(model=model):
+
+            return
+
+        fields: List[str] = [
+            _get_search_field_path(field=field) for field in search_fields
+        ]
+        connection = connections[self.using]
+        table: str = connection.ops.quote_name(self.get_table(model=model))
+        rows: List[List[Any]] = list(
+            self._get_rows(
+                rows=model._base_manager.filter(  # type: ignore
+                    pk=instance.pk
+                ).values_list("pk", *fields)
+            )
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+            self._insert(
+                cursor=cursor,
+                table=table,
+                columns=", ".join(connection.ops.quote_name(field) for field in fields),
+                rows=rows,
+            )
+
+    def delete(self, instance: Model) -> None:
+        """
+        Remove object from FTS5 index.
+
+        :param instance: model instance
+        :type instance: Model
+        """
+        model: Type[Model] = instance.__class__
+        if not self.is_indexed(model=model):
+
+            return
+
+        table: str = connections[self.using].ops.quote_name(  # noqa: ECE001
+            self.get_table(model=model)
+        )
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+
+    def _get_rows(  # pylint: disable=R0201  # noqa: CCR001
+        self, rows: Iterable[Tuple[Any, ...]]
+    ) -> Iterator[List[Any]]:
+        """
+        Convert values list rows ordered by primary key to index rows.
+
+        Related fields lookups produce one row per related object, so such rows values are joined.
+
+        :param rows: primary keys and search fields values
+        :type rows: Iterable[Tuple[Any, ...]]
+        :yield: index rows
+        :rtype: Iterator[List[Any]]
+        """  # noqa: E501
+        current: Optional[List[Any]] = None
+        for row in rows:
+            values: List[str] = [
+                "" if value is None else str(value) for value in row[1:]
+            ]
+            if current is not None and current[0] == row[0]:
+                current[1:] = [
+                    " ".join(filter(None, pair)) for pair in zip(current[1:], values)
+                ]
+            else:
+                if current is not None:
+                    yield current
+                current = [row[0]] + values
+        if current is not None:
+            yield current
+
+    def _insert(  # pylint: disable=R0201
+        self, cursor: Any, table: str, columns: str, rows: List[List[Any]]
+    ) -> int:
+        """
+        Insert rows into index, first row value is used as row id.
+
+        :param cursor: database cursor
+        :type cursor: Any
+        :param table: quoted table name
+        :type table: str
+        :param columns: quoted columns names
+        :type columns: str
+        :param rows: index rows
+        :type rows: List[List[Any]]
+        :return: inserted rows count
+        :rtype: int
+        """
+        if not rows:
+
+            return 0
+
+        placeholders: str = ", ".join(["%s"] * len(rows[0]))
+        cursor.executemany(
+            f"INSERT INTO {table} (rowid, {columns}) VALUES ({placeholders})",
+            rows,
+        )
+
+        return len(rows)
+
+
+def _get_registered_search_fields() -> Dict[  # noqa: CCR001
+    Type[Model], Tuple[str, ...]
+]:
+    """
+    Get search fields of models registered with read only admins on all admin sites.
+
+    :return: models search fields
+    :rtype: Dict[Type[Model], Tuple[str, ...]]
+    """  # noqa: E501
+    # lazy imports to prevent apps loading problems
+    from django.contrib.admin.sites import all_sites
+
+    from read_only_admin.admin import ReadonlyAdmin
+
+    models: Dict[Type[Model], Dict[str, None]] = {}
+
+    for site in list(all_sites):
+        for model, model_admin in site._registry.items():
+            if isinstance(model_admin, ReadonlyAdmin) and model_admin.search_fields:
+                # same model can be registered on many sites with different fields
+                models.setdefault(model, {}).update(
+                    dict.fromkeys(model_admin.search_fields)
+                )
+
+    return {model: tuple(fields) for model, fields in models.items()}
+
+
+def build_search_registry() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Build indexed models search fields registry.
+
+    :return: models labels and search fields
+    :rtype: Mapping[str, Tuple[str, ...]]
+    """
+    global _search_registry  # pylint: disable=W0603
+
+    # lazy import to prevent circular imports
+    from read_only_admin.signals import connect_signals
+
+    _search_registry = MappingProxyType(
+        {
+            model._meta.label_lower: fields
+            for model, fields in _get_registered_search_fields().items()
+        }
+    )
+    # index update receivers follow registry models
+    connect_signals()
+
+    return _search_registry  # noqa: R504
+
+
+def get_search_registry() -> Mapping[str, Tuple[str, ...]]:
+    """
+    Get indexed models search fields registry.
+
+    :return: models labels and search fields
+    :rtype: Mapping[str, Tuple[str, ...]]
+    """
+    return _search_registry
+
+
+@lru_cache(maxsize=None)
+def get_search_backend() -> Optional[BaseSearchBackend]:
+    """
+    Get configured read only change lists search backend.
+
+    :return: search backend instance
+    :rtype: Optional[BaseSearchBackend]
+    """
+    if not settings.READ_ONLY_ADMIN_SEARCH_BACKEND:
+
+        return None
+
+    return import_string(settings.READ_ONLY_ADMIN_SEARCH_BACKEND)()
+
+
+def update_search_index(
+    sender: Type[Model], instance: Model, **kwargs: Dict[str, Any]
+) -> None:
+    """
+    Update saved object in search index.
+
+    :param sender: signal sender model class
+    :type sender: Type[Model]
+    :param instance: saved object
+    :type instance: Model
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    fields: Optional[Tuple[str, ...]] = _search_registry.get(sender._meta.label_lower)
+    backend: Optional[BaseSearchBackend] = get_search_backend()
+    if fields and backend is not None:
+        backend.update(instance=instance, search_fields=fields)
+
+
+def delete_search_index(
+    sender: Type[Model], instance: Model, **kwargs: Dict[str, Any]
+) -> None:
+    """
+    Remove deleted object from search index.
+
+    :param sender: signal sender model class
+    :type sender: Type[Model]
+    :param instance: deleted object
+    :type instance: Model
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    backend: Optional[BaseSearchBackend] = get_search_backend()
+    if sender._meta.label_lower in _search_registry and backend is not None:
+        backend.delete(instance=instance)
+
+
+@receiver(setting_changed)
+def clear_search_backend(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Clear memoized search backend when search backend setting changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if setting == "READ_ONLY_ADMIN_SEARCH_BACKEND":
+        get_search_backend.cache_clear()
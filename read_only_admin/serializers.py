@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/serializers.py
+
+
+import json
+from typing import Any, Dict, List, Type, Union, Callable, Iterable, Iterator
+
+from django.db.models import Model
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+__all__: List[str] = ["get_values_fields", "dumps", "stream_results"]
+
+
+def get_values_fields(
+    model: Type[Model], fields: Iterable[Union[Callable, str]]  # type: ignore
+) -> List[str]:
+    """
+    Get names of admin fields which can be selected with queryset values, primary key first.
+
+    Admin methods, model properties and many to many fields are skipped.
+
+    :param model: model class
+    :type model: Type[Model]
+    :param fields: admin fields
+    :type fields: Iterable[Union[Callable, str]]
+    :return: fields names
+    :rtype: List[str]
+    """  # noqa: E501
+    concrete: Dict[str, str] = {
+        name: field.name
+        for field in model._meta.concrete_fields
+        for name in [field.name, field.attname]
+    }
+
+    return list(  # noqa: ECE001
+        dict.fromkeys(
+            [model._meta.pk.name]  # type: ignore
+            + [  # noqa: W503
+                concrete[field]
+                for field in fields
+                if isinstance(field, str) and field in concrete
+            ]
+        )
+    )
+
+
+def dumps(data: Any) -> str:
+    """
+    Serialize data to JSON, including dates, decimals and UUIDs.
+
+    :param data: data to serialize
+    :type data: Any
+    :return: JSON
+    :rtype: str
+    """
+    return json.dumps(data, cls=DjangoJSONEncoder)
+
+
+def stream_results(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Serialize rows to JSON document with results list row by row.
+
+    :param rows: rows
+    :type rows: Iterable[Dict[str, Any]]
+    :yield: JSON document parts
+    :rtype: Iterator[str]
+    """
+    yield '{"results": ['
+    for index, row in enumerate(rows):
+        yield f"{',' if index else ''}{dumps(data=row)}"
+    yield "]}"
@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/shared_index.py
+
+
+import os
+import mmap
+import time
+import struct
+import tempfile
+from array import array
+from threading import Lock
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Set, Dict, List, Tuple, Optional, FrozenSet, DefaultDict
+
+from django.db import DatabaseError
+from django.dispatch import receiver
+from django.contrib.auth import get_user_model
+from django.core.signals import setting_changed
+from django.core.exceptions import FieldDoesNotExist
+
+from read_only_admin.conf import settings
+from read_only_admin.cache import get_permissions_generation
+
+
+__all__: List[str] = [
+    "SharedIndex",
+    "build_shared_index",
+    "get_shared_index",
+    "reset_shared_index",
+]
+
+
+MAGIC: bytes = b"ROAI"
+FORMAT_VERSION: int = 1
+# magic, version, generation, users, entries, content types and labels sizes
+HEADER: struct.Struct = struct.Struct("=4sI32sIIII")
+# arrays after header are kept aligned
+HEADER_SIZE: int = 64
+
+_lock: Lock = Lock()
+_index: Optional["SharedIndex"] = None
+_checked: Optional[float] = None
+
+
+class SharedIndex:
+    """
+    Read only memory mapped index of users read only content types, shared by all processes on host.
+
+    File layout is header, sorted users ids, users entries offsets, entries content types ids, content types ids and their labels.
+    """  # noqa: E501
+
+    def __init__(self, path: str) -> None:
+        """
+        Map index file.
+
+        :param path: index file path
+        :type path: str
+        :raises ValueError: not an index file or index file of other format version
+        """  # noqa: E501
+        with open(path, "rb") as index:
+            self.stat: os.stat_result = os.fstat(index.fileno())
+            # mapping stays valid after file is closed or replaced
+            self.buffer: mmap.mmap = mmap.mmap(
+                index.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        if len(self.buffer) < HEADER_SIZE:
+
+            raise ValueError(f"{path} is not read only admin shared index.")
+
+        (
+            magic,
+            version,
+            generation,
+            users,
+            entries,
+            content_types,
+            labels,
+        ) = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+
+            raise ValueError(f"{path} is not read only admin shared index.")
+
+        self.generation: str = generation.decode("ascii")
+        view: memoryview = memoryview(self.buffer)
+        arrays: List[memoryview] = []
+        offset: int = HEADER_SIZE
+        for count, code in [
+            (users, "q"),
+            (users + 1, "I"),
+            (entries, "I"),
+            (content_types, "I"),
+        ]:
+            size: int = count * struct.calcsize(code)
+            arrays.append(view[offset : offset + size].cast(code))  # noqa: E203
+            offset += size
+        if offset + labels > len(self.buffer):
+
+            raise ValueError(f"{path} is truncated.")
+
+        self.users, self.offsets, self.entries, ids = arrays
+        self.content_types: Dict[int, Tuple[str, str]] = dict(  # noqa: ECE001
+            zip(
+                ids,
+                [
+                    tuple(label.split(".", 1))  # type: ignore
+                    for label in bytes(view[offset : offset + labels])  # noqa: E203
+                    .decode("utf-8")
+                    .split("\n")
+                ],
+            )
+        )
+
+    def is_current(self, path: str) -> bool:
+        """
+        Check is mapped file still placed at path.
+
+        :param path: index file path
+        :type path: str
+        :return: is mapped file current
+        :rtype: bool
+        """
+        try:
+            stat: os.stat_result = os.stat(path)
+        except OSError:
+
+            return False
+
+        return (stat.st_dev, stat.st_ino) == (self.stat.st_dev, self.stat.st_ino)
+
+    def get(self, user_id: Any) -> Optional[FrozenSet[Tuple[str, str]]]:
+        """
+        Get content types natural keys of models on which user has read only permission.
+
+        :param user_id: user primary key
+        :type user_id: Any
+        :return: read only content types natural keys, nothing for not integer primary key
+        :rtype: Optional[FrozenSet[Tuple[str, str]]]
+        """  # noqa: E501
+        if not isinstance(user_id, int) or isinstance(user_id, bool):
+
+            return None
+
+        position: int = bisect_left(self.users, user_id)
+        if position == len(self.users) or self.users[position] != user_id:
+
+            return frozenset()
+
+        return frozenset(  # noqa: ECE001
+            self.content_types[content_type]
+            for content_type in self.entries[
+                self.offsets[position] : self.offsets[position + 1]  # noqa: E203
+            ]
+        )
+
+
+def build_shared_index(path: str, generation: str) -> int:  # noqa: CCR001
+    """
+    Build index of users read only content types with three queries and atomically replace index file with it.
+
+    :param path: index file path
+    :type path: str
+    :param generation: users permissions generation token
+    :type generation: str
+    :return: indexed users count
+    :rtype: int
+    :raises ValueError: users primary keys are not integers
+    """  # noqa: E501
+    # lazy import to prevent apps loading problems
+    from django.contrib.contenttypes.models import ContentType
+
+    user_model = get_user_model()
+    prefix: str = f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_"
+    permissions: DefaultDict[Any, Set[int]] = defaultdict(set)
+
+    for name, suffix in [("user_permissions", ""), ("groups", "__permissions")]:
+        field = user_model._meta.get_field(name)
+        source: str = field.m2m_field_name()  # type: ignore
+        related: str = f"{field.m2m_reverse_field_name()}{suffix}"  # type: ignore
+        rows = (  # noqa: ECE001
+            field.remote_field.through.objects.filter(  # type: ignore
+                **{f"{related}__codename__startswith": prefix}
+            )
+            .values_list(source, f"{related}__content_type", f"{related}__codename")
+            .order_by()
+        )
+        for pk, content_type, codename in rows:
+            # field level permissions are resolved by resolver
+            if "__" not in codename[len(prefix) :]:  # noqa: E203
+                permissions[pk].add(content_type)
+
+    if not all(isinstance(pk, int) for pk in permissions):
+
+        raise ValueError(f"{user_model._meta.label} primary key is not integer.")
+
+    labels: Dict[int, str] = {  # noqa: ECE001
+        pk: f"{app_label}.{model}"
+        for pk, app_label, model in ContentType.objects.filter(
+            pk__in={pk for values in permissions.values() for pk in values}
+        ).values_list("pk", "app_label", "model")
+    }
+    users: List[int] = sorted(permissions)
+    offsets: array = array("I", [0])  # type: ignore
+    entries: array = array("I")  # type: ignore
+    for user in users:
+        entries.extend(sorted(permissions[user] & labels.keys()))
+        offsets.append(len(entries))
+    data: bytes = "\n".join(labels.values()).encode("utf-8")
+
+    descriptor, temporary = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), prefix=".read_only_admin-"
+    )  # type: int, str
+    try:
+        with os.fdopen(descriptor, "wb") as index:
+            index.write(
+                HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    generation.encode("ascii"),
+                    len(users),
+                    len(entries),
+                    len(labels),
+                    len(data),
+                ).ljust(HEADER_SIZE, b"\x00")
+            )
+            index.write(array("q", users).tobytes())
+            index.write(offsets.tobytes())
+            index.write(entries.tobytes())
+            index.write(array("I", labels.keys()).tobytes())
+            index.write(data)
+        # readers map either old or new file, never partially written one
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+
+        raise
+
+    return len(users)
+
+
+def _open_shared_index(path: str) -> Optional[SharedIndex]:
+    """
+    Map index file if it's there.
+
+    :param path: index file path
+    :type path: str
+    :return: index, nothing if it's missing or broken
+    :rtype: Optional[SharedIndex]
+    """
+    try:
+
+        return SharedIndex(path=path)
+    except (OSError, ValueError):
+
+        return None
+
+
+def _rebuild_shared_index(path: str, generation: str) -> Optional[SharedIndex]:
+    """
+    Rebuild index file holding inter-process lock, so only one process of host rebuilds it at once.
+
+    :param path: index file path
+    :type path: str
+    :param generation: users permissions generation token
+    :type generation: str
+    :return: index, nothing if other process is rebuilding it or file locks are unavailable
+    :rtype: Optional[SharedIndex]
+    """  # noqa: E501
+    try:
+        # lazy import, file locks are not available on all platforms
+        import fcntl
+    except ImportError:
+        # resolver falls back to its own lookups
+        return None
+
+    with open(f"{path}.lock", "ab") as lock:
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # resolver falls back to its own lookups until index is rebuilt
+            return None
+
+        # other process could rebuild index while lock was awaited
+        index: Optional[SharedIndex] = _open_shared_index(path=path)
+        if index is None or index.generation != generation:
+            build_shared_index(path=path, generation=generation)
+            index = SharedIndex(path=path)
+
+        # lock is released with file closing
+        return index  # noqa: R504
+
+
+def _load_shared_index(  # noqa: CCR001
+    path: str, generation: str
+) -> Optional[SharedIndex]:
+    """
+    Map index file of given generation, rebuild it if it's missing or outdated.
+
+    :param path: index file path
+    :type path: str
+    :param generation: users permissions generation token
+    :type generation: str
+    :return: index
+    :rtype: Optional[SharedIndex]
+    """
+    if (
+        _index is not None
+        and _index.generation == generation  # noqa: W503
+        and _index.is_current(path=path)  # noqa: W503
+    ):
+
+        return _index
+
+    index: Optional[SharedIndex] = _open_shared_index(path=path)
+    if index is None or index.generation != generation:
+        try:
+            index = _rebuild_shared_index(path=path, generation=generation)
+        except (OSError, ValueError, DatabaseError, FieldDoesNotExist):
+            # resolver falls back to its own lookups
+            return None
+
+    return index if index is not None and index.generation == generation else None
+
+
+def get_shared_index() -> Optional[SharedIndex]:
+    """
+    Get index of current users permissions generation, generation is checked once per check interval.
+
+    :return: index, nothing if it's disabled or can't be built
+    :rtype: Optional[SharedIndex]
+    """  # noqa: E501
+    global _index, _checked  # pylint: disable=W0603
+
+    path: Optional[str] = settings.READ_ONLY_ADMIN_SHARED_INDEX
+    if path is None:
+
+        return None
+
+    if (
+        _checked is not None
+        and time.monotonic() - _checked  # noqa: W503
+        < settings.READ_ONLY_ADMIN_SHARED_INDEX_CHECK_INTERVAL  # noqa: W503
+    ):
+
+        return _index  # noqa: R504
+
+    with _lock:
+        generation: str = get_permissions_generation()
+        # without shared cache index can't be invalidated
+        _index = (
+            _load_shared_index(path=path, generation=generation) if generation else None
+        )
+        _checked = time.monotonic()
+
+    return _index  # noqa: R504
+
+
+@receiver(setting_changed)
+def reset_shared_index(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Forget mapped index when shared index settings changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    global _index, _checked  # pylint: disable=W0603
+
+    if setting.startswith("READ_ONLY_ADMIN_SHARED_INDEX"):
+        _index = None
+        _checked = None
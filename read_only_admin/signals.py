@@ -4,20 +4,45 @@
 # read_only_admin/signals.py
 
 
-from typing import List, Iterable, Optional
+from typing import Any, Set, Dict, List, Type, Tuple, Callable, Iterable, Optional
 
-from django.apps import AppConfig
+from django.dispatch import receiver
+from django.db.models import Model, signals
 from django.db.utils import DEFAULT_DB_ALIAS
-from django.contrib.auth.models import Permission
-from django.contrib.contenttypes.models import ContentType
+from django.core.signals import setting_changed
+from django.apps import AppConfig, apps as registry
 
+from read_only_admin.conf import settings
+from read_only_admin.cache import (
+    bump_model_version,
+    get_permissions_models,
+    bump_permissions_generation,
+    is_permissions_generation_used,
+)
 from read_only_admin.utils import (
     get_read_only_permission_name,
     get_read_only_permission_codename,
+    get_read_only_field_permission_name,
+    get_read_only_field_permission_codename,
 )
 
 
-__all__: List[str] = ["add_readonly_permissions"]
+__all__: List[str] = [
+    "add_readonly_permissions",
+    "register_versioned_model",
+    "connect_signals",
+    "reconnect_signals",
+]
+
+
+DATA_SIGNALS: Tuple[signals.ModelSignal, ...] = (
+    signals.post_save,
+    signals.post_delete,
+    signals.m2m_changed,
+)
+
+_versioned_models: Set[Type[Model]] = set()
+_connected: Set[Tuple[signals.ModelSignal, Callable[..., None], Type[Model]]] = set()
 
 
 def add_readonly_permissions(  # noqa: CFQ002
@@ -34,6 +59,8 @@ def add_readonly_permissions(  # noqa: CFQ002
     """
     This migrate hooks takes care of adding a read only permission to all of your content types.
 
+    Read only fields permissions are added for models configured in READ_ONLY_ADMIN_FIELD_PERMISSIONS.
+
     Get from: https://github.com/anupamshakya7/django-admin-hack/.
 
     :param sender: installed application config instance
@@ -55,9 +82,132 @@ def add_readonly_permissions(  # noqa: CFQ002
     :param kwargs: additional arguments
     :type kwargs: dict
     """  # noqa: E501
-    for content_type in ContentType.objects.all():
-        Permission.objects.get_or_create(
+    # lazy imports to keep application loading cheap
+    from django.contrib.auth.models import Permission
+    from django.contrib.contenttypes.models import ContentType
+
+    permissions: Dict[str, List[str]] = settings.READ_ONLY_ADMIN_FIELD_PERMISSIONS
+    fields: Dict[str, List[str]] = {
+        label.lower(): names for label, names in permissions.items()
+    }
+
+    for content_type in ContentType.objects.using(using).all():
+        Permission.objects.using(using).get_or_create(
             content_type=content_type,
             codename=get_read_only_permission_codename(model=content_type.model),
             name=get_read_only_permission_name(model=content_type.model),
         )
+        # field level permissions only for opt-in models sensitive fields
+        for field in fields.get(f"{content_type.app_label}.{content_type.model}", []):
+            Permission.objects.using(using).get_or_create(
+                content_type=content_type,
+                codename=get_read_only_field_permission_codename(
+                    model=content_type.model, field=field
+                ),
+                name=get_read_only_field_permission_name(
+                    model=content_type.model, field=field
+                ),
+            )
+
+
+def _get_related_models(model: Type[Model]) -> Set[Type[Model]]:
+    """
+    Get models related by model own relations fields and many to many relations intermediate models.
+
+    :param model: model class
+    :type model: Type[Model]
+    :return: related models
+    :rtype: Set[Type[Model]]
+    """  # noqa: E501
+    fields: List[Any] = [
+        field
+        for field in model._meta.get_fields()
+        if field.is_relation and not field.auto_created
+    ]
+
+    return {
+        field.related_model for field in fields if isinstance(field.related_model, type)
+    } | {field.remote_field.through for field in fields if field.many_to_many}
+
+
+def register_versioned_model(model: Type[Model]) -> None:
+    """
+    Track data changes of read only admin model and it's related models for cached filters choices.
+
+    :param model: read only admin model class
+    :type model: Type[Model]
+    """  # noqa: E501
+    models: Set[Type[Model]] = {model, *_get_related_models(model=model)}
+    if models - _versioned_models:
+        _versioned_models.update(models)
+        connect_signals()
+
+
+def _get_receivers() -> Set[
+    Tuple[signals.ModelSignal, Callable[..., None], Type[Model]]
+]:  # noqa: E501
+    """
+    Get data change receivers of enabled features with their senders.
+
+    :return: signals, receivers and senders
+    :rtype: Set[Tuple[signals.ModelSignal, Callable[..., None], Type[Model]]]
+    """
+    # lazy import to prevent circular imports
+    from read_only_admin.search import (
+        delete_search_index,
+        get_search_registry,
+        update_search_index,
+    )
+
+    receivers: Set[Tuple[signals.ModelSignal, Callable[..., None], Type[Model]]] = set()
+    if settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT is not None:
+        receivers.update(
+            (signal, bump_model_version, model)
+            for model in _versioned_models
+            for signal in DATA_SIGNALS
+        )
+    if settings.READ_ONLY_ADMIN_SEARCH_BACKEND is not None:
+        for label in get_search_registry():
+            model: Type[Model] = registry.get_model(label)
+            receivers.add((signals.post_save, update_search_index, model))
+            receivers.add((signals.post_delete, delete_search_index, model))
+    if is_permissions_generation_used():
+        receivers.update(
+            (signal, bump_permissions_generation, model)
+            for model in get_permissions_models()
+            for signal in DATA_SIGNALS
+        )
+
+    return receivers
+
+
+def connect_signals() -> None:
+    """Connect data change receivers of enabled features to their senders only, receivers without sender would disable fast deletes of all models."""  # noqa: E501
+    receivers: Set[
+        Tuple[signals.ModelSignal, Callable[..., None], Type[Model]]
+    ] = _get_receivers()
+
+    for signal, handler, sender in _connected - receivers:
+        signal.disconnect(handler, sender=sender)
+    for signal, handler, sender in receivers - _connected:
+        signal.connect(handler, sender=sender)
+    _connected.clear()
+    _connected.update(receivers)
+
+
+@receiver(setting_changed)
+def reconnect_signals(sender: Any, setting: str, **kwargs: Dict[str, Any]) -> None:
+    """
+    Reconnect data change receivers when features settings changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if registry.ready and (
+        setting.startswith("READ_ONLY_ADMIN_") or setting == "AUTHENTICATION_BACKENDS"
+    ):
+        connect_signals()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/sites.py
+
+
+from functools import lru_cache
+from typing import Any, Dict, List, Type, Tuple, Union, Iterable, Optional
+
+from django.db.models import Model
+from django.http import HttpRequest
+from django.contrib.admin import AdminSite, ModelAdmin
+from django.contrib.admin.options import InlineModelAdmin
+
+from read_only_admin.admin import ReadonlyAdmin, ReadonlyInline
+from read_only_admin.resolver import get_read_only_content_types
+
+
+__all__: List[str] = [
+    "get_readonly_admin_class",
+    "get_readonly_inline_class",
+    "ReadonlyAdminSiteMixin",
+    "ReadonlyAdminSite",
+    "wrap_admin_site",
+]
+
+
+ADMIN_CLASS_TEMPLATES: Tuple[str, ...] = (
+    "change_list_template",
+    "change_form_template",
+)
+
+
+@lru_cache(maxsize=None)
+def get_readonly_inline_class(
+    inline_class: Type[InlineModelAdmin],  # type: ignore
+) -> Type[ReadonlyInline]:
+    """
+    Get read only version of inline class, generated classes are cached.
+
+    :param inline_class: inline class
+    :type inline_class: Type[InlineModelAdmin]
+    :return: read only inline class
+    :rtype: Type[ReadonlyInline]
+    """
+    if issubclass(inline_class, ReadonlyInline):
+
+        return inline_class
+
+    return type(
+        f"Readonly{inline_class.__name__}",
+        (ReadonlyInline, inline_class),
+        {
+            "__module__": inline_class.__module__,
+            # keep original stacked or tabular template
+            "template": inline_class.template,
+        },
+    )
+
+
+@lru_cache(maxsize=None)
+def get_readonly_admin_class(
+    admin_class: Type[ModelAdmin],  # type: ignore
+) -> Type[ReadonlyAdmin]:
+    """
+    Get read only version of admin class and it's inlines, generated classes are cached.
+
+    Admin class own change list and change form templates and change list class are kept.
+
+    :param admin_class: admin class
+    :type admin_class: Type[ModelAdmin]
+    :return: read only admin class
+    :rtype: Type[ReadonlyAdmin]
+    """  # noqa: E501
+    if issubclass(admin_class, ReadonlyAdmin):
+
+        return admin_class
+
+    attrs: Dict[str, Any] = {
+        "__module__": admin_class.__module__,
+        "inlines": [
+            get_readonly_inline_class(inline_class=inline)  # type: ignore
+            for inline in admin_class.inlines
+        ],
+    }
+    # keep admin class own templates and change list class
+    for name in ADMIN_CLASS_TEMPLATES:
+        if getattr(admin_class, name) is not None:
+            attrs[name] = getattr(admin_class, name)
+    if admin_class.get_changelist is not ModelAdmin.get_changelist:
+        attrs["get_changelist"] = admin_class.get_changelist
+
+    return type(f"Readonly{admin_class.__name__}", (ReadonlyAdmin, admin_class), attrs)
+
+
+class ReadonlyAdminSiteMixin:
+    """Admin site mixin adding read only behavior to all registered admins and resolving read only status of all registered models in one pass."""  # noqa: E501
+
+    def register(
+        self,
+        model_or_iterable: Union[Type[Model], Iterable[Type[Model]]],
+        admin_class: Optional[Type[ModelAdmin]] = None,  # type: ignore
+        **options: Dict[str, Any],
+    ) -> None:
+        """
+        Overridden to register read only version of admin class.
+
+        :param model_or_iterable: model or models
+        :type model_or_iterable: Union[Type[Model], Iterable[Type[Model]]]
+        :param admin_class: admin class
+        :type admin_class: Optional[Type[ModelAdmin]]
+        :param options: admin class options
+        :type options: Dict[str, Any]
+        """
+        readonly_admin_class: Type[ReadonlyAdmin] = get_readonly_admin_class(
+            admin_class=admin_class or ModelAdmin  # type: ignore
+        )
+        super(ReadonlyAdminSiteMixin, self).register(  # type: ignore
+            model_or_iterable, readonly_admin_class, **options
+        )
+
+    def _build_app_dict(
+        self, request: HttpRequest, label: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Overridden to resolve user permissions once before building index or app list.
+
+        Read only admins then return view only models permissions without any per model checks.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param label: application label
+        :type label: Optional[str]
+        :return: applications dict
+        :rtype: Dict[str, Any]
+        """  # noqa: E501
+        get_read_only_content_types(user=request.user)
+
+        return super(ReadonlyAdminSiteMixin, self)._build_app_dict(  # type: ignore
+            request=request, label=label
+        )
+
+
+class ReadonlyAdminSite(ReadonlyAdminSiteMixin, AdminSite):
+    """Read only aware admin site."""
+
+    ...
+
+
+@lru_cache(maxsize=None)
+def _get_readonly_site_class(site_class: Type[AdminSite]) -> Type[AdminSite]:
+    """
+    Get read only version of admin site class, generated classes are cached.
+
+    :param site_class: admin site class
+    :type site_class: Type[AdminSite]
+    :return: read only admin site class
+    :rtype: Type[AdminSite]
+    """
+    if issubclass(site_class, ReadonlyAdminSiteMixin):
+
+        return site_class
+
+    return type(
+        f"Readonly{site_class.__name__}",
+        (ReadonlyAdminSiteMixin, site_class),
+        {"__module__": site_class.__module__},
+    )
+
+
+def wrap_admin_site(site: AdminSite) -> AdminSite:
+    """
+    Add read only behavior to already registered and future registered admins of existing admin site.
+
+    :param site: admin site
+    :type site: AdminSite
+    :return: same admin site
+    :rtype: AdminSite
+    """  # noqa: E501
+    site.__class__ = _get_readonly_site_class(site_class=site.__class__)  # type: ignore
+
+    for model, model_admin in list(site._registry.items()):
+        site._registry[model] = get_readonly_admin_class(
+            admin_class=model_admin.__class__  # type: ignore
+        )(model, site)
+
+    return site
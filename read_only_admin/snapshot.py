@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/snapshot.py
+
+
+from typing import Any, Dict, List, Tuple, Optional, FrozenSet
+
+from django.core import signing
+
+from read_only_admin.registry import get_field_index
+from read_only_admin.cache import get_permissions_generation
+from read_only_admin.resolver import (
+    READ_ONLY_CACHE_ATTRIBUTE,
+    READ_ONLY_FIELDS_CACHE_ATTRIBUTE,
+)
+
+
+__all__: List[str] = [
+    "SESSION_KEY",
+    "dumps_snapshot",
+    "loads_snapshot",
+    "restore_snapshot",
+    "save_snapshot",
+]
+
+
+SESSION_KEY: str = "_read_only_admin_snapshot"
+SNAPSHOT_SALT: str = "read_only_admin.snapshot"
+
+
+def _dumps_masks(masks: Dict[Tuple[str, str], int]) -> Dict[str, List[str]]:
+    """
+    Convert read only fields masks to fields names, so snapshot doesn't depend on fields index order.
+
+    :param masks: read only fields masks
+    :type masks: Dict[Tuple[str, str], int]
+    :return: read only fields names
+    :rtype: Dict[str, List[str]]
+    """  # noqa: E501
+    fields: Dict[str, List[str]] = {}
+    for natural_key, mask in masks.items():
+        label: str = ".".join(natural_key)
+        fields[label] = [
+            field
+            for bit, field in enumerate(get_field_index(label=label))
+            if mask >> bit & 1
+        ]
+
+    return fields
+
+
+def _loads_masks(fields: Dict[str, List[str]]) -> Dict[Tuple[str, str], int]:
+    """
+    Convert read only fields names to masks of current fields index.
+
+    :param fields: read only fields names
+    :type fields: Dict[str, List[str]]
+    :return: read only fields masks
+    :rtype: Dict[Tuple[str, str], int]
+    """
+    masks: Dict[Tuple[str, str], int] = {}
+    for label, names in fields.items():
+        index: Tuple[str, ...] = get_field_index(label=label)
+        masks[tuple(label.split(".", 1))] = sum(  # type: ignore  # noqa: ECE001
+            1 << index.index(name) for name in names if name in index
+        )
+
+    return masks
+
+
+def dumps_snapshot(
+    user: Any,
+    content_types: FrozenSet[Tuple[str, str]],
+    generation: str,
+    masks: Optional[Dict[Tuple[str, str], int]] = None,
+) -> str:
+    """
+    Create compact signed snapshot of user read only content types and fields.
+
+    :param user: user object
+    :type user: Any
+    :param content_types: read only content types natural keys
+    :type content_types: FrozenSet[Tuple[str, str]]
+    :param generation: users permissions generation token
+    :type generation: str
+    :param masks: read only fields masks, if they were resolved
+    :type masks: Optional[Dict[Tuple[str, str], int]]
+    :return: signed snapshot
+    :rtype: str
+    """
+    data: Dict[str, Any] = {  # noqa: ECE001
+        "u": str(user.pk),
+        "g": generation,
+        "m": sorted(f"{app_label}.{model}" for app_label, model in content_types),
+    }
+    if masks is not None:
+        data["f"] = _dumps_masks(masks=masks)
+
+    return signing.dumps(data, salt=SNAPSHOT_SALT, compress=True)
+
+
+def _loads(user: Any, value: str, generation: str) -> Optional[Dict[str, Any]]:
+    """
+    Get snapshot data if it's valid.
+
+    :param user: user object
+    :type user: Any
+    :param value: signed snapshot
+    :type value: str
+    :param generation: current users permissions generation token
+    :type generation: str
+    :return: snapshot data
+    :rtype: Optional[Dict[str, Any]]
+    """
+    try:
+        data: Dict[str, Any] = signing.loads(value, salt=SNAPSHOT_SALT)
+    except signing.BadSignature:
+
+        return None
+
+    if data.get("u") != str(user.pk) or data.get("g") != generation:
+
+        return None
+
+    return data
+
+
+def _get_content_types(data: Dict[str, Any]) -> FrozenSet[Tuple[str, str]]:
+    """
+    Get read only content types from snapshot data.
+
+    :param data: snapshot data
+    :type data: Dict[str, Any]
+    :return: read only content types natural keys
+    :rtype: FrozenSet[Tuple[str, str]]
+    """
+    return frozenset(
+        tuple(label.split(".", 1)) for label in data.get("m", [])  # type: ignore
+    )
+
+
+def loads_snapshot(
+    user: Any, value: str, generation: str
+) -> Optional[FrozenSet[Tuple[str, str]]]:
+    """
+    Get user read only content types from signed snapshot if it's valid.
+
+    :param user: user object
+    :type user: Any
+    :param value: signed snapshot
+    :type value: str
+    :param generation: current users permissions generation token
+    :type generation: str
+    :return: read only content types natural keys
+    :rtype: Optional[FrozenSet[Tuple[str, str]]]
+    """
+    data: Optional[Dict[str, Any]] = _loads(
+        user=user, value=value, generation=generation
+    )
+
+    return _get_content_types(data=data) if data is not None else None
+
+
+def restore_snapshot(request: Any) -> bool:
+    """
+    Prime resolver cache on request user from session snapshot.
+
+    :param request: django HTTP request object
+    :type request: Any
+    :return: is snapshot restored
+    :rtype: bool
+    """
+    value: Optional[str] = request.session.get(SESSION_KEY)
+    if not value:
+
+        return False
+
+    data: Optional[Dict[str, Any]] = _loads(
+        user=request.user, value=value, generation=get_permissions_generation()
+    )
+    if data is None:
+
+        return False
+
+    setattr(request.user, READ_ONLY_CACHE_ATTRIBUTE, _get_content_types(data=data))
+    # without masks in snapshot they are resolved on demand
+    if "f" in data:
+        setattr(
+            request.user,
+            READ_ONLY_FIELDS_CACHE_ATTRIBUTE,
+            _loads_masks(fields=data["f"]),
+        )
+
+    return True
+
+
+def save_snapshot(request: Any) -> bool:
+    """
+    Store request user read only content types and fields in session if resolver computed them.
+
+    :param request: django HTTP request object
+    :type request: Any
+    :return: is snapshot saved
+    :rtype: bool
+    """  # noqa: E501
+    content_types: Optional[FrozenSet[Tuple[str, str]]] = getattr(
+        request.user, READ_ONLY_CACHE_ATTRIBUTE, None
+    )
+    if content_types is None:
+
+        return False
+
+    request.session[SESSION_KEY] = dumps_snapshot(
+        user=request.user,
+        content_types=content_types,
+        generation=get_permissions_generation(),
+        masks=getattr(request.user, READ_ONLY_FIELDS_CACHE_ATTRIBUTE, None),
+    )
+
+    return True
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# read_only_admin/streaming.py
+
+
+from contextlib import ExitStack
+from itertools import chain, cycle, repeat
+from typing import Any, List, Iterable, Iterator
+
+from django.db.models import Model, QuerySet
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.admin.templatetags.admin_list import items_for_result
+
+from read_only_admin.conf import settings
+
+
+__all__: List[str] = [
+    "STREAMING_MARKER",
+    "is_streaming",
+    "get_rows_separators",
+    "stream_changelist",
+    "StreamedResultList",
+    "ClosingIterator",
+]
+
+
+# rendered as the only change list row, page is split around it
+STREAMING_MARKER: str = "<!-- read-only-admin-streaming-rows -->"
+
+
+def is_streaming(cl: ChangeList) -> bool:
+    """
+    Check can change list rows be streamed: read only not editable show all change list.
+
+    :param cl: change list
+    :type cl: ChangeList
+    :return: can change list rows be streamed
+    :rtype: bool
+    """  # noqa: E501
+    return bool(
+        settings.READ_ONLY_ADMIN_STREAMING
+        and getattr(cl, "readonly", False)  # noqa: W503
+        and cl.show_all  # noqa: W503
+        and cl.can_show_all  # noqa: W503
+        and getattr(cl, "formset", None) is None  # noqa: W503
+        and cl.result_count  # noqa: W503
+    )
+
+
+def get_rows_separators(header: str) -> Iterator[str]:
+    """
+    Get separators put before rows, striped like marker row if results template stripes rows (django < 3.1 uses row1 and row2 classes).
+
+    :param header: change list page part before marker
+    :type header: str
+    :return: separators, first row is opened by marker row tag
+    :rtype: Iterator[str]
+    """  # noqa: E501
+    if 'class="row1"' not in header[header.rfind("<tr") :]:  # noqa: E203
+
+        return chain([""], repeat("</tr>\n<tr>"))
+
+    return chain([""], cycle(['</tr>\n<tr class="row2">', '</tr>\n<tr class="row1">']))
+
+
+def stream_changelist(cl: ChangeList, content: str) -> Iterator[str]:
+    """
+    Stream change list page rendered with marker row, replacing marker by rows rendered in chunks.
+
+    :param cl: change list
+    :type cl: ChangeList
+    :param content: change list page rendered with marker row
+    :type content: str
+    :yield: page parts
+    :rtype: Iterator[str]
+    """  # noqa: E501
+    header, marker, footer = content.partition(  # pylint: disable=W0612
+        STREAMING_MARKER
+    )  # type: str, str, str
+    chunk_size: int = settings.READ_ONLY_ADMIN_STREAMING_CHUNK_SIZE
+    # marker is rendered inside first row tags, so only rows between them are needed
+    separators: Iterator[str] = get_rows_separators(header=header)
+    rows: List[str] = []
+    yield header
+
+    for obj, separator in zip(
+        cl.result_list.iterator(chunk_size=chunk_size), separators
+    ):
+        rows.append(separator + "".join(items_for_result(cl, obj, None)))
+        if len(rows) == chunk_size:
+            yield "".join(rows)
+            rows = []
+    if rows:
+        yield "".join(rows)
+    yield footer
+
+
+class StreamedResultList:
+    """Streamed change list results, never loaded at once: length is results count and iteration doesn't fill queryset cache."""  # noqa: E501
+
+    def __init__(self, queryset: QuerySet, count: int) -> None:  # type: ignore
+        """
+        Remember results queryset and count.
+
+        :param queryset: change list results queryset
+        :type queryset: QuerySet
+        :param count: change list results count
+        :type count: int
+        """
+        self.queryset: QuerySet = queryset  # type: ignore
+        self.count: int = count
+
+    def __len__(self) -> int:
+        """
+        Get results count without loading results.
+
+        :return: results count
+        :rtype: int
+        """
+        return self.count
+
+    def __iter__(self) -> Iterator[Model]:
+        """
+        Iterate results without caching them.
+
+        :return: results iterator
+        :rtype: Iterator[Model]
+        """
+        return self.queryset.iterator()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Delegate other attributes to results queryset.
+
+        :param name: attribute name
+        :type name: str
+        :return: queryset attribute
+        :rtype: Any
+        """
+        return getattr(self.queryset, name)
+
+
+class ClosingIterator:
+    """Streamed response content closing contexts after it's consumed or response is closed, even if it was never iterated."""  # noqa: E501
+
+    def __init__(self, iterator: Iterable[Any], stack: ExitStack) -> None:
+        """
+        Remember content and contexts.
+
+        :param iterator: streamed response content
+        :type iterator: Iterable[Any]
+        :param stack: contexts to close
+        :type stack: ExitStack
+        """
+        self.iterator: Iterator[Any] = iter(iterator)
+        self.stack: ExitStack = stack
+
+    def __iter__(self) -> "ClosingIterator":
+        """
+        Get iterator.
+
+        :return: iterator
+        :rtype: ClosingIterator
+        """
+        return self
+
+    def __next__(self) -> Any:
+        """
+        Get next content part.
+
+        :return: content part
+        :rtype: Any
+        """
+        try:
+
+            return next(self.iterator)
+        except StopIteration:
+            self.close()
+
+            raise
+
+    def close(self) -> None:
+        """Close content and contexts."""
+        try:
+            if hasattr(self.iterator, "close"):
+                self.iterator.close()  # type: ignore
+        finally:
+            self.stack.close()
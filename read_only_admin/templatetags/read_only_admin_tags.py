@@ -4,15 +4,41 @@
 # read_only_admin/templatetags/read_only_admin_tags.py
 
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
+from django.template.base import Token, Parser
+from django.utils.translation import get_language
+from django.contrib.admin.views.main import ChangeList
+from django.utils.timezone import get_current_timezone_name
 from django.template import Context, Library, RequestContext
 from django.contrib.admin.templatetags.admin_modify import submit_row
+from django.contrib.admin.templatetags.base import InclusionAdminNode
+from django.contrib.admin.templatetags.admin_list import (
+    ResultList,
+    result_list,
+    date_hierarchy,
+    result_headers,
+    items_for_result,
+)
 
-from read_only_admin.utils import get_read_only_permission_codename
+from read_only_admin.conf import settings
+from read_only_admin.resolver import is_read_only
+from read_only_admin.filters import get_cache_scope
+from read_only_admin.streaming import STREAMING_MARKER
+from read_only_admin.cache import make_key, get_cache, get_model_version
 
 
-__all__: List[str] = ["unescape", "readonly_submit_row"]
+__all__: List[str] = [
+    "unescape",
+    "readonly_submit_row",
+    "readonly_date_hierarchy",
+    "readonly_date_hierarchy_tag",
+    "cached_results",
+    "readonly_result_list",
+    "readonly_result_list_tag",
+]
 
 
 register = Library()
@@ -57,27 +83,198 @@ def readonly_submit_row(context: RequestContext) -> Context:
     :rtype: Context
     """  # noqa: E501
     ctx: Context = submit_row(context=context)
-    app, separator, model = context["opts"].partition(  # pylint: disable=W0612
-        "."
-    )  # type: str, str, str
-    user = context["request"].user
-
-    for permission in user.get_all_permissions():
-        head, sep, tail = permission.partition(  # pylint: disable=W0612
-            "."
-        )  # type: str, str, str
-        if get_read_only_permission_codename(model=model) == tail and (
-            user.has_perm(permission) and not user.is_superuser
-        ):
-            ctx.update(
-                {
-                    "show_delete_link": False,
-                    "show_save_and_add_another": False,
-                    "show_save_and_continue": False,
-                    "show_save": False,
-                }
-            )
-
-            return ctx
+
+    # "opts" can be model options or "app_label.model_name" string
+    if is_read_only(user=context["request"].user, model=str(context["opts"])):
+        ctx.update(
+            {
+                "show_delete_link": False,
+                "show_save_and_add_another": False,
+                "show_save_and_continue": False,
+                "show_save": False,
+            }
+        )
 
     return ctx
+
+
+def readonly_date_hierarchy(
+    context: RequestContext, cl: ChangeList
+) -> Optional[Dict[str, Any]]:
+    """
+    Date hierarchy with cached buckets for read only change lists if enabled.
+
+    :param context: template context
+    :type context: RequestContext
+    :param cl: change list
+    :type cl: ChangeList
+    :return: date hierarchy context
+    :rtype: Optional[Dict[str, Any]]
+    """
+    if settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT is None or not getattr(
+        cl, "readonly", False
+    ):
+
+        return date_hierarchy(cl)
+
+    key: str = make_key(
+        "date_hierarchy",
+        cl.model._meta.label_lower,
+        cl.date_hierarchy,
+        cl.get_query_string(),
+        get_language(),
+        get_current_timezone_name(),
+        get_cache_scope(model_admin=cl.model_admin, request=context["request"]),
+        get_model_version(model=cl.model),
+    )
+
+    return get_cache().get_or_set(
+        key,
+        lambda: date_hierarchy(cl),
+        settings.READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT,
+    )
+
+
+@register.tag(name="readonly_date_hierarchy")
+def readonly_date_hierarchy_tag(parser: Parser, token: Token) -> InclusionAdminNode:
+    """
+    Read only date hierarchy templatetag, admin templates overrides are respected.
+
+    :param parser: template parser
+    :type parser: Parser
+    :param token: template token
+    :type token: Token
+    :return: template node
+    :rtype: InclusionAdminNode
+    """
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=readonly_date_hierarchy,
+        template_name="date_hierarchy.html",
+        takes_context=True,
+    )
+
+
+def cached_results(cl: ChangeList) -> List[ResultList]:
+    """
+    Read only change list rows, rendered only for objects missing in cache.
+
+    Rows are cached by model, object primary key and version field value, admin columns, links, preserved filters, language and time zone.
+
+    :param cl: change list
+    :type cl: ChangeList
+    :return: change list rows
+    :rtype: List[ResultList]
+    """  # noqa: E501
+    field: str = cl.model_admin.row_cache_version_field  # type: ignore
+    signature: List[Any] = [  # noqa: ECE001
+        cl.model_admin.admin_site.name,
+        f"{cl.model_admin.__module__}.{cl.model_admin.__class__.__qualname__}",
+        [getattr(column, "__qualname__", column) for column in cl.list_display],
+        [
+            getattr(column, "__qualname__", column)
+            for column in cl.list_display_links or []
+        ],
+        cl.preserved_filters,
+        cl.is_popup,
+        cl.to_field,
+        get_language(),
+        get_current_timezone_name(),
+    ]
+    keys: Dict[str, Any] = {  # noqa: ECE001
+        make_key(
+            "row",
+            cl.model._meta.label_lower,
+            result.pk,
+            getattr(result, field),
+            *signature,
+        ): result
+        for result in cl.result_list
+    }
+    rows: Dict[str, List[str]] = get_cache().get_many(list(keys))
+    missing: Dict[str, List[str]] = {
+        key: [str(item) for item in items_for_result(cl, result, None)]
+        for key, result in keys.items()
+        if key not in rows
+    }
+    if missing:
+        get_cache().set_many(missing, settings.READ_ONLY_ADMIN_ROW_CACHE_TIMEOUT)
+        rows.update(missing)
+
+    return [
+        ResultList(None, [mark_safe(item) for item in rows[key]])  # nosec
+        for key in keys
+    ]
+
+
+def readonly_result_list(cl: ChangeList) -> Dict[str, Any]:  # noqa: CCR001
+    """
+    Change list results with reasons why read only change list columns are not sortable.
+
+    Streamed change list rows are replaced by marker row and read only change list rows are cached if admin has version field.
+
+    :param cl: change list
+    :type cl: ChangeList
+    :return: change list results context
+    :rtype: Dict[str, Any]
+    """  # noqa: E501
+    streaming: bool = getattr(cl, "streaming", False)
+    cached: bool = bool(
+        getattr(cl, "readonly", False)
+        and getattr(cl, "formset", None) is None  # noqa: W503
+        and getattr(cl.model_admin, "row_cache_version_field", None)  # noqa: W503
+    )
+    if streaming or cached:
+        headers: List[Dict[str, Any]] = list(result_headers(cl))
+        ctx: Dict[str, Any] = {  # noqa: ECE001
+            "cl": cl,
+            "result_hidden_fields": [],
+            "result_headers": headers,
+            "num_sorted_fields": len(
+                [
+                    header
+                    for header in headers
+                    if header["sortable"] and header["sorted"]
+                ]
+            ),
+            # streamed rows are rendered later instead of marker row
+            "results": [ResultList(None, [mark_safe(STREAMING_MARKER)])]  # nosec
+            if streaming
+            else cached_results(cl),
+        }
+    else:
+        ctx = result_list(cl)
+    reasons: Dict[Any, str] = getattr(cl, "unsortable_reasons", {})
+
+    if reasons:
+        for field_name, header in zip(cl.list_display, ctx["result_headers"]):
+            if not header["sortable"] and field_name in reasons:
+                header["class_attrib"] = format_html(
+                    '{} title="{}"',  # noqa: FS003
+                    header["class_attrib"],
+                    reasons[field_name],
+                )
+
+    return ctx
+
+
+@register.tag(name="readonly_result_list")
+def readonly_result_list_tag(parser: Parser, token: Token) -> InclusionAdminNode:
+    """
+    Read only change list results templatetag, admin templates overrides are respected.
+
+    :param parser: template parser
+    :type parser: Parser
+    :param token: template token
+    :type token: Token
+    :return: template node
+    :rtype: InclusionAdminNode
+    """  # noqa: E501
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=readonly_result_list,
+        template_name="change_list_results.html",
+        takes_context=False,
+    )
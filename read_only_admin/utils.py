@@ -4,7 +4,14 @@
 # read_only_admin/utils.py
 
 
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from django.template import engines
+from django.dispatch import receiver
+from django.core.signals import setting_changed
+from django.template.backends.django import DjangoTemplates
+from django.template.exceptions import TemplateDoesNotExist
 
 from read_only_admin.conf import settings
 
@@ -12,9 +19,26 @@ from read_only_admin.conf import settings
 __all__: List[str] = [
     "get_read_only_permission_codename",
     "get_read_only_permission_name",
+    "get_read_only_field_permission_codename",
+    "get_read_only_field_permission_name",
+    "clear_permission_caches",
+    "warm_up_templates",
 ]
 
 
+WARM_UP_TEMPLATES: Tuple[str, ...] = (
+    "read_only_admin/change_form.html",
+    "read_only_admin/change_list.html",
+    "read_only_admin/includes/fieldset.html",
+    "admin/pagination.html",
+    "admin/change_form.html",
+    "admin/change_list.html",
+    "admin/base_site.html",
+    "admin/base.html",
+)
+
+
+@lru_cache(maxsize=None)
 def get_read_only_permission_codename(model: str) -> str:
     """
     Create read only permission code name.
@@ -27,6 +51,7 @@ def get_read_only_permission_codename(model: str) -> str:
     return f"{settings.READ_ONLY_ADMIN_PERMISSION_PREFIX}_{model}"
 
 
+@lru_cache(maxsize=None)
 def get_read_only_permission_name(model: str) -> str:
     """
     Create read only permission human readable name.
@@ -37,3 +62,82 @@ def get_read_only_permission_name(model: str) -> str:
     :rtype: str
     """
     return f"{settings.READ_ONLY_ADMIN_PERMISSION_NAME_PREFIX.capitalize()} {model}"
+
+
+@lru_cache(maxsize=None)
+def get_read_only_field_permission_codename(model: str, field: str) -> str:
+    """
+    Create read only field permission code name.
+
+    Model and field names are separated by double underscore which can't be used in them.
+
+    :param model: model name
+    :type model: str
+    :param field: field name
+    :type field: str
+    :return: read only field permission code name
+    :rtype: str
+    """  # noqa: E501
+    return f"{get_read_only_permission_codename(model=model)}__{field}"
+
+
+@lru_cache(maxsize=None)
+def get_read_only_field_permission_name(model: str, field: str) -> str:
+    """
+    Create read only field permission human readable name.
+
+    :param model: model name
+    :type model: str
+    :param field: field name
+    :type field: str
+    :return: read only field permission human readable name
+    :rtype: str
+    """
+    return f"{get_read_only_permission_name(model=model)} {field}"
+
+
+@receiver(setting_changed)
+def clear_permission_caches(
+    sender: Any, setting: str, **kwargs: Dict[str, Any]
+) -> None:
+    """
+    Clear memoized permission helpers when permission prefixes settings changed.
+
+    :param sender: signal sender
+    :type sender: Any
+    :param setting: changed setting name
+    :type setting: str
+    :param kwargs: additional arguments
+    :type kwargs: Dict[str, Any]
+    """
+    if setting == "READ_ONLY_ADMIN_PERMISSION_PREFIX":
+        get_read_only_permission_codename.cache_clear()
+        get_read_only_field_permission_codename.cache_clear()
+    elif setting == "READ_ONLY_ADMIN_PERMISSION_NAME_PREFIX":
+        get_read_only_permission_name.cache_clear()
+        get_read_only_field_permission_name.cache_clear()
+
+
+def warm_up_templates() -> List[str]:  # noqa: CCR001
+    """
+    Load and compile read only admin templates, their admin parents and template tags libraries in all django templates engines.
+
+    Compiled templates are kept only by cached template loader.
+
+    :return: loaded templates names
+    :rtype: List[str]
+    """  # noqa: E501
+    loaded: List[str] = []
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+
+        for name in WARM_UP_TEMPLATES:
+            try:
+                engine.get_template(template_name=name)
+            except TemplateDoesNotExist:
+                # engine without application templates
+                continue
+            loaded.append(name)
+
+    return loaded
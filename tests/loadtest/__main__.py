@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/loadtest/__main__.py
+
+
+import sys
+from typing import List
+
+from tests.loadtest.harness import main
+
+
+__all__: List[str] = []
+
+
+if __name__ == "__main__":
+    sys.exit(main())
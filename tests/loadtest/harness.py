@@ -0,0 +1,606 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/loadtest/harness.py
+
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from ast import literal_eval
+from contextlib import ExitStack
+from collections import defaultdict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple, TextIO, Iterable, Optional, DefaultDict
+
+
+__all__: List[str] = [
+    "parse_overrides",
+    "percentile",
+    "summarize",
+    "format_report",
+    "configure",
+    "seed",
+    "run_session",
+    "measure_first_request",
+    "format_first_request_report",
+    "main",
+]
+
+
+READ_ONLY_ROLE: str = "read-only"
+READ_WRITE_ROLE: str = "read-write"
+USERNAMES: Dict[str, str] = {READ_ONLY_ROLE: "reader", READ_WRITE_ROLE: "writer"}
+READ_ENDPOINTS: Tuple[str, ...] = ("changelist", "change", "inline")
+WRITE_ENDPOINT: str = "save"
+PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+COLD_MODE: str = "cold"
+WARM_MODE: str = "warm"
+FIRST_REQUEST_MODES: Tuple[str, ...] = (COLD_MODE, WARM_MODE)
+
+# sample: endpoint, latency in seconds, queries count, HTTP status code
+Sample = Tuple[str, float, int, int]
+
+
+def parse_overrides(values: Iterable[str]) -> Dict[str, Any]:  # noqa: CCR001
+    """
+    Parse NAME=VALUE settings overrides, values are python literals or plain strings.
+
+    :param values: settings overrides
+    :type values: Iterable[str]
+    :return: settings overrides
+    :rtype: Dict[str, Any]
+    :raises ValueError: override has no value
+    """  # noqa: E501
+    overrides: Dict[str, Any] = {}
+    for value in values:
+        name, sep, raw = value.partition("=")  # type: str, str, str
+        if not sep or not name:
+
+            raise ValueError(f"Wrong settings override: {value}.")
+
+        try:
+            overrides[name] = literal_eval(raw)
+        except (ValueError, SyntaxError):
+            overrides[name] = raw
+
+    return overrides
+
+
+def percentile(values: List[float], rank: int) -> float:
+    """
+    Get nearest rank percentile of values.
+
+    :param values: values
+    :type values: List[float]
+    :param rank: percentile rank
+    :type rank: int
+    :return: percentile value, zero for no values
+    :rtype: float
+    """
+    if not values:
+
+        return 0.0
+
+    ordered: List[float] = sorted(values)
+
+    return ordered[max(0, -(-rank * len(ordered) // 100) - 1)]  # noqa: ECE001
+
+
+def summarize(samples: Iterable[Sample], elapsed: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Summarize samples per endpoint and in total.
+
+    :param samples: requests samples
+    :type samples: Iterable[Sample]
+    :param elapsed: run wall clock time in seconds
+    :type elapsed: float
+    :return: endpoints statistics
+    :rtype: Dict[str, Dict[str, Any]]
+    """
+    grouped: DefaultDict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        grouped[sample[0]].append(sample)
+        grouped["total"].append(sample)
+    summary: Dict[str, Dict[str, Any]] = {}
+    for endpoint, items in grouped.items():
+        latencies: List[float] = [item[1] for item in items]
+        summary[endpoint] = {  # noqa: ECE001
+            "requests": len(items),
+            "errors": sum(1 for item in items if item[3] >= 400),
+            "throughput": len(items) / elapsed if elapsed else 0.0,
+            "queries": sum(item[2] for item in items) / len(items),
+            **{f"p{rank}": percentile(latencies, rank) for rank in PERCENTILES},
+        }
+
+    return summary
+
+
+def format_report(summary: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Format endpoints statistics as table, latencies in milliseconds.
+
+    :param summary: endpoints statistics
+    :type summary: Dict[str, Dict[str, Any]]
+    :return: report
+    :rtype: str
+    """
+    lines: List[str] = [  # noqa: ECE001
+        f"{'endpoint':<12}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        + "".join(f"{f'p{rank} ms':>10}" for rank in PERCENTILES)  # noqa: W503
+        + f"{'queries':>10}"  # noqa: W503
+    ]
+    endpoints: List[str] = [name for name in summary if name != "total"]
+    for endpoint in sorted(endpoints) + (["total"] if "total" in summary else []):
+        stats: Dict[str, Any] = summary[endpoint]
+        lines.append(  # noqa: ECE001
+            f"{endpoint:<12}{stats['requests']:>10}{stats['errors']:>8}"
+            + f"{stats['throughput']:>10.1f}"  # noqa: W503
+            + "".join(  # noqa: W503
+                f"{stats[f'p{rank}'] * 1000:>10.1f}" for rank in PERCENTILES
+            )
+            + f"{stats['queries']:>10.1f}"  # noqa: W503
+        )
+
+    return "\n".join(lines)
+
+
+def configure(database: str, overrides: Dict[str, Any]) -> None:
+    """
+    Configure test project with file database shared by workers, sessions and admin context processors.
+
+    Does nothing if django is already configured, e.g. in forked worker process.
+
+    :param database: SQLite database file path
+    :type database: str
+    :param overrides: settings overrides
+    :type overrides: Dict[str, Any]
+    """  # noqa: E501
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+    import django
+    from django.apps import apps
+    from django.conf import settings
+
+    if apps.ready:
+
+        return
+
+    settings.DATABASES = {
+        alias: {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": database,
+            "OPTIONS": {"timeout": 30},
+        }
+        for alias in settings.DATABASES
+    }
+    settings.INSTALLED_APPS = settings.INSTALLED_APPS + [
+        "django.contrib.sessions",
+        "django.contrib.messages",
+    ]
+    settings.MIDDLEWARE = [
+        "django.contrib.sessions.middleware.SessionMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+        "django.contrib.auth.middleware.AuthenticationMiddleware",
+        "django.contrib.messages.middleware.MessageMiddleware",
+    ]
+    settings.TEMPLATES = [
+        {
+            **settings.TEMPLATES[0],
+            "OPTIONS": {
+                "context_processors": [
+                    "django.template.context_processors.request",
+                    "django.contrib.auth.context_processors.auth",
+                    "django.contrib.messages.context_processors.messages",
+                ]
+            },
+        }
+    ]
+    settings.ROOT_URLCONF = "tests.loadtest.urls"
+    settings.ALLOWED_HOSTS = ["testserver"]
+    settings.DEBUG = False
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+    django.setup()
+
+
+def seed(users: int, groups: int, random_seed: int) -> None:
+    """
+    Create database and seed it with admin users, users and groups.
+
+    :param users: users count
+    :type users: int
+    :param groups: groups count
+    :type groups: int
+    :param random_seed: random seed
+    :type random_seed: int
+    """
+    from django.db import connection
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.contrib.auth.models import Group, Permission
+
+    user_model = get_user_model()
+    generator: random.Random = random.Random(random_seed)  # noqa: DUO102
+
+    call_command("migrate", verbosity=0, interactive=False)
+    # concurrent writers wait for each other instead of failing
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    user_model.objects.bulk_create(
+        [
+            user_model(
+                username=f"user-{index}",
+                email=f"user-{index}@example.com",
+                password="!",  # nosec
+            )
+            for index in range(users)
+        ]
+    )
+    Group.objects.bulk_create([Group(name=f"group-{index}") for index in range(groups)])
+    group_ids: List[int] = list(Group.objects.values_list("pk", flat=True))
+    user_model.groups.through.objects.bulk_create(
+        [
+            user_model.groups.through(user_id=user_id, group_id=group_id)
+            for user_id in user_model.objects.values_list("pk", flat=True)
+            for group_id in generator.sample(group_ids, k=min(2, len(group_ids)))
+        ]
+    )
+
+    native: List[str] = [
+        f"{action}_{model}"
+        for action in ["view", "change", "add", "delete"]
+        for model in ["user", "group"]
+    ]
+    for role, codenames in [
+        (READ_ONLY_ROLE, native + ["readonly_user", "readonly_group"]),
+        (READ_WRITE_ROLE, native),
+    ]:
+        user = user_model.objects.create(
+            username=USERNAMES[role], password="!", is_staff=True  # nosec
+        )
+        user.user_permissions.add(
+            *Permission.objects.filter(
+                content_type__app_label="auth", codename__in=codenames
+            )
+        )
+
+
+def _request(
+    client: Any, endpoint: str, method: str, url: str, data: Optional[Dict[str, Any]]
+) -> Sample:
+    """
+    Make request and measure its latency and queries count on all databases.
+
+    :param client: test client
+    :type client: Any
+    :param endpoint: endpoint name
+    :type endpoint: str
+    :param method: HTTP method
+    :type method: str
+    :param url: URL
+    :type url: str
+    :param data: request data
+    :type data: Optional[Dict[str, Any]]
+    :return: request sample
+    :rtype: Sample
+    """
+    from django.db import connections
+    from django.test.utils import CaptureQueriesContext
+
+    with ExitStack() as stack:
+        contexts: List[CaptureQueriesContext] = [
+            stack.enter_context(
+                CaptureQueriesContext(connection=connections[alias])  # type: ignore
+            )
+            for alias in connections
+        ]
+        started: float = time.perf_counter()
+        response = getattr(client, method)(url, data=data)
+        if getattr(response, "streaming", False):
+            b"".join(response.streaming_content)
+        latency: float = time.perf_counter() - started
+
+    return (
+        endpoint,
+        latency,
+        sum(len(context) for context in contexts),
+        response.status_code,
+    )
+
+
+def run_session(  # noqa: CCR001
+    role: str, requests: int, random_seed: int
+) -> List[Sample]:
+    """
+    Run logged in admin user session.
+
+    Read only sessions browse users changelist, user change view and group change view with users inline.
+    Read write sessions also save groups with inline formset.
+
+    :param role: session role
+    :type role: str
+    :param requests: requests count
+    :type requests: int
+    :param random_seed: random seed
+    :type random_seed: int
+    :return: requests samples
+    :rtype: List[Sample]
+    """  # noqa: E501
+    from django.test import Client
+    from django.urls import reverse
+    from django.db import connections
+    from django.contrib.auth.models import Group
+    from django.contrib.auth import get_user_model
+    from django.forms.models import inlineformset_factory
+
+    user_model = get_user_model()
+    generator: random.Random = random.Random(random_seed)  # noqa: DUO102
+    endpoints: Tuple[str, ...] = READ_ENDPOINTS + (
+        (WRITE_ENDPOINT,) if role == READ_WRITE_ROLE else ()
+    )
+    prefix: str = inlineformset_factory(  # type: ignore
+        Group, user_model.groups.through, fields="__all__"
+    ).get_default_prefix()
+    samples: List[Sample] = []
+    try:
+        # failed requests are reported as errors
+        client: Client = Client(raise_request_exception=False)
+        client.force_login(user_model.objects.get(username=USERNAMES[role]))
+        user_ids: List[int] = list(user_model.objects.values_list("pk", flat=True))
+        groups: List[Tuple[int, str]] = list(Group.objects.values_list("pk", "name"))
+        for index in range(requests):
+            endpoint: str = endpoints[index % len(endpoints)]
+            group_id, name = generator.choice(groups)  # type: int, str
+            if endpoint == "changelist":
+                request: Tuple[str, str, Optional[Dict[str, Any]]] = (
+                    "get",
+                    reverse("loadtest:auth_user_changelist"),
+                    {"p": generator.randrange(10)},
+                )
+            elif endpoint == "change":
+                request = (
+                    "get",
+                    reverse(
+                        "loadtest:auth_user_change",
+                        kwargs={"object_id": generator.choice(user_ids)},
+                    ),
+                    None,
+                )
+            elif endpoint == "inline":
+                request = (
+                    "get",
+                    reverse(
+                        "loadtest:auth_group_change", kwargs={"object_id": group_id}
+                    ),
+                    None,
+                )
+            else:
+                request = (
+                    "post",
+                    reverse(
+                        "loadtest:auth_group_change", kwargs={"object_id": group_id}
+                    ),
+                    {
+                        "name": name,
+                        f"{prefix}-TOTAL_FORMS": "0",
+                        f"{prefix}-INITIAL_FORMS": "0",
+                    },
+                )
+            samples.append(_request(client, endpoint, *request))
+    finally:
+        # worker threads database connections are never reused
+        connections.close_all()
+
+    return samples
+
+
+def _reset_templates() -> None:  # noqa: CCR001
+    """Forget templates compiled by cached template loaders."""
+    from django.template import engines
+
+    for engine in engines.all():
+        for loader in engine.engine.template_loaders:  # type: ignore
+            if hasattr(loader, "reset"):
+                loader.reset()
+
+
+def measure_first_request(requests: int) -> Dict[str, List[float]]:
+    """
+    Measure read only session first change list request latency with cold and warmed up templates.
+
+    Compiled templates are dropped before each request, in warm mode they are loaded by read only admin templates warm up first.
+    Warm up itself is not measured, it runs at startup.
+
+    :param requests: requests count per mode
+    :type requests: int
+    :return: latencies in seconds per mode
+    :rtype: Dict[str, List[float]]
+    """  # noqa: E501
+    from django.test import Client
+    from django.urls import reverse
+    from django.contrib.auth import get_user_model
+
+    from read_only_admin.utils import warm_up_templates
+
+    client: Client = Client()
+    client.force_login(get_user_model().objects.get(username=USERNAMES[READ_ONLY_ROLE]))
+    url: str = reverse("loadtest:auth_user_changelist")
+    latencies: Dict[str, List[float]] = {mode: [] for mode in FIRST_REQUEST_MODES}
+    # modes are interleaved to spread noise evenly
+    for index in range(requests * len(FIRST_REQUEST_MODES)):
+        mode: str = FIRST_REQUEST_MODES[index % len(FIRST_REQUEST_MODES)]
+        _reset_templates()
+        if mode == WARM_MODE:
+            warm_up_templates()
+        latencies[mode].append(_request(client, mode, "get", url, None)[1])
+
+    return latencies
+
+
+def format_first_request_report(latencies: Dict[str, List[float]]) -> str:
+    """
+    Format first request latencies per mode as table, latencies in milliseconds.
+
+    :param latencies: latencies in seconds per mode
+    :type latencies: Dict[str, List[float]]
+    :return: report
+    :rtype: str
+    """
+    lines: List[str] = [
+        f"{'first request':<14}{'requests':>10}{'p50 ms':>10}{'max ms':>10}"
+    ]
+    for mode in FIRST_REQUEST_MODES:
+        values: List[float] = latencies.get(mode, [])
+        lines.append(  # noqa: ECE001
+            f"{mode:<14}{len(values):>10}"
+            + f"{percentile(values, 50) * 1000:>10.1f}"  # noqa: W503
+            + f"{max(values, default=0.0) * 1000:>10.1f}"  # noqa: W503
+        )
+
+    return "\n".join(lines)
+
+
+def _run_session(arguments: Tuple[str, int, int]) -> List[Sample]:
+    """
+    Run session with packed arguments, picklable for process pool.
+
+    :param arguments: session role, requests count and random seed
+    :type arguments: Tuple[str, int, int]
+    :return: requests samples
+    :rtype: List[Sample]
+    """
+    role, requests, random_seed = arguments
+
+    return run_session(role=role, requests=requests, random_seed=random_seed)
+
+
+def _initialize_worker(database: str, overrides: Dict[str, Any]) -> None:
+    """
+    Configure django in worker process.
+
+    :param database: SQLite database file path
+    :type database: str
+    :param overrides: settings overrides
+    :type overrides: Dict[str, Any]
+    """
+    configure(database=database, overrides=overrides)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """
+    Get command line arguments parser.
+
+    :return: command line arguments parser
+    :rtype: argparse.ArgumentParser
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m tests.loadtest",
+        description="Drive concurrent read only and read write admin sessions against test project and report throughput, latency percentiles and queries per endpoint.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--read-only-sessions", type=int, default=8, help="8 by default."
+    )
+    parser.add_argument(
+        "--read-write-sessions", type=int, default=2, help="2 by default."
+    )
+    parser.add_argument(
+        "--requests", type=int, default=30, help="Requests per session, 30 by default."
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Pool workers, 4 by default."
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Use processes pool instead of threads pool.",
+    )
+    parser.add_argument(
+        "--users", type=int, default=1000, help="Seeded users, 1000 by default."
+    )
+    parser.add_argument(
+        "--groups", type=int, default=20, help="Seeded groups, 20 by default."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--first-requests",
+        type=int,
+        default=0,
+        help="Measure first request latency with cold and warmed up templates this many times per mode before load test, disabled by default.",  # noqa: E501
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        dest="overrides",
+        help="Override setting, e.g. READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT=300.",
+    )
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, stream: TextIO = sys.stdout) -> int:
+    """
+    Run load test and write report.
+
+    :param argv: command line arguments
+    :type argv: Optional[List[str]]
+    :param stream: report output stream
+    :type stream: TextIO
+    :return: exit code
+    :rtype: int
+    """
+    options: argparse.Namespace = get_parser().parse_args(argv)
+    overrides: Dict[str, Any] = parse_overrides(options.overrides)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database: str = os.path.join(directory, "loadtest.sqlite3")
+        configure(database=database, overrides=overrides)
+
+        from django.db import connections
+
+        seed(users=options.users, groups=options.groups, random_seed=options.seed)
+        if options.first_requests:
+            stream.write(
+                format_first_request_report(
+                    latencies=measure_first_request(requests=options.first_requests)
+                )
+            )
+            stream.write("\n\n")
+        # forked workers must not share parent database connections
+        connections.close_all()
+
+        sessions: List[Tuple[str, int, int]] = [  # noqa: ECE001
+            (role, options.requests, options.seed + index)
+            for index, role in enumerate(
+                [READ_ONLY_ROLE] * options.read_only_sessions
+                + [READ_WRITE_ROLE] * options.read_write_sessions  # noqa: W503
+            )
+        ]
+        executor: Executor = (
+            ProcessPoolExecutor(
+                max_workers=options.concurrency,
+                initializer=_initialize_worker,
+                initargs=(database, overrides),
+            )
+            if options.processes
+            else ThreadPoolExecutor(max_workers=options.concurrency)
+        )
+        with executor:
+            started: float = time.perf_counter()
+            samples: List[Sample] = [
+                sample
+                for session in executor.map(_run_session, sessions)
+                for sample in session
+            ]
+            elapsed: float = time.perf_counter() - started
+
+    stream.write(format_report(summary=summarize(samples=samples, elapsed=elapsed)))
+    stream.write("\n")
+
+    return 0
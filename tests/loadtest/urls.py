@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/loadtest/urls.py
+
+
+from typing import Any, List
+
+from django.urls import path
+from django.contrib.auth.models import Group
+from django.contrib.admin import TabularInline
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin, GroupAdmin
+
+from read_only_admin.sites import ReadonlyAdminSite
+
+
+__all__: List[str] = ["site", "urlpatterns"]
+
+
+User = get_user_model()
+
+
+class GroupUsersInline(TabularInline):  # type: ignore
+    """Group users inline."""
+
+    model = User.groups.through
+    extra = 0
+
+
+class GroupUsersAdmin(GroupAdmin):
+    """Group admin with users inline."""
+
+    inlines = [GroupUsersInline]
+
+
+# registered admins and inlines are made read only by site
+site = ReadonlyAdminSite(name="loadtest")
+site.register(User, UserAdmin)
+site.register(Group, GroupUsersAdmin)
+
+urlpatterns: List[Any] = [path("admin/", site.urls)]
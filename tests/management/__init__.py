@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/management/__init__.py
+
+
+from typing import List
+
+
+__all__: List[str] = []
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/management/commands/test_read_only_admin_search_index.py
+
+
+from io import StringIO
+from typing import List
+
+from django.db import connection
+from django.test import TransactionTestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.core.management.base import CommandError
+
+from read_only_admin.admin import ReadonlyAdmin
+from read_only_admin.search import build_search_registry
+
+
+__all__: List[str] = ["ReadOnlyAdminSearchIndexCommandTest"]
+
+
+User = get_user_model()
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    ...
+
+
+class ReadOnlyAdminSearchIndexCommandTest(TransactionTestCase):
+    """read_only_admin_search_index management command tests."""
+
+    def setUp(self) -> None:
+        """Set up admin site with read only admin and objects."""
+        self.site = AdminSite(name="search")
+        self.site.register(User, ReadOnlyUserAdmin)
+        User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+        )
+
+    def tearDown(self) -> None:
+        """Drop test admin site from registry and search index."""
+        del self.site
+        build_search_registry()
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS read_only_admin_search_auth_user")
+
+    @override_settings(
+        READ_ONLY_ADMIN_SEARCH_BACKEND="read_only_admin.search.SQLiteFTS5SearchBackend"
+    )
+    def test_handle(self) -> None:
+        """Command must index read only admins models."""
+        out = StringIO()
+        call_command("read_only_admin_search_index", "auth.User", stdout=out)
+
+        self.assertEqual(first=out.getvalue(), second="auth.user: 1 indexed\n")
+
+    @override_settings(
+        READ_ONLY_ADMIN_SEARCH_BACKEND="read_only_admin.search.SQLiteFTS5SearchBackend"
+    )
+    def test_handle__not_registered(self) -> None:
+        """Command must fail for models without read only admin search fields."""
+        with self.assertRaises(expected_exception=CommandError):
+            call_command("read_only_admin_search_index", "auth.Group")
+
+    def test_handle__without_backend(self) -> None:
+        """Command must fail without configured search backend."""
+        with self.assertRaises(expected_exception=CommandError):
+            call_command("read_only_admin_search_index")
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/management/commands/test_read_only_admin_warm_up.py
+
+
+from io import StringIO
+from threading import Event
+from datetime import timedelta
+from typing import Any, List, Iterator
+
+from django.utils import timezone
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.core.management.base import CommandError
+from django.contrib.auth.models import Group, Permission
+from django.test import SimpleTestCase, TransactionTestCase
+
+from read_only_admin.backends import ReadOnlyPermissionBackend
+from read_only_admin.management.commands.read_only_admin_warm_up import Command
+
+
+__all__: List[str] = [
+    "ReadOnlyAdminWarmUpCommandTest",
+    "ReadOnlyAdminWarmUpThreadsCommandTest",
+]
+
+
+User = get_user_model()
+
+
+@override_settings(
+    AUTHENTICATION_BACKENDS=[
+        "read_only_admin.backends.ReadOnlyPermissionBackend",
+        "django.contrib.auth.backends.ModelBackend",
+    ]
+)
+class ReadOnlyAdminWarmUpCommandTest(TransactionTestCase):
+    """read_only_admin_warm_up management command tests."""
+
+    def setUp(self) -> None:
+        """Set up users with read only permissions."""
+        group = Group.objects.create(name="test")
+        group.permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_group"]))
+        )
+        for username, days in [("test", 1), ("old", 30)]:
+            user = User.objects.create(
+                username=username,
+                email=f"{username}@example.com",
+                password=User.objects.make_random_password(),
+                is_staff=True,
+                last_login=timezone.now() - timedelta(days=days),
+            )
+            user.user_permissions.add(
+                *list(Permission.objects.filter(codename__in=["readonly_user"]))
+            )
+            user.groups.add(group)
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def assert_warmed_up(self, username: str) -> None:
+        """
+        Check user read only permissions are taken from cache.
+
+        :param username: user name
+        :type username: str
+        """
+        user = User.objects.get(username=username)
+
+        with self.assertNumQueries(num=0):
+            permissions = ReadOnlyPermissionBackend().get_read_only_permissions(
+                user_obj=user
+            )
+
+        self.assertSetEqual(
+            set1=permissions,  # type: ignore
+            set2={("auth", "readonly_user"), ("auth", "readonly_group")},
+        )
+
+    def test_handle(self) -> None:
+        """Command must cache read only permissions of all staff users."""
+        out = StringIO()
+        call_command("read_only_admin_warm_up", "--batch-size=1", stdout=out)
+
+        self.assertIn(member="2 users warmed up", container=out.getvalue())
+        self.assert_warmed_up(username="test")
+        self.assert_warmed_up(username="old")
+
+    def test_handle__threads(self) -> None:
+        """Command must cache read only permissions in threads."""
+        out = StringIO()
+        call_command(
+            "read_only_admin_warm_up", "--batch-size=1", "--threads=2", stdout=out
+        )
+
+        self.assertIn(member="2 users warmed up", container=out.getvalue())
+        self.assert_warmed_up(username="test")
+        self.assert_warmed_up(username="old")
+
+    def test_handle__since_last_login(self) -> None:
+        """Command must cache read only permissions of recently logged in users."""
+        out = StringIO()
+        call_command("read_only_admin_warm_up", "--since-last-login=7", stdout=out)
+
+        self.assertIn(member="1 users warmed up", container=out.getvalue())
+        self.assert_warmed_up(username="test")
+
+    @override_settings(
+        AUTHENTICATION_BACKENDS=["django.contrib.auth.backends.ModelBackend"]
+    )
+    def test_handle__not_configured(self) -> None:
+        """Command must fail without read only permissions backend."""
+        with self.assertRaises(CommandError):
+            call_command("read_only_admin_warm_up")
+
+
+class BlockingCommand(Command):
+    """Command which threads wait until they are released."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Set up release event and completed batches counter.
+
+        :param args: additional args
+        :type args: Any
+        :param kwargs: additional arguments
+        :type kwargs: Any
+        """
+        super(BlockingCommand, self).__init__(*args, **kwargs)
+        self.release: Event = Event()
+        self.completed: int = 0
+
+    def warm_up_in_thread(self, users: List[Any], generation: str) -> int:
+        """
+        Wait for release and count completed batch.
+
+        :param users: users batch
+        :type users: List[Any]
+        :param generation: users permissions generation token
+        :type generation: str
+        :return: warmed up users count
+        :rtype: int
+        """
+        self.release.wait(timeout=5)
+        self.completed += 1
+
+        return len(users)
+
+
+class ReadOnlyAdminWarmUpThreadsCommandTest(SimpleTestCase):
+    """read_only_admin_warm_up management command threads tests."""
+
+    def test_warm_up_in_threads(self) -> None:
+        """Next batch must be loaded only when some thread is free."""
+        command = BlockingCommand()
+        completed: List[int] = []
+
+        def get_batches() -> Iterator[List[Any]]:
+            """
+            Record completed batches count on each batch loading.
+
+            :yield: users batch
+            :rtype: Iterator[List[Any]]
+            """
+            for number in range(4):
+                completed.append(command.completed)
+                # both threads are busy, so third batch waits for one of them
+                if number == 2:
+                    command.release.set()
+                yield [number]
+
+        self.assertEqual(
+            first=command.warm_up_in_threads(
+                batches=get_batches(), generation="", threads=2
+            ),
+            second=4,
+        )
+        self.assertEqual(first=completed[:3], second=[0, 0, 0])
+        self.assertGreaterEqual(a=completed[3], b=1)
@@ -25,8 +25,10 @@ SECRET_KEY: str = "".join(
 
 # configure databases
 DATABASES: Dict[str, Dict[str, str]] = {
-    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+    "replica": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
 }
+DATABASE_ROUTERS: List[str] = ["read_only_admin.routers.ReadOnlyAdminRouter"]
 
 # configure templates
 TEMPLATES: List[Dict[str, Union[str, List[str], bool, Dict[str, str]]]] = [
@@ -4,24 +4,36 @@
 # tests/templatetags/test_read_only_admin_tags.py
 
 
-from typing import List
+from typing import Any, List
 
 from django.test import TestCase
+from django.core.cache import cache
 from django.http import HttpRequest
+from django.test.client import RequestFactory
 from django.contrib.auth import get_user_model
+from django.utils import timezone, translation
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import Permission
-from django.template import Context, RequestContext
+from django.template import Context, Template, RequestContext
 
 from read_only_admin.conf import settings
+from read_only_admin.admin import ReadonlyAdmin
 from read_only_admin.templatetags.read_only_admin_tags import (
     unescape,
     readonly_submit_row,
+    readonly_result_list,
+    readonly_date_hierarchy,
 )
 
 
 __all__: List[str] = [
     "UnescapeTemplatetagTest",
     "ReadonlySubmitRowTemplatetagTest",
+    "ReadonlyDateHierarchyTemplatetagTest",
+    "ReadonlyResultListTemplatetagTest",
+    "RowCacheReadonlyResultListTemplatetagTest",
 ]
 
 
@@ -240,3 +252,246 @@ class ReadonlySubmitRowTemplatetagTest(TestCase):
         self.assertTrue(expr=result["show_save_and_add_another"])
         self.assertTrue(expr=result["show_save_and_continue"])
         self.assertTrue(expr=result["show_save"])
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    date_hierarchy = "date_joined"
+
+
+@override_settings(READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT=60)
+class ReadonlyDateHierarchyTemplatetagTest(TestCase):
+    """Read only date hierarchy templatetag tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def test_readonly_date_hierarchy(self) -> None:
+        """Test templatetag return cached buckets for read only change list."""
+        user = User.objects.first()
+        request = RequestFactory().get("/")
+        request.user = user  # type: ignore
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        context = RequestContext(request=request, dict_={"request": request})
+        result = readonly_date_hierarchy(context=context, cl=changelist)
+
+        with self.assertNumQueries(num=0):
+            cached = readonly_date_hierarchy(context=context, cl=changelist)
+
+        self.assertTrue(expr=result["show"])  # type: ignore
+        self.assertEqual(
+            first=cached["choices"][0]["title"],  # type: ignore
+            second=result["choices"][0]["title"],  # type: ignore
+        )
+
+    def test_readonly_date_hierarchy_tag(self) -> None:
+        """Test templatetag renders admin date hierarchy template."""
+        request = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        content = Template(
+            "{% load read_only_admin_tags %}{% readonly_date_hierarchy cl %}"  # noqa: FS003, E501
+        ).render(
+            context=RequestContext(
+                request=request,
+                dict_={"request": request, "cl": changelist, "opts": User._meta},
+            )
+        )
+
+        self.assertIn(member="xfull", container=content)
+
+    def test_readonly_date_hierarchy__timezone(self) -> None:
+        """Test templatetag caches buckets per time zone."""
+        request = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        context = RequestContext(request=request, dict_={"request": request})
+        readonly_date_hierarchy(context=context, cl=changelist)
+
+        with timezone.override("Asia/Tokyo"), self.assertNumQueries(num=2):
+            readonly_date_hierarchy(context=context, cl=changelist)
+
+    def test_readonly_date_hierarchy__for_superuser(self) -> None:
+        """Test templatetag does not cache buckets for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+        request = RequestFactory().get("/")
+        request.user = user  # type: ignore
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        context = RequestContext(request=request, dict_={"request": request})
+        readonly_date_hierarchy(context=context, cl=changelist)
+
+        with self.assertNumQueries(num=2):
+            readonly_date_hierarchy(context=context, cl=changelist)
+
+
+@override_settings(
+    READ_ONLY_ADMIN_INDEXED_SORTING=True, ROOT_URLCONF="tests.test_sites"
+)
+class ReadonlyResultListTemplatetagTest(TestCase):
+    """Read only result list templatetag tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+
+    def test_readonly_result_list(self) -> None:
+        """Test templatetag explains why columns are not sortable."""
+        request = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        changelist.formset = None
+        headers = readonly_result_list(cl=changelist)["result_headers"]
+
+        self.assertTrue(expr=headers[0]["sortable"])
+        self.assertNotIn(member="title", container=headers[0]["class_attrib"])
+        self.assertFalse(expr=headers[1]["sortable"])
+        self.assertIn(member="title=", container=headers[1]["class_attrib"])
+
+
+class RowCacheReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class with cached change list rows."""
+
+    list_display = ("username", "rendered")
+    row_cache_version_field = "last_login"
+    rendered_objects: List[Any] = []
+
+    def rendered(self, obj: Any) -> str:
+        """
+        Record rendered object.
+
+        :param obj: object
+        :type obj: Any
+        :return: object username
+        :rtype: str
+        """
+        self.rendered_objects.append(obj.pk)
+
+        return f"rendered {obj.username}"
+
+
+@override_settings(ROOT_URLCONF="tests.test_sites")
+class RowCacheReadonlyResultListTemplatetagTest(TestCase):
+    """Read only result list templatetag rows cache tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+        User.objects.create(
+            username="other",
+            email="other@example.com",
+            password=User.objects.make_random_password(),
+        )
+
+    def setUp(self) -> None:
+        """Set up each test."""
+        RowCacheReadOnlyUserAdmin.rendered_objects.clear()
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def get_results(self, user: Any) -> List[List[str]]:
+        """
+        Get change list rows for user.
+
+        :param user: user
+        :type user: Any
+        :return: rows cells
+        :rtype: List[List[str]]
+        """
+        request = RequestFactory().get("/")
+        request.user = user
+        changelist = RowCacheReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+        changelist.formset = None
+
+        return [list(row) for row in readonly_result_list(cl=changelist)["results"]]
+
+    def test_readonly_result_list(self) -> None:
+        """Test templatetag renders rows once and returns them from cache later."""
+        user = User.objects.get(username="test")
+        result = self.get_results(user=user)
+        cached = self.get_results(user=User.objects.get(username="test"))
+
+        self.assertListEqual(list1=cached, list2=result)
+        self.assertEqual(first=len(result), second=2)
+        self.assertIn(member="rendered test", container="".join(result[1]))
+        self.assertListEqual(
+            list1=sorted(RowCacheReadOnlyUserAdmin.rendered_objects),
+            list2=sorted(User.objects.values_list("pk", flat=True)),
+        )
+
+    def test_readonly_result_list__version_changed(self) -> None:
+        """Test templatetag renders again only rows which version changed."""
+        user = User.objects.get(username="test")
+        self.get_results(user=user)
+        RowCacheReadOnlyUserAdmin.rendered_objects.clear()
+        User.objects.filter(username="other").update(last_login=timezone.now())
+        self.get_results(user=User.objects.get(username="test"))
+
+        self.assertListEqual(
+            list1=RowCacheReadOnlyUserAdmin.rendered_objects,
+            list2=[User.objects.get(username="other").pk],
+        )
+
+    def test_readonly_result_list__language_changed(self) -> None:
+        """Test templatetag caches rows per language."""
+        user = User.objects.get(username="test")
+        self.get_results(user=user)
+        RowCacheReadOnlyUserAdmin.rendered_objects.clear()
+        with translation.override("uk"):
+            self.get_results(user=User.objects.get(username="test"))
+
+        self.assertEqual(
+            first=len(RowCacheReadOnlyUserAdmin.rendered_objects), second=2
+        )
+
+    def test_readonly_result_list__for_superuser(self) -> None:
+        """Test templatetag does not cache rows for superuser."""
+        user = User.objects.get(username="test")
+        user.is_superuser = True
+        self.get_results(user=user)
+        self.get_results(user=user)
+
+        self.assertEqual(
+            first=len(RowCacheReadOnlyUserAdmin.rendered_objects), second=4
+        )
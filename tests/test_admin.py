@@ -4,25 +4,51 @@
 # tests/test_admin.py
 
 
+import json
+from time import sleep
 from io import StringIO
+from unittest import skipIf
 from collections import OrderedDict
-from typing import Any, List, Type, Iterable
+from typing import Any, List, Type, Iterable, Optional
 
+import django
 from django.test import TestCase
-from django.http import HttpRequest
+from django.db import transaction
+from django.db.utils import OperationalError
 from django.forms.formsets import BaseFormSet
+from django.test.client import RequestFactory
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin
 from django.test.utils import override_settings
 from django.contrib.admin.sites import AdminSite
-from django.contrib.auth.models import Permission
 from django.core.handlers.wsgi import WSGIRequest
+from django.core.exceptions import PermissionDenied
 from django.contrib.admin.actions import delete_selected
-
-from read_only_admin.admin import ReadonlyAdmin, ReadonlyChangeList
-
-
-__all__: List[str] = ["ReadonlyAdminTest", "ReadonlyChangeListTest"]
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.http import Http404, HttpRequest, HttpResponse
+
+from read_only_admin.admission import admission
+from read_only_admin.admin import (
+    ReadonlyAdmin,
+    ReadonlyChangeList,
+    ReadonlyTabularInline,
+)
+
+
+__all__: List[str] = [
+    "ReadonlyAdminTest",
+    "ReadonlyChangeListTest",
+    "AsyncReadonlyAdminTest",
+    "ReplicaReadonlyAdminTest",
+    "ReadOnlyRequestReadonlyAdminTest",
+    "IndexedSortingReadonlyChangeListTest",
+    "QueryBudgetReadonlyAdminTest",
+    "AdmissionReadonlyAdminTest",
+    "JsonReadonlyAdminTest",
+    "ReadOnlyFieldsReadonlyAdminTest",
+    "ViewPermissionModeReadonlyAdminTest",
+]
 
 
 User = get_user_model()
@@ -97,9 +123,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = User.objects.first()  # type: ignore
         result: Type[ReadonlyChangeList] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_changelist(
-            request=request
-        )
+        ).get_changelist(request=request)
 
         self.assertEqual(first=result, second=ReadonlyChangeList)
 
@@ -109,9 +133,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = User.objects.first()  # type: ignore
         result: Type[BaseFormSet] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_changelist_formset(
-            request=request
-        )
+        ).get_changelist_formset(request=request)
 
         self.assertEqual(first=result.__name__, second="UserFormFormSet")
 
@@ -140,6 +162,18 @@ class ReadonlyAdminTest(TestCase):
 
         self.assertListEqual(list1=result, list2=expected)  # type: ignore
 
+    def test_get_readonly_fields__without_fieldsets(self) -> None:
+        """Method must return all model fields as read only for admin without declared fieldsets."""  # noqa: E501
+        user = User.objects.first()
+        request: HttpRequest = HttpRequest()
+        request.user = user  # type: ignore
+        result = ReadonlyAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_readonly_fields(request=request, obj=user)
+
+        self.assertIn(member="username", container=result)
+        self.assertIn(member="groups", container=result)
+
     def test_get_actions(self) -> None:
         """Method must return empty actions list."""
         user = User.objects.first()
@@ -147,9 +181,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = user  # type: ignore
         result: OrderedDict[str, Any] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_actions(
-            request=request
-        )
+        ).get_actions(request=request)
 
         self.assertDictEqual(d1=result, d2=OrderedDict())
 
@@ -161,9 +193,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = user  # type: ignore
         result: OrderedDict[str, Any] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_actions(
-            request=request
-        )
+        ).get_actions(request=request)
 
         self.assertDictEqual(d1=result, d2=OrderedDict())
 
@@ -176,9 +206,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = user  # type: ignore
         result: Iterable[str] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_readonly_fields(
-            request=request, obj=user
-        )
+        ).get_readonly_fields(request=request, obj=user)
 
         self.assertEqual(first=result, second=())
 
@@ -191,9 +219,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = user  # type: ignore
         result: OrderedDict[str, Any] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_actions(
-            request=request
-        )
+        ).get_actions(request=request)
         expected: OrderedDict[str, Any] = OrderedDict(
             [
                 (
@@ -219,9 +245,7 @@ class ReadonlyAdminTest(TestCase):
         request.user = user  # type: ignore
         result: OrderedDict[str, Any] = ReadOnlyUserAdmin(
             model=get_user_model(), admin_site=AdminSite()
-        ).get_actions(
-            request=request
-        )
+        ).get_actions(request=request)
         expected: OrderedDict[str, Any] = OrderedDict(
             [
                 (
@@ -236,3 +260,726 @@ class ReadonlyAdminTest(TestCase):
         )
 
         self.assertDictEqual(d1=result, d2=expected)
+
+
+# django test case awaits async test methods since django 3.1
+@skipIf(condition=django.VERSION < (3, 1), reason="Requires Django 3.1 or newer.")
+class AsyncReadonlyAdminTest(TestCase):
+    """Read only admin async adapters tests."""
+
+    user: Any
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        cls.user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        cls.user.user_permissions.add(*list(Permission.objects.all()))
+
+    async def test_aget_readonly_fields(self) -> None:
+        """Method must return all form fields as read only."""
+        request: HttpRequest = HttpRequest()
+        request.user = self.user
+        result = await ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).aget_readonly_fields(request=request, obj=self.user)
+
+        self.assertIn(member="username", container=result)
+
+    async def test_aget_actions(self) -> None:
+        """Method must return empty actions list."""
+        request: HttpRequest = HttpRequest()
+        request.user = self.user
+        result: OrderedDict[str, Any] = await ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).aget_actions(request=request)
+
+        self.assertDictEqual(d1=result, d2=OrderedDict())
+
+
+@override_settings(READ_ONLY_ADMIN_REPLICA_DATABASE="replica")
+class ReplicaReadonlyAdminTest(TestCase):
+    """Read only admin replica database integration tests."""
+
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+
+    def test_get_queryset(self) -> None:
+        """Method must return replica queryset for read only user."""
+        request: HttpRequest = HttpRequest()
+        request.method = "GET"
+        request.user = User.objects.first()  # type: ignore
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_queryset(request=request)
+
+        self.assertEqual(first=result.db, second="replica")
+
+    def test_get_queryset__post(self) -> None:
+        """Method must never return replica queryset for not safe requests."""
+        request: HttpRequest = HttpRequest()
+        request.method = "POST"
+        request.user = User.objects.first()  # type: ignore
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_queryset(request=request)
+
+        self.assertEqual(first=result.db, second="default")
+
+    def test_get_queryset__for_superuser(self) -> None:
+        """Method must return primary queryset for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+        request: HttpRequest = HttpRequest()
+        request.method = "GET"
+        request.user = user  # type: ignore
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_queryset(request=request)
+
+        self.assertEqual(first=result.db, second="default")
+
+
+class ReadOnlyRequestReadonlyAdminTest(TestCase):
+    """Read only admin read only requests tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+
+    def test_is_read_only_request(self) -> None:
+        """Method must return True for read only user safe request."""
+        request: HttpRequest = HttpRequest()
+        request.method = "GET"
+        request.user = User.objects.first()  # type: ignore
+
+        self.assertTrue(
+            expr=ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).is_read_only_request(request=request)
+        )
+
+    def test_is_read_only_request__for_superuser(self) -> None:
+        """Method must return False for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+        request: HttpRequest = HttpRequest()
+        request.method = "POST"
+        request.user = user  # type: ignore
+
+        self.assertFalse(
+            expr=ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).is_read_only_request(request=request)
+        )
+
+    def test_changeform_view__post(self) -> None:
+        """View must reject read only user POST before any form processing."""
+        request: HttpRequest = HttpRequest()
+        request.method = "POST"
+        request.user = User.objects.first()  # type: ignore
+
+        with self.assertRaises(PermissionDenied):
+            ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).changeform_view(request=request, object_id=str(request.user.pk))
+
+    def test_changelist_view__for_superuser(self) -> None:
+        """Response must be left lazy if read only context changes nothing."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+        request: HttpRequest = RequestFactory().get("/")
+        request.user = user  # type: ignore
+        response = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).changelist_view(request=request)
+
+        self.assertFalse(expr=response.is_rendered)  # type: ignore
+
+    @override_settings(
+        READ_ONLY_ADMIN_READ_ONLY_TRANSACTION=True, ROOT_URLCONF="tests.test_sites"
+    )
+    def test_changelist_view__read_only_transaction(self) -> None:
+        """Response must be rendered inside read only transaction."""
+        request: HttpRequest = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        response = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).changelist_view(request=request)
+
+        self.assertTrue(expr=response.is_rendered)  # type: ignore
+
+    def test_changelist_view__action_post(self) -> None:
+        """View must reject read only user actions POST."""
+        user = User.objects.first()
+        request: HttpRequest = RequestFactory().post(
+            "/", {"action": "delete_selected", "index": "0", "_selected_action": user.pk}  # type: ignore  # noqa: E501
+        )
+        request.user = user  # type: ignore
+
+        with self.assertRaises(PermissionDenied):
+            ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).changelist_view(request=request)
+
+    def test_delete_view__post(self) -> None:
+        """View must reject read only user POST."""
+        request: HttpRequest = HttpRequest()
+        request.method = "POST"
+        request.user = User.objects.first()  # type: ignore
+
+        with self.assertRaises(PermissionDenied):
+            ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).delete_view(request=request, object_id=str(request.user.pk))
+
+    @override_settings(READ_ONLY_ADMIN_READ_ONLY_TRANSACTION=True)
+    def test_read_only_view(self) -> None:
+        """Writes must be rejected by database inside read only user view."""
+        request: HttpRequest = HttpRequest()
+        request.method = "GET"
+        request.user = User.objects.first()  # type: ignore
+
+        with ReadOnlyUserAdmin(  # noqa: SIM117
+            model=get_user_model(), admin_site=AdminSite()
+        ).read_only_view(request=request):
+            with self.assertRaises(OperationalError):  # noqa: SIM117
+                with transaction.atomic():
+                    User.objects.create(username="another")
+
+
+@override_settings(READ_ONLY_ADMIN_INDEXED_SORTING=True)
+class IndexedSortingReadonlyChangeListTest(TestCase):
+    """Read only change list indexed sorting tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+    def test__init__(self) -> None:
+        """Read only users must sort only by indexed columns."""
+        request: HttpRequest = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+
+        self.assertListEqual(list1=list(result.sortable_by), list2=["username"])
+        self.assertListEqual(
+            list1=list(result.unsortable_reasons),  # type: ignore
+            list2=["email", "first_name", "last_name", "is_staff"],
+        )
+
+    def test_get_ordering_field(self) -> None:
+        """Ordering by not indexed columns from query string must be ignored."""
+        request: HttpRequest = RequestFactory().get("/", {"o": "2.3"})
+        request.user = User.objects.first()  # type: ignore
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+
+        self.assertListEqual(
+            list1=list(result.queryset.query.order_by), list2=["username"]
+        )
+
+    def test__init__for_superuser(self) -> None:
+        """Superusers sorting must not be restricted."""
+        request: HttpRequest = RequestFactory().get("/", {"o": "2"})
+        request.user = User.objects.first()  # type: ignore
+        request.user.is_superuser = True
+        result = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+
+        self.assertEqual(first=len(result.sortable_by), second=5)
+        # action checkbox is the first column for superuser
+        self.assertListEqual(
+            list1=list(result.queryset.query.order_by), list2=["email", "username"]
+        )
+
+
+def slow_view(request: HttpRequest) -> HttpResponse:
+    """
+    View querying database after long computations.
+
+    :param request: django HTTP request object
+    :type request: HttpRequest
+    :return: response
+    :rtype: HttpResponse
+    """
+    sleep(0.02)
+    User.objects.exists()
+
+    return HttpResponse()
+
+
+@override_settings(READ_ONLY_ADMIN_QUERY_BUDGET=0.01, ROOT_URLCONF="tests.test_sites")
+class QueryBudgetReadonlyAdminTest(TestCase):
+    """Read only admin query budget tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+    def test_query_budget_exceeded_response(self) -> None:
+        """Read only user must get clean response when budget runs out."""
+        request: HttpRequest = RequestFactory().get("/admin/auth/user/")
+        request.user = User.objects.first()  # type: ignore
+        response = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        )._read_only_response(request=request, view=slow_view)
+        response.render()  # type: ignore
+
+        self.assertEqual(first=response.status_code, second=503)
+        self.assertIn(member=b"too expensive", container=response.content)
+
+    def test_query_budget_exceeded_response__for_superuser(self) -> None:
+        """Superuser queries must not be limited."""
+        request: HttpRequest = RequestFactory().get("/admin/auth/user/")
+        request.user = User.objects.first()  # type: ignore
+        request.user.is_superuser = True
+        response = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        )._read_only_response(request=request, view=slow_view)
+
+        self.assertEqual(first=response.status_code, second=200)
+
+
+@override_settings(
+    READ_ONLY_ADMIN_ADMISSION_LIMIT=1,
+    READ_ONLY_ADMIN_ADMISSION_LARGE_MODELS=["auth.User"],
+    ROOT_URLCONF="tests.test_sites",
+)
+class AdmissionReadonlyAdminTest(TestCase):
+    """Read only admin admission control tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(codename__in=["readonly_user", "view_user"])
+            )
+        )
+
+    def test_is_expensive_request(self) -> None:
+        """Show all and not filtered large model change lists must be expensive."""
+        model_admin = ReadOnlyUserAdmin(model=get_user_model(), admin_site=AdminSite())
+        user = User.objects.first()
+        requests = {
+            "/?all=": True,
+            "/?p=2&o=1": True,
+            "/?q=test": False,
+        }
+
+        for url, expected in requests.items():
+            request: HttpRequest = RequestFactory().get(url)
+            request.user = user  # type: ignore
+
+            self.assertEqual(
+                first=model_admin.is_expensive_request(request=request),
+                second=expected,
+                msg=url,
+            )
+
+    def test_is_expensive_request__for_superuser(self) -> None:
+        """Superuser requests must not be limited."""
+        request: HttpRequest = RequestFactory().get("/", {"all": ""})
+        request.user = User.objects.first()  # type: ignore
+        request.user.is_superuser = True
+
+        self.assertFalse(
+            expr=ReadOnlyUserAdmin(
+                model=get_user_model(), admin_site=AdminSite()
+            ).is_expensive_request(request=request)
+        )
+
+    def test_changelist_view(self) -> None:
+        """Expensive request must be rejected fast when limit is reached."""
+        request: HttpRequest = RequestFactory().get("/", {"all": ""})
+        request.user = User.objects.first()  # type: ignore
+
+        with admission():  # noqa: SIM117
+            with self.assertNumQueries(num=1):
+                response = ReadOnlyUserAdmin(
+                    model=get_user_model(), admin_site=AdminSite()
+                ).changelist_view(request=request)
+
+        self.assertEqual(first=response.status_code, second=503)
+        self.assertEqual(first=response["Retry-After"], second="5")
+
+
+class JsonReadOnlyUserAdmin(ReadOnlyUserAdmin):
+    """Read only admin class with JSON endpoints."""
+
+    json_views = True
+    list_per_page = 1
+
+
+class JsonReadonlyAdminTest(TestCase):
+    """Read only admin JSON endpoints tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(codename__in=["readonly_user", "view_user"])
+            )
+        )
+        User.objects.create(username="other", email="other@example.com")
+
+    def setUp(self) -> None:
+        """Set up model admin."""
+        self.model_admin = JsonReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        )
+
+    def get_request(self, **data: Any) -> HttpRequest:
+        """
+        Create read only user request.
+
+        :param data: GET parameters
+        :type data: Any
+        :return: request
+        :rtype: HttpRequest
+        """
+        request: HttpRequest = RequestFactory().get("/", data)
+        request.user = User.objects.get(username="test")
+
+        return request
+
+    def test_get_urls(self) -> None:
+        """JSON endpoints URLs must be added only if enabled."""
+        names: List[Optional[str]] = [url.name for url in self.model_admin.get_urls()]
+
+        # must be matched before object change view catch-all URL
+        self.assertLess(
+            a=names.index("auth_user_json_list"), b=names.index("auth_user_change")
+        )
+        self.assertLess(
+            a=names.index("auth_user_json_detail"), b=names.index("auth_user_change")
+        )
+        self.assertNotIn(
+            member="auth_user_json_list",
+            container=[
+                url.name
+                for url in ReadOnlyUserAdmin(
+                    model=get_user_model(), admin_site=AdminSite()
+                ).get_urls()
+            ],
+        )
+
+    def test_json_list_view(self) -> None:
+        """JSON list must be paginated without counting rows."""
+        request = self.get_request()
+        self.model_admin.has_json_permission(request=request)
+
+        with self.assertNumQueries(num=1):
+            response = self.model_admin.json_list_view(request=request)
+
+        self.assertEqual(first=response["Content-Type"], second="application/json")
+        self.assertDictEqual(
+            d1=json.loads(response.content),
+            d2={
+                "results": [
+                    {
+                        "id": User.objects.get(username="other").pk,
+                        "username": "other",
+                        "email": "other@example.com",
+                        "first_name": "",
+                        "last_name": "",
+                        "is_staff": False,
+                    }
+                ],
+                "page": 1,
+                "has_next": True,
+            },
+        )
+
+        data = json.loads(
+            self.model_admin.json_list_view(request=self.get_request(p=2)).content
+        )
+
+        self.assertListEqual(
+            list1=[row["username"] for row in data["results"]], list2=["test"]
+        )
+        self.assertFalse(expr=data["has_next"])
+
+    def test_json_list_view__search(self) -> None:
+        """JSON list must be searched like change list."""
+        data = json.loads(
+            self.model_admin.json_list_view(request=self.get_request(q="test")).content
+        )
+
+        self.assertListEqual(
+            list1=[row["username"] for row in data["results"]], list2=["test"]
+        )
+
+    def test_json_list_view__all(self) -> None:
+        """JSON list of all rows must be streamed."""
+        response = self.model_admin.json_list_view(request=self.get_request(all=""))
+
+        self.assertTrue(expr=response.streaming)
+        self.assertListEqual(
+            list1=[
+                row["username"]
+                for row in json.loads(b"".join(response.streaming_content))["results"]  # type: ignore  # noqa: E501
+            ],
+            list2=["other", "test"],
+        )
+
+    def test_json_list_view__all__too_many_rows(self) -> None:
+        """JSON list of more than list_max_show_all rows must be paginated."""
+        self.model_admin.list_max_show_all = 1
+        response = self.model_admin.json_list_view(request=self.get_request(all=""))
+
+        self.assertFalse(expr=response.streaming)
+        self.assertTrue(expr=json.loads(response.content)["has_next"])
+
+    def test_json_detail_view(self) -> None:
+        """JSON detail must contain read only model fields."""
+        user = User.objects.get(username="test")
+        data = json.loads(
+            self.model_admin.json_detail_view(
+                request=self.get_request(), object_id=str(user.pk)
+            ).content
+        )
+
+        self.assertEqual(first=data["id"], second=user.pk)
+        self.assertEqual(first=data["username"], second="test")
+        self.assertNotIn(member="groups", container=data)
+
+    def test_json_detail_view__not_found(self) -> None:
+        """Not existing object must not be found."""
+        for object_id in ["100500", "not-a-number"]:
+            with self.assertRaises(Http404):
+                self.model_admin.json_detail_view(
+                    request=self.get_request(), object_id=object_id
+                )
+
+    def test_json_list_view__for_superuser(self) -> None:
+        """Not read only users must not use JSON endpoints."""
+        request = self.get_request()
+        request.user.is_superuser = True
+
+        with self.assertRaises(PermissionDenied):
+            self.model_admin.json_list_view(request=request)
+
+    def test_json_list_view__not_safe(self) -> None:
+        """Not safe requests must be rejected."""
+        request: HttpRequest = RequestFactory().post("/")
+        request.user = User.objects.get(username="test")
+
+        with self.assertRaises(PermissionDenied):
+            self.model_admin.json_list_view(request=request)
+
+
+class UserReadonlyInline(ReadonlyTabularInline):
+    """Read only users inline."""
+
+    model = User
+    readonly_fields = ["username"]
+
+
+class EditableReadOnlyUserAdmin(ReadOnlyUserAdmin):
+    """Read only admin class with editable change list."""
+
+    list_display = ["username", "email", "first_name"]
+    list_editable = ["email", "first_name"]
+
+
+@override_settings(
+    READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email"]},
+    ROOT_URLCONF="tests.test_sites",
+)
+class ReadOnlyFieldsReadonlyAdminTest(TestCase):
+    """Read only admin read only fields tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["view_user", "change_user"])),
+            Permission.objects.create(
+                content_type=ContentType.objects.get_for_model(User),
+                codename="readonly_user__email",
+                name="Read only user email",
+            ),
+        )
+
+    def setUp(self) -> None:
+        """Set up model admin and request."""
+        self.model_admin = EditableReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        )
+        self.request: HttpRequest = RequestFactory().get("/")
+        self.request.user = User.objects.get(username="test")
+
+    def test_get_readonly_fields(self) -> None:
+        """Read only fields must be added to admin read only fields."""
+        self.assertListEqual(
+            list1=list(self.model_admin.get_readonly_fields(request=self.request)),
+            list2=["email"],
+        )
+
+    def test_get_readonly_fields__for_superuser(self) -> None:
+        """Superuser fields must not be read only."""
+        self.request.user.is_superuser = True
+
+        self.assertListEqual(
+            list1=list(self.model_admin.get_readonly_fields(request=self.request)),
+            list2=[],
+        )
+
+    def test_get_readonly_fields__inline(self) -> None:
+        """Read only fields must be added to inline read only fields."""
+        inline = UserReadonlyInline(parent_model=Group, admin_site=AdminSite())
+
+        self.assertListEqual(
+            list1=list(inline.get_readonly_fields(request=self.request)),
+            list2=["username", "email"],
+        )
+
+    def test_get_changelist_formset(self) -> None:
+        """Read only fields must be excluded from change list formset."""
+        formset: Any = self.model_admin.get_changelist_formset(request=self.request)
+
+        self.assertListEqual(list1=list(formset.form.base_fields), list2=["first_name"])
+
+    def test_changelist_view(self) -> None:
+        """Read only fields must not be editable in change list."""
+        response = self.model_admin.changelist_view(request=self.request)
+
+        self.assertListEqual(
+            list1=list(response.context_data["cl"].list_editable),  # type: ignore
+            list2=["first_name"],
+        )
+
+
+@override_settings(
+    READ_ONLY_ADMIN_VIEW_PERMISSION_MODE=True, ROOT_URLCONF="tests.test_sites"
+)
+class ViewPermissionModeReadonlyAdminTest(TestCase):
+    """Read only admin view permission mode tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(codename__in=["readonly_user", "change_user"])
+            )
+        )
+
+    def setUp(self) -> None:
+        """Set up model admin and request."""
+        self.model_admin = ReadOnlyUserAdmin(
+            model=get_user_model(), admin_site=AdminSite()
+        )
+        self.request: HttpRequest = RequestFactory().get("/")
+        self.request.user = User.objects.get(username="test")
+
+    def test_has_permission(self) -> None:
+        """Read only permission must be treated as view only permission."""
+        self.assertTrue(expr=self.model_admin.has_view_permission(request=self.request))
+        self.assertFalse(
+            expr=self.model_admin.has_change_permission(request=self.request)
+        )
+        self.assertFalse(expr=self.model_admin.has_add_permission(request=self.request))
+        self.assertFalse(
+            expr=self.model_admin.has_delete_permission(request=self.request)
+        )
+
+    def test_get_model_perms(self) -> None:
+        """Read only permission must be reported as view only permission."""
+        self.assertDictEqual(
+            d1=self.model_admin.get_model_perms(request=self.request),
+            d2={"add": False, "change": False, "delete": False, "view": True},
+        )
+
+    @override_settings(READ_ONLY_ADMIN_VIEW_PERMISSION_MODE=False)
+    def test_has_permission__disabled(self) -> None:
+        """Django permissions must be used when mode is disabled."""
+        self.assertTrue(
+            expr=self.model_admin.has_change_permission(request=self.request)
+        )
+        self.assertFalse(expr=self.model_admin.has_add_permission(request=self.request))
+
+    @override_settings(READ_ONLY_ADMIN_DEGRADED_MODE=True)
+    def test_has_view_permission__degraded_mode(self) -> None:
+        """Degraded mode must not grant view permission."""
+        model_admin = ReadonlyAdmin(model=Permission, admin_site=AdminSite())
+
+        self.assertFalse(expr=model_admin.has_view_permission(request=self.request))
+        self.assertFalse(expr=model_admin.has_change_permission(request=self.request))
+
+    def test_changelist_view(self) -> None:
+        """Change list must be rendered by django view only path without formset."""
+        response = self.model_admin.changelist_view(request=self.request)
+
+        self.assertEqual(first=response.status_code, second=200)
+        self.assertIsNone(obj=response.context_data["cl"].formset)  # type: ignore
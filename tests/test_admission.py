@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_admission.py
+
+
+from typing import List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.test.utils import override_settings
+
+from read_only_admin.admission import AdmissionDenied, admission
+
+
+__all__: List[str] = ["AdmissionTest"]
+
+
+class AdmissionTest(TestCase):
+    """admission tests."""
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def test_admission(self) -> None:
+        """Operations must run without limits by default."""
+        with admission():  # noqa: SIM117
+            with admission():
+                ...
+
+    @override_settings(READ_ONLY_ADMIN_ADMISSION_LIMIT=1)
+    def test_admission__limit(self) -> None:
+        """Operations over per process limit must be rejected."""
+        with admission():  # noqa: SIM117
+            with self.assertRaises(AdmissionDenied):  # noqa: SIM117
+                with admission():
+                    ...
+
+    @override_settings(READ_ONLY_ADMIN_ADMISSION_LIMIT=1)
+    def test_admission__release(self) -> None:
+        """Slot must be freed after operation."""
+        with admission():
+            ...
+
+        with admission():
+            ...
+
+    @override_settings(READ_ONLY_ADMIN_ADMISSION_GLOBAL_LIMIT=1)
+    def test_admission__global_limit(self) -> None:
+        """Operations over global limit must be rejected."""
+        with admission():  # noqa: SIM117
+            with self.assertRaises(AdmissionDenied):  # noqa: SIM117
+                with admission():
+                    ...
+
+        with admission():
+            ...
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_backends.py
+
+
+from typing import Any, List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+
+from read_only_admin.resolver import is_read_only
+from read_only_admin.backends import ReadOnlyPermissionBackend
+
+
+__all__: List[str] = ["SlowBackend", "ReadOnlyPermissionBackendTest"]
+
+
+User = get_user_model()
+
+
+class SlowBackend(ModelBackend):
+    """Backend remembering permissions it was asked about."""
+
+    perms: List[str] = []
+
+    def has_perm(self, user_obj: Any, perm: str, obj: Any = None) -> bool:
+        """
+        Remember asked permission.
+
+        :param user_obj: user object
+        :type user_obj: Any
+        :param perm: permission name
+        :type perm: str
+        :param obj: object for object level permissions
+        :type obj: Any
+        :return: has user permission
+        :rtype: bool
+        """
+        self.perms.append(perm)
+
+        return super(SlowBackend, self).has_perm(user_obj=user_obj, perm=perm, obj=obj)
+
+    def get_all_permissions(self, user_obj: Any, obj: Any = None) -> Any:
+        """
+        Remember all permissions were asked.
+
+        :param user_obj: user object
+        :type user_obj: Any
+        :param obj: object for object level permissions
+        :type obj: Any
+        :return: user permissions
+        :rtype: Any
+        """
+        self.perms.append("*")
+
+        return super(SlowBackend, self).get_all_permissions(user_obj=user_obj, obj=obj)
+
+
+@override_settings(
+    AUTHENTICATION_BACKENDS=[
+        "read_only_admin.backends.ReadOnlyPermissionBackend",
+        "tests.test_backends.SlowBackend",
+    ]
+)
+class ReadOnlyPermissionBackendTest(TestCase):
+    """Read only permissions authentication backend tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+        group = Group.objects.create(name="test")
+        group.permissions.add(
+            *list(
+                Permission.objects.filter(
+                    codename__in=["readonly_group", "change_group"]
+                )
+            )
+        )
+        user.groups.add(group)
+
+    def setUp(self) -> None:
+        """Clean up remembered permissions."""
+        SlowBackend.perms.clear()
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def test_has_perm(self) -> None:
+        """Read only permissions must be answered without next backends."""
+        user = User.objects.get(username="test")
+
+        self.assertTrue(expr=user.has_perm("auth.readonly_user"))
+        self.assertTrue(expr=user.has_perm("auth.readonly_group"))
+        self.assertListEqual(list1=SlowBackend.perms, list2=[])
+
+    def test_has_perm__denied(self) -> None:
+        """Missing read only permissions must not be asked from next backends."""
+        user = User.objects.get(username="test")
+
+        self.assertFalse(expr=user.has_perm("auth.readonly_permission"))
+        self.assertListEqual(list1=SlowBackend.perms, list2=[])
+
+    def test_has_perm__other(self) -> None:
+        """Other permissions must be left to next backends."""
+        user = User.objects.get(username="test")
+
+        self.assertTrue(expr=user.has_perm("auth.change_group"))
+        self.assertFalse(expr=user.has_perm("auth.change_user"))
+        self.assertIn(member="auth.change_group", container=SlowBackend.perms)
+        self.assertIn(member="auth.change_user", container=SlowBackend.perms)
+
+    def test_has_perm__inactive(self) -> None:
+        """Inactive users must not have read only permissions."""
+        user = User.objects.get(username="test")
+        user.is_active = False
+
+        self.assertFalse(expr=user.has_perm("auth.readonly_user"))
+
+    def test_get_read_only_permissions__cache(self) -> None:
+        """Index must be cached between user objects until permissions change."""
+        backend = ReadOnlyPermissionBackend()
+        backend.get_read_only_permissions(user_obj=User.objects.get(username="test"))
+        user = User.objects.get(username="test")
+
+        with self.assertNumQueries(num=0):
+            permissions = backend.get_read_only_permissions(user_obj=user)
+
+        self.assertSetEqual(
+            set1=permissions,  # type: ignore
+            set2={("auth", "readonly_user"), ("auth", "readonly_group")},
+        )
+
+        user.user_permissions.clear()
+        user = User.objects.get(username="test")
+
+        with self.assertNumQueries(num=1):
+            permissions = backend.get_read_only_permissions(user_obj=user)
+
+        self.assertSetEqual(
+            set1=permissions, set2={("auth", "readonly_group")}  # type: ignore
+        )
+
+    def test_get_all_permissions(self) -> None:
+        """Backend must return only read only permissions names."""
+        self.assertSetEqual(
+            set1=ReadOnlyPermissionBackend().get_all_permissions(
+                user_obj=User.objects.get(username="test")
+            ),
+            set2={"auth.readonly_user", "auth.readonly_group"},
+        )
+
+    def test_is_read_only(self) -> None:
+        """Resolver must use backend index instead of next backends."""
+        user = User.objects.get(username="test")
+
+        self.assertTrue(expr=is_read_only(user=user, model="auth.user"))
+        self.assertFalse(expr=is_read_only(user=user, model="auth.permission"))
+        self.assertListEqual(list1=SlowBackend.perms, list2=[])
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_checks.py
+
+
+from typing import List
+
+from django.test import SimpleTestCase
+from django.test.utils import override_settings
+
+from read_only_admin.checks import check_cache
+
+
+__all__: List[str] = ["CheckCacheTest"]
+
+
+class CheckCacheTest(SimpleTestCase):
+    """check_cache tests."""
+
+    @override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=True)
+    def test_check_cache(self) -> None:
+        """Not shared cache must be reported if permissions generation is used."""
+        self.assertListEqual(
+            list1=[message.id for message in check_cache()],
+            list2=["read_only_admin.W001"],
+        )
+
+    @override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=False)
+    def test_check_cache__not_used(self) -> None:
+        """Nothing must be reported if permissions generation is not used."""
+        self.assertListEqual(list1=check_cache(), list2=[])
+
+    @override_settings(
+        READ_ONLY_ADMIN_SESSION_SNAPSHOT=True,
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": "/tmp/read_only_admin",
+            }
+        },
+    )
+    def test_check_cache__shared(self) -> None:
+        """Nothing must be reported for cache shared between processes."""
+        self.assertListEqual(list1=check_cache(), list2=[])
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_db.py
+
+
+from time import sleep
+from typing import List
+
+from django.test import TestCase
+from django.db.utils import OperationalError
+from django.db import connection, transaction
+from django.contrib.auth import get_user_model
+
+from read_only_admin.db import QueryBudgetExceeded, query_budget, read_only_transaction
+
+
+__all__: List[str] = ["ReadOnlyTransactionTest", "QueryBudgetTest"]
+
+
+# counts to 10^8, takes much longer than any test budget
+EXPENSIVE_QUERY: str = """
+    WITH RECURSIVE counter(n) AS (
+        SELECT 1 UNION ALL SELECT n + 1 FROM counter WHERE n < 100000000
+    )
+    SELECT COUNT(*) FROM counter
+"""
+
+
+User = get_user_model()
+
+
+class ReadOnlyTransactionTest(TestCase):
+    """read_only_transaction tests."""
+
+    def test_read_only_transaction(self) -> None:
+        """Writes must be rejected by database inside context."""
+        with read_only_transaction(using="default"):
+            self.assertFalse(expr=User.objects.exists())
+
+            with self.assertRaises(OperationalError):  # noqa: SIM117
+                with transaction.atomic():
+                    User.objects.create(username="test")
+
+    def test_read_only_transaction__exit(self) -> None:
+        """Writes must be allowed after context exit."""
+        with read_only_transaction(using="default"):
+            ...
+
+        User.objects.create(username="test")
+
+        self.assertTrue(expr=User.objects.exists())
+
+
+class QueryBudgetTest(TestCase):
+    """query_budget tests."""
+
+    def test_query_budget(self) -> None:
+        """Running query must be cut off by database when budget runs out."""
+        with query_budget(using=["default"], timeout=0.05):  # noqa: SIM117
+            with self.assertRaises(QueryBudgetExceeded):  # noqa: SIM117
+                with connection.cursor() as cursor:
+                    cursor.execute(EXPENSIVE_QUERY)
+
+    def test_query_budget__exhausted(self) -> None:
+        """Query must not be started after budget runs out."""
+        with query_budget(using=["default"], timeout=0.01):
+            sleep(0.02)
+
+            with self.assertRaises(QueryBudgetExceeded):  # noqa: SIM117
+                with self.assertNumQueries(num=0):
+                    User.objects.exists()
+
+    def test_query_budget__exit(self) -> None:
+        """Queries must not be limited after context exit."""
+        with query_budget(using=["default"], timeout=0.01):
+            ...
+        sleep(0.02)
+
+        self.assertFalse(expr=User.objects.exists())
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_degraded.py
+
+
+from typing import List
+from tempfile import NamedTemporaryFile
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+
+from read_only_admin.resolver import is_read_only
+from read_only_admin.degraded import is_degraded_mode
+
+
+__all__: List[str] = ["IsDegradedModeTest"]
+
+
+User = get_user_model()
+
+
+class IsDegradedModeTest(TestCase):
+    """is_degraded_mode tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def test_is_degraded_mode(self) -> None:
+        """Degraded mode must be disabled by default."""
+        self.assertFalse(expr=is_degraded_mode())
+
+    @override_settings(READ_ONLY_ADMIN_DEGRADED_MODE=True)
+    def test_is_degraded_mode__setting(self) -> None:
+        """Degraded mode must be enabled by setting."""
+        self.assertTrue(expr=is_degraded_mode())
+
+    def test_is_degraded_mode__file(self) -> None:
+        """Degraded mode must be enabled by file flag."""
+        with NamedTemporaryFile() as flag:  # noqa: SIM117
+            with override_settings(READ_ONLY_ADMIN_DEGRADED_MODE_FILE=flag.name):
+                self.assertTrue(expr=is_degraded_mode())
+
+        with override_settings(READ_ONLY_ADMIN_DEGRADED_MODE_FILE=flag.name):
+            self.assertFalse(expr=is_degraded_mode())
+
+    @override_settings(READ_ONLY_ADMIN_DEGRADED_MODE_CACHE_KEY="degraded")
+    def test_is_degraded_mode__cache_key(self) -> None:
+        """Degraded mode must be enabled by cache key."""
+        self.assertFalse(expr=is_degraded_mode())
+
+        cache.set("degraded", True)
+
+        self.assertTrue(expr=is_degraded_mode())
+
+    @override_settings(READ_ONLY_ADMIN_DEGRADED_MODE=True)
+    def test_is_read_only__degraded_mode(self) -> None:
+        """Resolver must make everything read only without permissions lookup."""
+        user = User.objects.first()
+
+        with self.assertNumQueries(num=0):
+            self.assertTrue(expr=is_read_only(user=user, model=User))
+
+    @override_settings(READ_ONLY_ADMIN_DEGRADED_MODE=True)
+    def test_is_read_only__degraded_mode__for_superuser(self) -> None:
+        """Resolver must not make anything read only for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+
+        self.assertFalse(expr=is_read_only(user=user, model=User))
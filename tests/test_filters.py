@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_filters.py
+
+
+from typing import List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.db.models import QuerySet
+from django.test.client import RequestFactory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import Group, Permission
+from django.contrib.admin.filters import BooleanFieldListFilter
+
+from read_only_admin.admin import ReadonlyAdmin
+from read_only_admin.sites import get_readonly_admin_class
+from read_only_admin.filters import (
+    CachedRelatedFieldListFilter,
+    CachedAllValuesFieldListFilter,
+    get_cache_scope,
+)
+
+
+__all__: List[str] = ["GetCacheScopeTest", "CachedFieldListFilterTest"]
+
+
+User = get_user_model()
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    list_filter = ["is_active", "groups", "last_name"]
+
+
+class ScopedUserAdmin(UserAdmin):
+    """Admin class with per user queryset."""
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:  # type: ignore
+        """
+        Get only request user.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: admin queryset
+        :rtype: QuerySet
+        """
+        return (
+            super(ScopedUserAdmin, self)
+            .get_queryset(request=request)
+            .filter(pk=request.user.pk)
+        )
+
+
+class ScopedReadOnlyUserAdmin(ReadOnlyUserAdmin):
+    """Read only admin class with per user queryset."""
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:  # type: ignore
+        """
+        Get only request user.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :return: admin queryset
+        :rtype: QuerySet
+        """
+        return (
+            super(ScopedReadOnlyUserAdmin, self)
+            .get_queryset(request=request)
+            .filter(pk=request.user.pk)
+        )
+
+
+class GetCacheScopeTest(TestCase):
+    """get_cache_scope tests."""
+
+    def setUp(self) -> None:
+        """Set up request."""
+        self.request: HttpRequest = RequestFactory().get("/")
+        self.request.user = User(pk=1)
+
+    def test_get_cache_scope(self) -> None:
+        """Nothing must be returned for admin with default queryset."""
+        self.assertIsNone(
+            obj=get_cache_scope(
+                model_admin=ReadOnlyUserAdmin(model=User, admin_site=AdminSite()),
+                request=self.request,
+            )
+        )
+
+    def test_get_cache_scope__wrapped_admin(self) -> None:
+        """User must be returned for generated read only admin of admin with overridden queryset."""  # noqa: E501
+        self.assertEqual(
+            first=get_cache_scope(
+                model_admin=get_readonly_admin_class(admin_class=ScopedUserAdmin)(
+                    model=User, admin_site=AdminSite()
+                ),
+                request=self.request,
+            ),
+            second=1,
+        )
+
+    def test_get_cache_scope__overridden_queryset(self) -> None:
+        """User must be returned for admin with overridden queryset."""
+        self.assertEqual(
+            first=get_cache_scope(
+                model_admin=ScopedReadOnlyUserAdmin(model=User, admin_site=AdminSite()),
+                request=self.request,
+            ),
+            second=1,
+        )
+
+
+@override_settings(READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT=60)
+class CachedFieldListFilterTest(TestCase):
+    """Cached field list filters tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            last_name="Test",
+            is_staff=True,
+        )
+        user.user_permissions.add(*list(Permission.objects.all()))
+        Group.objects.create(name="first")
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def _get_filters(self, user: User) -> List[object]:  # type: ignore
+        """
+        Get change list filters specs.
+
+        :param user: user object
+        :type user: User
+        :return: filters specs
+        :rtype: List[object]
+        """
+        request = RequestFactory().get("/")
+        request.user = user
+        changelist = ReadOnlyUserAdmin(
+            model=User, admin_site=AdminSite()
+        ).get_changelist_instance(request=request)
+
+        return changelist.filter_specs  # type: ignore
+
+    def test_filters(self) -> None:
+        """Read only user must get cached filters."""
+        filters = self._get_filters(user=User.objects.first())
+
+        self.assertListEqual(
+            list1=[filter_spec.__class__ for filter_spec in filters],
+            list2=[
+                BooleanFieldListFilter,
+                CachedRelatedFieldListFilter,
+                CachedAllValuesFieldListFilter,
+            ],
+        )
+        self.assertListEqual(
+            list1=filters[1].lookup_choices,  # type: ignore
+            list2=[(Group.objects.get().pk, "first")],
+        )
+        self.assertListEqual(
+            list1=filters[2].lookup_choices, list2=["Test"]  # type: ignore
+        )
+
+    def test_filters__cached(self) -> None:
+        """Filters choices must be taken from cache."""
+        user = User.objects.first()
+        self._get_filters(user=user)
+        Group.objects.filter(name="first").update(name="changed")
+
+        filters = self._get_filters(user=user)
+
+        self.assertListEqual(
+            list1=filters[1].lookup_choices,  # type: ignore
+            list2=[(Group.objects.get().pk, "first")],
+        )
+
+    def test_filters__version(self) -> None:
+        """Filters choices must be recomputed after data changes."""
+        user = User.objects.first()
+        self._get_filters(user=user)
+        Group.objects.create(name="second")
+
+        filters = self._get_filters(user=user)
+
+        self.assertEqual(first=len(filters[1].lookup_choices), second=2)  # type: ignore
+
+    def test_filters__for_superuser(self) -> None:
+        """Superuser must get default filters."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+
+        self.assertNotIsInstance(
+            obj=self._get_filters(user=user)[1], cls=CachedRelatedFieldListFilter
+        )
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_indexes.py
+
+
+from typing import List
+
+from django.db.models import F
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import Permission
+
+from read_only_admin.indexes import (
+    get_indexed_fields,
+    get_ordering_field,
+    is_indexed_ordering,
+)
+
+
+__all__: List[str] = ["IndexesTest"]
+
+
+User = get_user_model()
+
+
+def get_full_name(obj: User) -> str:  # type: ignore
+    """
+    Get user full name.
+
+    :param obj: user object
+    :type obj: User
+    :return: user full name
+    :rtype: str
+    """
+    return obj.get_full_name()  # type: ignore
+
+
+get_full_name.admin_order_field = "last_name"  # type: ignore
+
+
+class IndexesTest(TestCase):
+    """Indexed fields helpers tests."""
+
+    def test_get_indexed_fields(self) -> None:
+        """Primary key, unique fields and meta indexes must be indexed."""
+        self.assertSetEqual(
+            set1=get_indexed_fields(model=User),
+            set2={"pk", "id", "username"},
+        )
+
+    def test_get_indexed_fields__unique_together(self) -> None:
+        """Foreign keys and unique together leading fields must be indexed."""
+        self.assertSetEqual(
+            set1=get_indexed_fields(model=Permission),
+            set2={"pk", "id", "content_type"},
+        )
+
+    @override_settings(READ_ONLY_ADMIN_INDEXED_SORTING_INTROSPECTION=True)
+    def test_get_indexed_fields__introspection(self) -> None:
+        """Database indexes must be introspected once."""
+        result = get_indexed_fields(model=Permission)
+
+        with self.assertNumQueries(num=0):
+            self.assertIs(expr1=get_indexed_fields(model=Permission), expr2=result)
+        self.assertIn(member="content_type", container=result)
+
+    def test_get_ordering_field(self) -> None:
+        """Ordering field must be resolved like django change list does."""
+        model_admin = UserAdmin(model=User, admin_site=AdminSite())
+
+        self.assertEqual(
+            first=get_ordering_field(
+                model=User, model_admin=model_admin, field_name="email"
+            ),
+            second="email",
+        )
+        self.assertEqual(
+            first=get_ordering_field(
+                model=User, model_admin=model_admin, field_name=get_full_name
+            ),
+            second="last_name",
+        )
+        self.assertIsNone(
+            obj=get_ordering_field(
+                model=User, model_admin=model_admin, field_name="__str__"
+            )
+        )
+
+    def test_is_indexed_ordering(self) -> None:
+        """Only ordering by indexed fields must be allowed."""
+        self.assertTrue(
+            expr=is_indexed_ordering(model=User, ordering_field="-username")
+        )
+        self.assertFalse(expr=is_indexed_ordering(model=User, ordering_field="email"))
+        self.assertFalse(expr=is_indexed_ordering(model=User, ordering_field=F("id")))
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_loadtest.py
+
+
+from typing import Any, Dict, List
+
+from django.test import SimpleTestCase
+
+from tests.loadtest.harness import (
+    Sample,
+    summarize,
+    percentile,
+    format_report,
+    parse_overrides,
+    format_first_request_report,
+)
+
+
+__all__: List[str] = [
+    "ParseOverridesLoadTestTest",
+    "PercentileLoadTestTest",
+    "SummarizeLoadTestTest",
+    "FormatFirstRequestReportLoadTestTest",
+]
+
+
+class ParseOverridesLoadTestTest(SimpleTestCase):
+    """parse_overrides load test harness util tests."""
+
+    def test_parse_overrides(self) -> None:
+        """Python literals must be evaluated, other values must be kept as strings."""
+        self.assertDictEqual(
+            d1=parse_overrides(
+                values=[
+                    "READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT=300",
+                    "READ_ONLY_ADMIN_STREAMING=True",
+                    "READ_ONLY_ADMIN_REPLICA_DATABASE=replica",
+                    "READ_ONLY_ADMIN_ADMISSION_LARGE_MODELS=['auth.user']",
+                ]
+            ),
+            d2={
+                "READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT": 300,
+                "READ_ONLY_ADMIN_STREAMING": True,
+                "READ_ONLY_ADMIN_REPLICA_DATABASE": "replica",
+                "READ_ONLY_ADMIN_ADMISSION_LARGE_MODELS": ["auth.user"],
+            },
+        )
+
+    def test_parse_overrides__without_value(self) -> None:
+        """Override without value must raise error."""
+        with self.assertRaises(ValueError):
+            parse_overrides(values=["READ_ONLY_ADMIN_STREAMING"])
+
+
+class PercentileLoadTestTest(SimpleTestCase):
+    """percentile load test harness util tests."""
+
+    def test_percentile(self) -> None:
+        """Nearest rank percentiles must be returned."""
+        values: List[float] = [float(value) for value in range(100, 0, -1)]
+
+        self.assertEqual(first=percentile(values=values, rank=50), second=50.0)
+        self.assertEqual(first=percentile(values=values, rank=95), second=95.0)
+        self.assertEqual(first=percentile(values=values, rank=99), second=99.0)
+        self.assertEqual(first=percentile(values=[1.0], rank=99), second=1.0)
+
+    def test_percentile__without_values(self) -> None:
+        """Zero must be returned for no values."""
+        self.assertEqual(first=percentile(values=[], rank=50), second=0.0)
+
+
+class SummarizeLoadTestTest(SimpleTestCase):
+    """summarize and format_report load test harness utils tests."""
+
+    samples: List[Sample] = [
+        ("changelist", 0.1, 4, 200),
+        ("changelist", 0.3, 6, 200),
+        ("save", 0.2, 10, 500),
+    ]
+
+    def test_summarize(self) -> None:
+        """Statistics must be calculated per endpoint and in total."""
+        summary: Dict[str, Dict[str, Any]] = summarize(
+            samples=self.samples, elapsed=2.0
+        )
+
+        self.assertListEqual(
+            list1=sorted(summary), list2=["changelist", "save", "total"]
+        )
+        self.assertDictEqual(
+            d1=summary["changelist"],
+            d2={
+                "requests": 2,
+                "errors": 0,
+                "throughput": 1.0,
+                "queries": 5.0,
+                "p50": 0.1,
+                "p95": 0.3,
+                "p99": 0.3,
+            },
+        )
+        self.assertEqual(first=summary["total"]["requests"], second=3)
+        self.assertEqual(first=summary["total"]["errors"], second=1)
+
+    def test_format_report(self) -> None:
+        """Report must contain header, endpoints rows and total row last."""
+        report: List[str] = format_report(
+            summary=summarize(samples=self.samples, elapsed=2.0)
+        ).splitlines()
+
+        self.assertEqual(first=len(report), second=4)
+        self.assertTrue(expr=report[0].startswith("endpoint"))
+        self.assertTrue(expr=report[1].startswith("changelist"))
+        self.assertTrue(expr=report[-1].startswith("total"))
+        self.assertIn(member="200.0", container=report[-1])
+
+
+class FormatFirstRequestReportLoadTestTest(SimpleTestCase):
+    """format_first_request_report load test harness util tests."""
+
+    def test_format_first_request_report(self) -> None:
+        """Report must contain header and cold and warm modes rows."""
+        report: List[str] = format_first_request_report(
+            latencies={"cold": [0.3, 0.1, 0.2], "warm": [0.05]}
+        ).splitlines()
+
+        self.assertEqual(first=len(report), second=3)
+        self.assertTrue(expr=report[0].startswith("first request"))
+        self.assertListEqual(
+            list1=report[1].split(), list2=["cold", "3", "200.0", "300.0"]
+        )
+        self.assertListEqual(
+            list1=report[2].split(), list2=["warm", "1", "50.0", "50.0"]
+        )
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_middleware.py
+
+
+from typing import Any, Dict, List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from django.contrib.auth.models import Permission
+from django.http import HttpRequest, HttpResponse
+
+from read_only_admin.snapshot import SESSION_KEY
+from read_only_admin.resolver import is_read_only
+from read_only_admin.middleware import ReadOnlyAdminSnapshotMiddleware
+
+
+__all__: List[str] = ["ReadOnlyAdminSnapshotMiddlewareTest"]
+
+
+User = get_user_model()
+
+
+def view(request: HttpRequest) -> HttpResponse:
+    """
+    View checking read only permission.
+
+    :param request: django HTTP request object
+    :type request: HttpRequest
+    :return: response
+    :rtype: HttpResponse
+    """
+    return HttpResponse(content=str(is_read_only(user=request.user, model="auth.user")))
+
+
+@override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=True)
+class ReadOnlyAdminSnapshotMiddlewareTest(TestCase):
+    """Read only admin session snapshot middleware tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+    def setUp(self) -> None:
+        """Set up middleware and session."""
+        self.middleware = ReadOnlyAdminSnapshotMiddleware(get_response=view)
+        self.session: Dict[str, Any] = {}
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def get_request(self) -> HttpRequest:
+        """
+        Create request like authentication middleware does.
+
+        :return: request
+        :rtype: HttpRequest
+        """
+        request = HttpRequest()
+        request.session = self.session  # type: ignore
+        request.user = request._cached_user = User.objects.get(  # type: ignore
+            username="test"
+        )
+
+        return request
+
+    def test__call__(self) -> None:
+        """Snapshot must be saved on first request and used on next ones."""
+        self.middleware(self.get_request())
+
+        self.assertIn(member=SESSION_KEY, container=self.session)
+
+        request = self.get_request()
+        with self.assertNumQueries(num=0):
+            response = self.middleware(request)
+
+        self.assertEqual(first=response.content, second=b"True")
+
+    def test__call__stale(self) -> None:
+        """Permissions changes must take effect on next request."""
+        self.middleware(self.get_request())
+        User.objects.get(username="test").user_permissions.clear()
+        request = self.get_request()
+
+        with self.assertNumQueries(num=1):
+            response = self.middleware(request)
+
+        self.assertEqual(first=response.content, second=b"False")
+
+    @override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=False)
+    def test__call__disabled(self) -> None:
+        """Snapshot must not be saved when disabled."""
+        self.middleware(self.get_request())
+
+        self.assertNotIn(member=SESSION_KEY, container=self.session)
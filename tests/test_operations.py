@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_operations.py
+
+
+from typing import List
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+
+from read_only_admin.operations import convert_read_only_permissions
+
+
+__all__: List[str] = ["ConvertReadOnlyPermissionsOperationTest"]
+
+
+User = get_user_model()
+
+
+class ConvertReadOnlyPermissionsOperationTest(TestCase):
+    """convert_read_only_permissions migration operation tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(
+                    codename__in=[
+                        "readonly_user",
+                        "change_user",
+                        "delete_user",
+                        "change_group",
+                    ]
+                )
+            )
+        )
+        group = Group.objects.create(name="test")
+        group.permissions.add(
+            *list(
+                Permission.objects.filter(codename__in=["readonly_group", "add_group"])
+            )
+        )
+
+    def test_convert_read_only_permissions(self) -> None:
+        """Read only grants must be replaced by view only grants."""
+        convert_read_only_permissions(
+            apps=apps, schema_editor=SimpleNamespace(connection=connection)
+        )
+
+        self.assertSetEqual(
+            set1=set(
+                User.objects.get(username="test").user_permissions.values_list(
+                    "codename", flat=True
+                )
+            ),
+            set2={"view_user", "change_group"},
+        )
+        self.assertSetEqual(
+            set1=set(
+                Group.objects.get(name="test").permissions.values_list(
+                    "codename", flat=True
+                )
+            ),
+            set2={"view_group"},
+        )
+
+    def test_convert_read_only_permissions__idempotent(self) -> None:
+        """Second run must change nothing."""
+        convert_read_only_permissions(
+            apps=apps, schema_editor=SimpleNamespace(connection=connection)
+        )
+        convert_read_only_permissions(
+            apps=apps, schema_editor=SimpleNamespace(connection=connection)
+        )
+
+        self.assertSetEqual(
+            set1=set(
+                User.objects.get(username="test").user_permissions.values_list(
+                    "codename", flat=True
+                )
+            ),
+            set2={"view_user", "change_group"},
+        )
+
+    def test_convert_read_only_permissions__inherited_from_group(self) -> None:
+        """Read only grants must be kept if user still has change permission from group."""  # noqa: E501
+        user = User.objects.create(
+            username="editor",
+            email="editor@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(Permission.objects.get(codename="readonly_user"))
+        editors = Group.objects.create(name="editors")
+        editors.permissions.add(Permission.objects.get(codename="change_user"))
+        user.groups.add(editors)
+
+        with self.assertWarns(RuntimeWarning):
+            convert_read_only_permissions(
+                apps=apps, schema_editor=SimpleNamespace(connection=connection)
+            )
+
+        self.assertSetEqual(
+            set1=set(user.user_permissions.values_list("codename", flat=True)),
+            set2={"readonly_user"},
+        )
+        self.assertSetEqual(
+            set1=set(editors.permissions.values_list("codename", flat=True)),
+            set2={"change_user"},
+        )
+        self.assertSetEqual(
+            set1=set(
+                User.objects.get(username="test").user_permissions.values_list(
+                    "codename", flat=True
+                )
+            ),
+            set2={"view_user", "change_group"},
+        )
+
+    def test_convert_read_only_permissions__group_member_with_change(self) -> None:
+        """Group read only grants must be kept if some member has change permission."""  # noqa: E501
+        user = User.objects.get(username="test")
+        group = Group.objects.get(name="test")
+        user.groups.add(group)
+
+        with self.assertWarns(RuntimeWarning):
+            convert_read_only_permissions(
+                apps=apps, schema_editor=SimpleNamespace(connection=connection)
+            )
+
+        self.assertSetEqual(
+            set1=set(group.permissions.values_list("codename", flat=True)),
+            set2={"readonly_group", "add_group"},
+        )
+        self.assertSetEqual(
+            set1=set(user.user_permissions.values_list("codename", flat=True)),
+            set2={"view_user", "change_group"},
+        )
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_registry.py
+
+
+from typing import List
+from unittest.mock import patch
+
+from django.contrib.admin import options
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.test import TestCase, RequestFactory
+from django.contrib.auth.models import Group, Permission
+
+from read_only_admin import registry as read_only_registry
+from read_only_admin.admin import ReadonlyAdmin, ReadonlyTabularInline
+from read_only_admin.registry import (
+    ReadonlyModel,
+    get_registry,
+    build_registry,
+    get_field_index,
+    build_field_index,
+    get_registry_entry,
+)
+
+
+__all__: List[str] = ["RegistryTest", "FieldIndexTest"]
+
+
+User = get_user_model()
+
+
+class UserGroupsInline(ReadonlyTabularInline):
+    """Read only user groups inline."""
+
+    model = User.groups.through
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    inlines = [UserGroupsInline]
+
+
+class RegistryTest(TestCase):
+    """Read only registry tests."""
+
+    def setUp(self) -> None:
+        """Set up admin site with read only admins."""
+        self.site = AdminSite(name="registry")
+        self.site.register(User, ReadOnlyUserAdmin)
+        self.site.register(Permission)
+
+    def tearDown(self) -> None:
+        """Drop test admin site from registry."""
+        del self.site
+        build_registry()
+
+    def test_build_registry(self) -> None:
+        """Registry must contain read only admins and inlines models."""
+        with self.assertNumQueries(num=0):
+            registry = build_registry()
+
+        self.assertEqual(
+            first=registry["auth.user"],
+            second=ReadonlyModel(
+                permission="auth.readonly_user",
+                fields=(
+                    "id",
+                    "password",
+                    "last_login",
+                    "is_superuser",
+                    "username",
+                    "first_name",
+                    "last_name",
+                    "email",
+                    "is_staff",
+                    "is_active",
+                    "date_joined",
+                    "groups",
+                    "user_permissions",
+                ),
+                inlines=(("auth.user_groups", "user"),),
+            ),
+        )
+        self.assertIn(member="auth.user_groups", container=registry)
+        self.assertNotIn(member="auth.permission", container=registry)
+
+    def test_build_registry__immutable(self) -> None:
+        """Registry must be immutable."""
+        registry = build_registry()
+
+        with self.assertRaises(TypeError):
+            registry["auth.group"] = get_registry_entry(model=Group)  # type: ignore
+
+    def test_get_registry(self) -> None:
+        """Getter must return last built registry."""
+        registry = build_registry()
+
+        self.assertIs(expr1=get_registry(), expr2=registry)
+
+    def test_build_registry__flat(self) -> None:
+        """Registry build work must not grow with admins of already registered models."""  # noqa: E501
+        sites: List[AdminSite] = []
+
+        def build() -> List[int]:
+            with patch.object(  # noqa: SIM117
+                read_only_registry,
+                "_create_entry",
+                wraps=read_only_registry._create_entry,
+            ) as create_entry, patch.object(
+                read_only_registry,
+                "_get_fk_name",
+                wraps=read_only_registry._get_fk_name,
+            ) as get_fk_name:
+                with self.assertNumQueries(num=0):
+                    build_registry()
+
+            return [create_entry.call_count, get_fk_name.call_count]
+
+        calls: List[int] = build()
+        for index in range(100):
+            site = AdminSite(name=f"registry-{index}")
+            site.register(User, ReadOnlyUserAdmin)
+            sites.append(site)
+
+        self.assertListEqual(list1=build(), list2=calls)
+
+    @override_settings(READ_ONLY_ADMIN_PERMISSION_PREFIX="ro")
+    def test_build_registry__permission_prefix(self) -> None:
+        """Registry must be rebuilt with new read only permissions names."""
+        build_registry()
+
+        with override_settings(READ_ONLY_ADMIN_PERMISSION_PREFIX="view_only"):
+            self.assertEqual(
+                first=get_registry()["auth.user"].permission,
+                second="auth.view_only_user",
+            )
+
+    def test_get_formset(self) -> None:
+        """Inline formset must use foreign key name from registry."""
+        build_registry()
+        request = RequestFactory().get("/")
+        request.user = User.objects.create(
+            username="test", password=User.objects.make_random_password()
+        )
+
+        with patch.object(
+            options,
+            "inlineformset_factory",
+            wraps=options.inlineformset_factory,  # type: ignore
+        ) as factory:
+            formset = UserGroupsInline(
+                parent_model=User, admin_site=self.site
+            ).get_formset(request=request)
+
+        self.assertEqual(first=factory.call_args.kwargs["fk_name"], second="user")
+        self.assertEqual(first=formset.fk.name, second="user")  # type: ignore
+
+    def test_get_registry_entry__not_registered(self) -> None:
+        """Entry for not registered model must be computed on the fly."""
+        build_registry()
+
+        self.assertEqual(
+            first=get_registry_entry(model=Group),
+            second=ReadonlyModel(
+                permission="auth.readonly_group",
+                fields=("id", "name", "permissions"),
+                inlines=(),
+            ),
+        )
+
+
+class FieldIndexTest(TestCase):
+    """Read only fields index tests."""
+
+    @override_settings(
+        READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email", "last_name", "email"]}
+    )
+    def test_build_field_index(self) -> None:
+        """Index must contain opt-in models unique fields in stable order."""
+        with self.assertNumQueries(num=0):
+            index = build_field_index()
+
+        self.assertDictEqual(d1=dict(index), d2={"auth.user": ("email", "last_name")})
+
+    def test_get_field_index(self) -> None:
+        """Index entry must be rebuilt on setting change and empty for other models."""  # noqa: E501
+        with override_settings(
+            READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email"]}
+        ):
+            self.assertTupleEqual(
+                tuple1=get_field_index(label="auth.user"), tuple2=("email",)
+            )
+            self.assertTupleEqual(tuple1=get_field_index(label="auth.group"), tuple2=())
+
+        self.assertTupleEqual(tuple1=get_field_index(label="auth.user"), tuple2=())
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_resolver.py
+
+
+from unittest import skipIf
+from typing import Any, List
+
+import django
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+
+from read_only_admin.conf import settings
+from read_only_admin.resolver import (
+    is_read_only,
+    ais_read_only,
+    get_read_only_fields,
+    get_read_only_fields_mask,
+    get_read_only_content_types,
+    aget_read_only_content_types,
+)
+
+
+__all__: List[str] = [
+    "CustomBackend",
+    "GetReadOnlyContentTypesResolverTest",
+    "IsReadOnlyResolverTest",
+    "AsyncResolverTest",
+    "ReadOnlyFieldsResolverTest",
+]
+
+
+User = get_user_model()
+
+
+class CustomBackend(ModelBackend):
+    """Not a django model backend for resolver fallback testing."""
+
+    ...
+
+
+class GetReadOnlyContentTypesResolverTest(TestCase):
+    """get_read_only_content_types resolver tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+        group = Group.objects.create(name="test")
+        group.permissions.add(
+            *list(
+                Permission.objects.filter(
+                    codename__in=["readonly_group", "change_group"]
+                )
+            )
+        )
+        user.groups.add(group)
+
+    def test_get_read_only_content_types(self) -> None:
+        """Resolver must return user and user groups read only content types."""
+        user = User.objects.first()
+
+        with self.assertNumQueries(num=1):
+            result = get_read_only_content_types(user=user)
+
+        self.assertSetEqual(
+            set1=result,
+            set2={("auth", "user"), ("auth", "group")},
+        )
+
+    def test_get_read_only_content_types__cached(self) -> None:
+        """Resolver must cache result on user object."""
+        user = User.objects.first()
+        get_read_only_content_types(user=user)
+
+        with self.assertNumQueries(num=0):
+            get_read_only_content_types(user=user)
+
+    @override_settings(AUTHENTICATION_BACKENDS=["tests.test_resolver.CustomBackend"])
+    def test_get_read_only_content_types__fallback(self) -> None:
+        """Resolver must use authentication backends API for not model backends."""
+        user = User.objects.first()
+
+        self.assertSetEqual(
+            set1=get_read_only_content_types(user=user),
+            set2={("auth", "user"), ("auth", "group")},
+        )
+
+    def test_get_read_only_content_types__for_superuser(self) -> None:
+        """Resolver must return nothing for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+
+        with self.assertNumQueries(num=0):
+            result = get_read_only_content_types(user=user)
+
+        self.assertSetEqual(set1=result, set2=frozenset())
+
+    def test_get_read_only_content_types__for_inactive_user(self) -> None:
+        """Resolver must return nothing for inactive user."""
+        user = User.objects.first()
+        user.is_active = False  # type: ignore
+
+        self.assertSetEqual(
+            set1=get_read_only_content_types(user=user),
+            set2=frozenset(),
+        )
+
+    def test_get_read_only_content_types__without_read_only_permissions(
+        self,
+    ) -> None:
+        """Resolver must return nothing without read only permissions."""
+        Permission.objects.filter(
+            codename__startswith=settings.READ_ONLY_ADMIN_PERMISSION_PREFIX
+        ).delete()
+        user = User.objects.first()
+
+        self.assertSetEqual(
+            set1=get_read_only_content_types(user=user),
+            set2=frozenset(),
+        )
+
+
+class IsReadOnlyResolverTest(TestCase):
+    """is_read_only resolver tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+    def test_is_read_only(self) -> None:
+        """Resolver must return True for model with read only permission."""
+        self.assertTrue(expr=is_read_only(user=User.objects.first(), model=User))
+
+    def test_is_read_only__label(self) -> None:
+        """Resolver must accept model label."""
+        self.assertTrue(expr=is_read_only(user=User.objects.first(), model="auth.user"))
+
+    def test_is_read_only__instance(self) -> None:
+        """Resolver must accept model instance."""
+        user = User.objects.first()
+
+        self.assertTrue(expr=is_read_only(user=user, model=user))  # type: ignore
+
+    def test_is_read_only__without_read_only_permission(self) -> None:
+        """Resolver must return False for model without read only permission."""
+        self.assertFalse(expr=is_read_only(user=User.objects.first(), model=Group))
+
+
+# django test case awaits async test methods since django 3.1
+@skipIf(condition=django.VERSION < (3, 1), reason="Requires Django 3.1 or newer.")
+class AsyncResolverTest(TestCase):
+    """Async resolver tests."""
+
+    user: Any
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        cls.user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        cls.user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+    async def test_aget_read_only_content_types(self) -> None:
+        """Resolver must return user read only content types."""
+        self.assertSetEqual(
+            set1=await aget_read_only_content_types(user=self.user),
+            set2={("auth", "user")},
+        )
+
+    async def test_aget_read_only_content_types__cached(self) -> None:
+        """Resolver must share cache with sync version."""
+        result = await aget_read_only_content_types(user=self.user)
+
+        self.assertIs(expr1=get_read_only_content_types(user=self.user), expr2=result)
+
+    async def test_ais_read_only(self) -> None:
+        """Resolver must return True for model with read only permission."""
+        self.assertTrue(expr=await ais_read_only(user=self.user, model=User))
+
+    async def test_ais_read_only__without_read_only_permission(self) -> None:
+        """Resolver must return False for model without read only permission."""
+        self.assertFalse(expr=await ais_read_only(user=self.user, model=Group))
+
+
+@override_settings(
+    READ_ONLY_ADMIN_FIELD_PERMISSIONS={
+        "auth.User": ["email", "last_name", "first_name"]
+    }
+)
+class ReadOnlyFieldsResolverTest(TestCase):
+    """Read only fields resolver tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        content_type = ContentType.objects.get_for_model(User)
+        user.user_permissions.add(
+            *[
+                Permission.objects.create(
+                    content_type=content_type, codename=codename, name=codename
+                )
+                for codename in [
+                    "readonly_user__email",
+                    "readonly_user__first_name",
+                    "readonly_user__unknown",
+                ]
+            ]
+        )
+
+    def test_get_read_only_fields_mask(self) -> None:
+        """Resolver must return fields index positions bits."""
+        user = User.objects.first()
+
+        with self.assertNumQueries(num=1):
+            self.assertEqual(
+                first=get_read_only_fields_mask(user=user, model=User), second=0b101
+            )
+            get_read_only_content_types(user=user)
+
+    def test_get_read_only_fields_mask__not_indexed(self) -> None:
+        """Resolver must not query database for models without indexed fields."""
+        user = User.objects.first()
+
+        with self.assertNumQueries(num=0):
+            self.assertEqual(
+                first=get_read_only_fields_mask(user=user, model=Group), second=0
+            )
+
+    def test_get_read_only_fields(self) -> None:
+        """Resolver must decode fields mask to fields names."""
+        self.assertTupleEqual(
+            tuple1=get_read_only_fields(user=User.objects.first(), model="auth.user"),
+            tuple2=("email", "first_name"),
+        )
+
+    def test_get_read_only_fields__for_superuser(self) -> None:
+        """Resolver must return nothing for superuser."""
+        user = User.objects.first()
+        user.is_superuser = True  # type: ignore
+
+        self.assertTupleEqual(
+            tuple1=get_read_only_fields(user=user, model=User), tuple2=()
+        )
+
+    def test_get_read_only_content_types(self) -> None:
+        """Fields permissions must not be treated as models permissions."""
+        self.assertSetEqual(
+            set1=get_read_only_content_types(user=User.objects.first()),
+            set2=frozenset(),
+        )
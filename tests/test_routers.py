@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_routers.py
+
+
+from typing import Any, List
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+
+from read_only_admin.routers import ReadOnlyAdminRouter, use_replica
+
+
+__all__: List[str] = ["ReadOnlyAdminRouterTest"]
+
+
+User = get_user_model()
+
+
+@override_settings(READ_ONLY_ADMIN_REPLICA_DATABASE="replica")
+class ReadOnlyAdminRouterTest(TestCase):
+    """Read only admin router tests."""
+
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+        )
+
+    def test_db_for_read(self) -> None:
+        """Router must not route reads outside read only context."""
+        self.assertIsNone(obj=ReadOnlyAdminRouter().db_for_read(model=User))
+        self.assertTrue(expr=User.objects.exists())
+
+    def test_db_for_read__use_replica(self) -> None:
+        """Router must route reads to replica inside read only context."""
+        with use_replica(using="replica"):
+            self.assertEqual(
+                first=ReadOnlyAdminRouter().db_for_read(model=User),
+                second="replica",
+            )
+            self.assertFalse(expr=User.objects.exists())
+
+    def test_db_for_write(self) -> None:
+        """Router must never route writes to replica."""
+        with use_replica(using="replica"):
+            self.assertIsNone(obj=ReadOnlyAdminRouter().db_for_write(model=User))
+            User.objects.create(username="another")
+
+        self.assertTrue(expr=User.objects.filter(username="another").exists())
+
+    def test_db_for_write__replica_instance(self) -> None:
+        """Router must route writes of objects loaded from replica to primary."""
+        user: Any = User(username="another")
+        user._state.db = "replica"
+
+        self.assertEqual(
+            first=ReadOnlyAdminRouter().db_for_write(model=User, instance=user),
+            second="default",
+        )
+
+        user.save()
+
+        self.assertTrue(
+            expr=User.objects.using("default").filter(username="another").exists()
+        )
+        self.assertFalse(
+            expr=User.objects.using("replica").filter(username="another").exists()
+        )
+
+    def test_allow_relation(self) -> None:
+        """Router must allow relations between primary and replica objects."""
+        user: Any = User.objects.first()
+        another = User(username="another")
+        another._state.db = "replica"
+
+        self.assertTrue(
+            expr=ReadOnlyAdminRouter().allow_relation(obj1=user, obj2=another)
+        )
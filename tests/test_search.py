@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_search.py
+
+
+from typing import List
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.client import RequestFactory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import Permission
+from django.test import TestCase, TransactionTestCase
+
+from read_only_admin.admin import ReadonlyAdmin
+from read_only_admin.search import (
+    BaseSearchBackend,
+    SQLiteFTS5SearchBackend,
+    get_search_backend,
+    get_search_registry,
+    build_search_registry,
+)
+
+
+__all__: List[str] = [
+    "SearchBackendTest",
+    "SQLiteFTS5SearchBackendTest",
+    "ReadonlyAdminSearchTest",
+]
+
+
+User = get_user_model()
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    ...
+
+
+class SearchBackendTest(TestCase):
+    """Search backend helpers tests."""
+
+    def test_get_search_backend(self) -> None:
+        """Search backend must be disabled by default."""
+        self.assertIsNone(obj=get_search_backend())
+
+    @override_settings(
+        READ_ONLY_ADMIN_SEARCH_BACKEND="read_only_admin.search.SQLiteFTS5SearchBackend"
+    )
+    def test_get_search_backend__configured(self) -> None:
+        """Configured search backend must be loaded once."""
+        backend = get_search_backend()
+
+        self.assertIsInstance(obj=backend, cls=SQLiteFTS5SearchBackend)
+        self.assertIsInstance(obj=backend, cls=BaseSearchBackend)
+        self.assertIs(expr1=get_search_backend(), expr2=backend)
+
+    def test_build_search_registry(self) -> None:
+        """Registry must contain read only admins search fields."""
+        site = AdminSite(name="search")
+        site.register(User, ReadOnlyUserAdmin)
+        site.register(Permission)
+        registry = build_search_registry()
+
+        self.assertEqual(
+            first=registry["auth.user"],
+            second=("username", "first_name", "last_name", "email"),
+        )
+        self.assertNotIn(member="auth.permission", container=registry)
+        self.assertIs(expr1=get_search_registry(), expr2=registry)
+
+        del site
+        build_search_registry()
+
+
+@override_settings(
+    READ_ONLY_ADMIN_SEARCH_BACKEND="read_only_admin.search.SQLiteFTS5SearchBackend"
+)
+class SQLiteFTS5SearchBackendTest(TransactionTestCase):
+    """SQLite FTS5 search backend tests, FTS5 tables can't be rolled back to savepoint."""  # noqa: E501
+
+    fields = ("username", "first_name", "last_name", "email")
+
+    def setUp(self) -> None:
+        """Set up admin site with read only admin and objects."""
+        self.site = AdminSite(name="search")
+        self.site.register(User, ReadOnlyUserAdmin)
+        build_search_registry()
+        self.backend = get_search_backend()
+        User.objects.create(
+            username="test",
+            email="test@example.com",
+            first_name="Alice",
+            password=User.objects.make_random_password(),
+        )
+        User.objects.create(
+            username="other",
+            email="other@example.com",
+            first_name="Bob",
+            password=User.objects.make_random_password(),
+        )
+
+    def tearDown(self) -> None:
+        """Drop test admin site from registry and search index."""
+        del self.site
+        build_search_registry()
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS read_only_admin_search_auth_user")
+
+    def test_build(self) -> None:
+        """Index must contain all objects."""
+        self.assertEqual(
+            first=self.backend.build(model=User, search_fields=self.fields),  # type: ignore  # noqa: E501
+            second=2,
+        )
+        self.assertTrue(expr=self.backend.is_indexed(model=User))  # type: ignore
+
+    def test_search(self) -> None:
+        """Search must match search terms prefixes."""
+        self.backend.build(model=User, search_fields=self.fields)  # type: ignore
+
+        self.assertListEqual(
+            list1=list(
+                self.backend.search(  # type: ignore
+                    queryset=User.objects.all(),
+                    search_fields=self.fields,
+                    search_term="ali",
+                ).values_list("username", flat=True)
+            ),
+            list2=["test"],
+        )
+
+    def test_search__quoted(self) -> None:
+        """Search must handle quoted search terms."""
+        self.backend.build(model=User, search_fields=self.fields)  # type: ignore
+
+        self.assertListEqual(
+            list1=list(
+                self.backend.search(  # type: ignore
+                    queryset=User.objects.all(),
+                    search_fields=self.fields,
+                    search_term='"other@example" bob',
+                ).values_list("username", flat=True)
+            ),
+            list2=["other"],
+        )
+
+    def test_search__other_database(self) -> None:
+        """Search in other database must be limited to max results primary keys."""
+        self.backend.build(model=User, search_fields=self.fields)  # type: ignore
+
+        with patch.object(self.backend, "max_results", 1):
+            self.assertIsNotNone(
+                obj=self.backend.search(  # type: ignore
+                    queryset=User.objects.using("replica").all(),
+                    search_fields=self.fields,
+                    search_term="ali",
+                )
+            )
+            self.assertIsNone(
+                obj=self.backend.search(  # type: ignore
+                    queryset=User.objects.using("replica").all(),
+                    search_fields=self.fields,
+                    search_term="example",
+                )
+            )
+
+    def test_search__not_indexed(self) -> None:
+        """Search must fall back to django admin search without index."""
+        self.assertIsNone(
+            obj=self.backend.search(  # type: ignore
+                queryset=User.objects.all(),
+                search_fields=self.fields,
+                search_term="ali",
+            )
+        )
+
+    def test_update_search_index(self) -> None:
+        """Saved objects must be indexed."""
+        self.backend.build(model=User, search_fields=self.fields)  # type: ignore
+        user = User.objects.get(username="other")
+        user.first_name = "Carol"
+        user.save()
+
+        self.assertListEqual(
+            list1=list(
+                self.backend.search(  # type: ignore
+                    queryset=User.objects.all(),
+                    search_fields=self.fields,
+                    search_term="carol",
+                ).values_list("username", flat=True)
+            ),
+            list2=["other"],
+        )
+        self.assertFalse(
+            expr=self.backend.search(  # type: ignore
+                queryset=User.objects.all(),
+                search_fields=self.fields,
+                search_term="bob",
+            ).exists()
+        )
+
+    def test_delete_search_index(self) -> None:
+        """Deleted objects must be removed from index."""
+        self.backend.build(model=User, search_fields=self.fields)  # type: ignore
+        User.objects.filter(username="test").delete()
+
+        with self.assertNumQueries(num=2):
+            self.assertListEqual(
+                list1=list(
+                    self.backend.search(  # type: ignore
+                        queryset=User.objects.all(),
+                        search_fields=self.fields,
+                        search_term="test",
+                    ).values_list("username", flat=True)
+                ),
+                list2=[],
+            )
+
+
+@override_settings(
+    READ_ONLY_ADMIN_SEARCH_BACKEND="read_only_admin.search.SQLiteFTS5SearchBackend"
+)
+class ReadonlyAdminSearchTest(TransactionTestCase):
+    """Read only admin search tests."""
+
+    def setUp(self) -> None:
+        """Set up admin, objects and search index."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            first_name="Alice",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+        self.admin = ReadOnlyUserAdmin(model=User, admin_site=AdminSite())
+        get_search_backend().build(  # type: ignore
+            model=User, search_fields=self.admin.search_fields
+        )
+
+    def tearDown(self) -> None:
+        """Drop search index."""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS read_only_admin_search_auth_user")
+
+    def test_get_search_results(self) -> None:
+        """Read only users must be searched using index."""
+        request = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        queryset, may_have_duplicates = self.admin.get_search_results(
+            request=request, queryset=User.objects.all(), search_term="alice"
+        )
+
+        self.assertIn(member="MATCH", container=str(queryset.query))
+        self.assertEqual(first=queryset.count(), second=1)
+        self.assertFalse(expr=may_have_duplicates)
+
+    def test_get_search_results__for_superuser(self) -> None:
+        """Superusers must be searched by django admin."""
+        request = RequestFactory().get("/")
+        request.user = User.objects.first()  # type: ignore
+        request.user.is_superuser = True
+        queryset, may_have_duplicates = self.admin.get_search_results(
+            request=request, queryset=User.objects.all(), search_term="alice"
+        )
+
+        self.assertNotIn(member="MATCH", container=str(queryset.query))
+        self.assertEqual(first=queryset.count(), second=1)
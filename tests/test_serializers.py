@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_serializers.py
+
+
+import json
+from uuid import UUID
+from typing import List
+from decimal import Decimal
+
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+
+from read_only_admin.serializers import dumps, stream_results, get_values_fields
+
+
+__all__: List[str] = [
+    "GetValuesFieldsSerializersTest",
+    "DumpsSerializersTest",
+    "StreamResultsSerializersTest",
+]
+
+
+class GetValuesFieldsSerializersTest(TestCase):
+    """get_values_fields serializers util tests."""
+
+    def test_get_values_fields(self) -> None:
+        """Only model concrete fields must be selected, primary key first."""
+        self.assertListEqual(
+            list1=get_values_fields(
+                model=get_user_model(),
+                fields=["__str__", "username", "groups", "email", "username", len],
+            ),
+            list2=["id", "username", "email"],
+        )
+
+    def test_get_values_fields__foreign_key(self) -> None:
+        """Foreign key must be selected by name even if it's given by column."""
+        self.assertListEqual(
+            list1=get_values_fields(model=Permission, fields=["content_type_id"]),
+            list2=["id", "content_type"],
+        )
+
+
+class DumpsSerializersTest(TestCase):
+    """dumps serializers util tests."""
+
+    def test_dumps(self) -> None:
+        """Decimals and UUIDs must be serialized."""
+        self.assertEqual(
+            first=json.loads(
+                dumps(
+                    data={
+                        "decimal": Decimal("1.5"),
+                        "uuid": UUID("12345678123456781234567812345678"),
+                    }
+                )
+            ),
+            second={
+                "decimal": "1.5",
+                "uuid": "12345678-1234-5678-1234-567812345678",
+            },
+        )
+
+
+class StreamResultsSerializersTest(TestCase):
+    """stream_results serializers util tests."""
+
+    def test_stream_results(self) -> None:
+        """Streamed parts must compose JSON document."""
+        self.assertEqual(
+            first=json.loads("".join(stream_results(rows=[{"id": 1}, {"id": 2}]))),
+            second={"results": [{"id": 1}, {"id": 2}]},
+        )
+
+    def test_stream_results__empty(self) -> None:
+        """Streamed parts must compose JSON document without rows."""
+        self.assertEqual(
+            first=json.loads("".join(stream_results(rows=[]))),
+            second={"results": []},
+        )
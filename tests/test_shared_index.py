@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_shared_index.py
+
+
+import os
+import sys
+import fcntl
+import tempfile
+from typing import List
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+
+from read_only_admin.cache import get_permissions_generation
+from read_only_admin.resolver import is_read_only, get_read_only_content_types
+from read_only_admin.shared_index import (
+    SharedIndex,
+    get_shared_index,
+    build_shared_index,
+)
+
+
+__all__: List[str] = ["SharedIndexTest", "GetSharedIndexTest"]
+
+
+User = get_user_model()
+
+
+class SharedIndexTestMixin:
+    """Shared index tests helpers."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            Permission.objects.get(codename="readonly_user"),
+            Permission.objects.create(
+                codename="readonly_user__email",
+                name="Read only user email",
+                content_type=ContentType.objects.get_for_model(model=User),
+            ),
+        )
+        group = Group.objects.create(name="test")
+        group.permissions.add(Permission.objects.get(codename="readonly_group"))
+        user.groups.add(group)
+        User.objects.create(
+            username="other",
+            email="other@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+
+    def setUp(self) -> None:
+        """Set up each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, "index")
+
+    def tearDown(self) -> None:
+        """Clean up after each test."""
+        self.directory.cleanup()
+        cache.clear()
+
+
+class SharedIndexTest(SharedIndexTestMixin, TestCase):
+    """Shared index tests."""
+
+    def test_build_shared_index(self) -> None:
+        """Users read only content types must be indexed, field level permissions must be skipped."""  # noqa: E501
+        count: int = build_shared_index(path=self.path, generation="a" * 32)
+        index: SharedIndex = SharedIndex(path=self.path)
+
+        self.assertEqual(first=count, second=1)
+        self.assertEqual(first=index.generation, second="a" * 32)
+        self.assertSetEqual(
+            set1=index.get(user_id=User.objects.get(username="test").pk),  # type: ignore  # noqa: E501
+            set2={("auth", "user"), ("auth", "group")},
+        )
+        self.assertEqual(
+            first=index.get(user_id=User.objects.get(username="other").pk),
+            second=frozenset(),
+        )
+        self.assertIsNone(obj=index.get(user_id="1"))
+
+    def test_build_shared_index__atomic(self) -> None:
+        """Index file must be replaced without leaving temporary files, mapped index must stay readable."""  # noqa: E501
+        build_shared_index(path=self.path, generation="a" * 32)
+        index: SharedIndex = SharedIndex(path=self.path)
+        build_shared_index(path=self.path, generation="b" * 32)
+
+        self.assertListEqual(list1=os.listdir(self.directory.name), list2=["index"])
+        self.assertFalse(expr=index.is_current(path=self.path))
+        self.assertTrue(expr=SharedIndex(path=self.path).is_current(path=self.path))
+        self.assertEqual(
+            first=len(index.get(user_id=User.objects.get(username="test").pk)),  # type: ignore  # noqa: E501
+            second=2,
+        )
+
+    def test_shared_index__not_index_file(self) -> None:
+        """Other files must not be mapped."""
+        with open(self.path, "wb") as index:
+            index.write(b"\x00" * 128)
+
+        with self.assertRaises(ValueError):
+            SharedIndex(path=self.path)
+
+
+class GetSharedIndexTest(SharedIndexTestMixin, TestCase):
+    """get_shared_index tests."""
+
+    def test_get_shared_index__disabled(self) -> None:
+        """Nothing must be returned if shared index is disabled."""
+        self.assertIsNone(obj=get_shared_index())
+
+    def test_get_shared_index(self) -> None:
+        """Index must be built once and rebuilt when permissions generation changes."""  # noqa: E501
+        with override_settings(
+            READ_ONLY_ADMIN_SHARED_INDEX=self.path,
+            READ_ONLY_ADMIN_SHARED_INDEX_CHECK_INTERVAL=0,
+        ):
+            index: SharedIndex = get_shared_index()  # type: ignore
+
+            self.assertEqual(
+                first=index.generation, second=get_permissions_generation()
+            )
+            self.assertIs(expr1=get_shared_index(), expr2=index)
+
+            other = User.objects.get(username="other")
+            other.user_permissions.add(Permission.objects.get(codename="readonly_user"))
+            rebuilt: SharedIndex = get_shared_index()  # type: ignore
+
+            self.assertIsNot(expr1=rebuilt, expr2=index)
+            self.assertEqual(
+                first=rebuilt.get(user_id=other.pk),
+                second=frozenset([("auth", "user")]),
+            )
+
+    def test_get_shared_index__check_interval(self) -> None:
+        """Permissions generation must not be checked during check interval."""
+        with override_settings(
+            READ_ONLY_ADMIN_SHARED_INDEX=self.path,
+            READ_ONLY_ADMIN_SHARED_INDEX_CHECK_INTERVAL=60,
+        ):
+            index: SharedIndex = get_shared_index()  # type: ignore
+            User.objects.get(username="other").user_permissions.add(
+                Permission.objects.get(codename="readonly_user")
+            )
+
+            self.assertIs(expr1=get_shared_index(), expr2=index)
+
+    def test_get_shared_index__mapped_by_other_process(self) -> None:
+        """Index file of current generation built by other process must be mapped without rebuild."""  # noqa: E501
+        build_shared_index(path=self.path, generation=get_permissions_generation())
+        stat: os.stat_result = os.stat(self.path)
+        with override_settings(READ_ONLY_ADMIN_SHARED_INDEX=self.path):  # noqa: SIM117
+            with self.assertNumQueries(num=0):
+                index: SharedIndex = get_shared_index()  # type: ignore
+
+        self.assertEqual(first=index.stat.st_ino, second=stat.st_ino)
+
+    def test_get_shared_index__rebuilt_by_other_process(self) -> None:
+        """Index must not be rebuilt while other process holds rebuild lock."""
+        with open(f"{self.path}.lock", "ab") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            with override_settings(READ_ONLY_ADMIN_SHARED_INDEX=self.path):
+                self.assertIsNone(obj=get_shared_index())
+
+        self.assertFalse(expr=os.path.exists(self.path))
+
+    def test_get_shared_index__without_file_locks(self) -> None:
+        """Index must be unavailable on platforms without file locks."""
+        with patch.dict(sys.modules, {"fcntl": None}):  # noqa: SIM117
+            with override_settings(READ_ONLY_ADMIN_SHARED_INDEX=self.path):
+                self.assertIsNone(obj=get_shared_index())
+                self.assertTrue(
+                    expr=is_read_only(
+                        user=User.objects.get(username="test"), model=User
+                    )
+                )
+
+        self.assertFalse(expr=os.path.exists(self.path))
+
+    def test_get_read_only_content_types(self) -> None:
+        """Resolver must read user read only content types from shared index without queries."""  # noqa: E501
+        with override_settings(READ_ONLY_ADMIN_SHARED_INDEX=self.path):
+            get_shared_index()
+            user = User.objects.get(username="test")
+
+            with self.assertNumQueries(num=0):
+                result = get_read_only_content_types(user=user)
+
+            self.assertSetEqual(set1=result, set2={("auth", "user"), ("auth", "group")})
+            self.assertTrue(expr=is_read_only(user=user, model=User))
@@ -8,10 +8,25 @@ from typing import List
 
 from django.conf import settings
 from django.test import TestCase
-from django.contrib.auth.models import Permission
+from django.db.models import signals
+from django.contrib.auth import get_user_model
+from django.db.models.deletion import Collector
+from django.test.utils import override_settings
+from django.contrib.admin.models import LogEntry
+from django.contrib.auth.models import Group, Permission
 
+from read_only_admin.cache import bump_model_version, bump_permissions_generation
+from read_only_admin.signals import (
+    connect_signals,
+    add_readonly_permissions,
+    register_versioned_model,
+)
 
-__all__: List[str] = ["AddReadOnlyPermissionsSignalTest"]
+
+__all__: List[str] = ["AddReadOnlyPermissionsSignalTest", "ConnectSignalsTest"]
+
+
+User = get_user_model()
 
 
 class AddReadOnlyPermissionsSignalTest(TestCase):
@@ -42,3 +57,77 @@ class AddReadOnlyPermissionsSignalTest(TestCase):
             ).count(),
             second=5,
         )
+
+    @override_settings(READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email"]})
+    def test_add_readonly_permissions__fields(self) -> None:
+        """Test signal create read only fields permissions for opt-in models."""
+        add_readonly_permissions(sender=None, app_config=None)  # type: ignore
+
+        self.assertListEqual(
+            list1=list(
+                Permission.objects.filter(codename__contains="__").values_list(
+                    "content_type__model", "codename", "name"
+                )
+            ),
+            list2=[("user", "readonly_user__email", "Read only user email")],
+        )
+
+
+class ConnectSignalsTest(TestCase):
+    """Data change receivers connection tests."""
+
+    def test_connect_signals(self) -> None:
+        """Disabled features receivers must not be connected and must not disable fast deletes."""  # noqa: E501
+        connect_signals()
+
+        self.assertNotIn(
+            member=bump_permissions_generation,
+            container=signals.post_save._live_receivers(Group),
+        )
+        self.assertNotIn(
+            member=bump_model_version,
+            container=signals.post_save._live_receivers(Group),
+        )
+        self.assertTrue(
+            expr=Collector(using="default").can_fast_delete(LogEntry.objects.all())
+        )
+
+    @override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=True)
+    def test_connect_signals__permissions_generation(self) -> None:
+        """Permissions generation receiver must be connected to permissions models only."""  # noqa: E501
+        self.assertIn(
+            member=bump_permissions_generation,
+            container=signals.m2m_changed._live_receivers(User.groups.through),
+        )
+        self.assertIn(
+            member=bump_permissions_generation,
+            container=signals.post_delete._live_receivers(Group),
+        )
+        self.assertNotIn(
+            member=bump_permissions_generation,
+            container=signals.post_delete._live_receivers(User),
+        )
+        self.assertTrue(
+            expr=Collector(using="default").can_fast_delete(LogEntry.objects.all())
+        )
+
+    @override_settings(READ_ONLY_ADMIN_FILTERS_CACHE_TIMEOUT=60)
+    def test_register_versioned_model(self) -> None:
+        """Model version receiver must be connected to read only admin model and it's related models."""  # noqa: E501
+        register_versioned_model(model=Group)
+
+        self.assertIn(
+            member=bump_model_version,
+            container=signals.post_save._live_receivers(Group),
+        )
+        self.assertIn(
+            member=bump_model_version,
+            container=signals.m2m_changed._live_receivers(Group.permissions.through),
+        )
+        self.assertIn(
+            member=bump_model_version,
+            container=signals.post_delete._live_receivers(Permission),
+        )
+        self.assertTrue(
+            expr=Collector(using="default").can_fast_delete(LogEntry.objects.all())
+        )
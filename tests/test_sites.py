@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_sites.py
+
+
+from typing import Any, Dict, List, Type
+
+from django.urls import path
+from django.test import TestCase
+from django.http import HttpRequest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.auth.models import Group, Permission
+from django.contrib.admin import AdminSite, ModelAdmin, StackedInline
+
+from read_only_admin.admin import ReadonlyAdmin, ReadonlyInline, ReadonlyChangeList
+from read_only_admin.sites import (
+    ReadonlyAdminSite,
+    ReadonlyAdminSiteMixin,
+    wrap_admin_site,
+    get_readonly_admin_class,
+)
+
+
+__all__: List[str] = ["ReadonlyAdminSiteTest", "WrapAdminSiteTest"]
+
+
+User = get_user_model()
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    ...
+
+
+class ReadOnlyGroupAdmin(ReadonlyAdmin):
+    """Read only admin class."""
+
+    ...
+
+
+class UserPermissionsInline(StackedInline):  # type: ignore
+    """Not read only stacked inline."""
+
+    model = User.user_permissions.through
+
+
+class UserPermissionsAdmin(UserAdmin):
+    """Not read only admin class with inline."""
+
+    inlines = [UserPermissionsInline]
+
+
+class CustomChangeList(ChangeList):
+    """Custom change list."""
+
+    ...
+
+
+class CustomTemplatesAdmin(ModelAdmin):  # type: ignore
+    """Not read only admin class with own templates and change list."""
+
+    change_list_template = "custom/change_list.html"
+    change_form_template = "custom/change_form.html"
+
+    def get_changelist(  # pylint: disable=R0201
+        self, request: HttpRequest, **kwargs: Dict[str, Any]
+    ) -> Type[ChangeList]:
+        """
+        Returns custom change list class.
+
+        :param request: django HTTP request object
+        :type request: HttpRequest
+        :param kwargs: additional args
+        :type kwargs: Dict[str, Any]
+        :return: custom change list
+        :rtype: Type[ChangeList]
+        """
+        return CustomChangeList
+
+
+site = ReadonlyAdminSite(name="readonly")
+site.register(User, ReadOnlyUserAdmin)
+site.register(Group, ReadOnlyGroupAdmin)
+
+urlpatterns = [path("admin/", site.urls)]
+
+
+@override_settings(ROOT_URLCONF="tests.test_sites")
+class ReadonlyAdminSiteTest(TestCase):
+    """Read only admin site tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(
+                    content_type__app_label="auth",
+                    codename__in=[
+                        "readonly_user",
+                        "add_user",
+                        "change_user",
+                        "delete_user",
+                        "view_user",
+                        "change_group",
+                    ],
+                )
+            )
+        )
+
+    def _get_models(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get index models dicts.
+
+        :return: models dicts
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        request: HttpRequest = HttpRequest()
+        request.user = User.objects.first()  # type: ignore
+        app_list: List[Dict[str, Any]] = site.get_app_list(
+            request=request  # type: ignore
+        )
+
+        return {
+            model["object_name"]: model for app in app_list for model in app["models"]
+        }
+
+    def test_get_app_list(self) -> None:
+        """Read only models must be shown as view only."""
+        models = self._get_models()
+
+        self.assertTrue(expr=models["User"]["view_only"])
+        self.assertDictEqual(
+            d1=models["User"]["perms"],
+            d2={"add": False, "change": False, "delete": False, "view": True},
+        )
+        self.assertIsNone(obj=models["User"]["add_url"])
+
+    def test_get_app_list__not_read_only(self) -> None:
+        """Not read only models must be shown as usual."""
+        models = self._get_models()
+
+        self.assertFalse(expr=models["Group"]["view_only"])
+
+    def test_get_app_list__queries(self) -> None:
+        """Read only status and permissions must be resolved once."""
+        # user, read only permissions, user permissions and groups permissions
+        with self.assertNumQueries(num=4):
+            self._get_models()
+
+
+class WrapAdminSiteTest(TestCase):
+    """Read only behavior for not read only admins tests."""
+
+    def test_register(self) -> None:
+        """Read only site must register read only version of admin class."""
+        readonly = ReadonlyAdminSite(name="wrapped")
+        readonly.register(User, UserAdmin)
+        readonly.register(Permission)
+
+        self.assertIsInstance(obj=readonly._registry[User], cls=ReadonlyAdmin)
+        self.assertIsInstance(obj=readonly._registry[User], cls=UserAdmin)
+        self.assertIsInstance(obj=readonly._registry[Permission], cls=ReadonlyAdmin)
+
+    def test_get_readonly_admin_class__cached(self) -> None:
+        """Generated admin classes must be cached."""
+        self.assertIs(
+            expr1=get_readonly_admin_class(admin_class=UserAdmin),
+            expr2=get_readonly_admin_class(admin_class=UserAdmin),
+        )
+
+    def test_get_readonly_admin_class__read_only(self) -> None:
+        """Read only admin classes must be used as is."""
+        self.assertIs(
+            expr1=get_readonly_admin_class(admin_class=ReadOnlyUserAdmin),
+            expr2=ReadOnlyUserAdmin,
+        )
+
+    def test_get_readonly_admin_class__inlines(self) -> None:
+        """Admin class inlines must be replaced with read only versions."""
+        admin_class = get_readonly_admin_class(admin_class=UserPermissionsAdmin)
+        inline = admin_class.inlines[0]
+
+        self.assertTrue(expr=issubclass(inline, ReadonlyInline))
+        self.assertTrue(expr=issubclass(inline, UserPermissionsInline))
+        self.assertEqual(first=inline.template, second="admin/edit_inline/stacked.html")
+
+    def test_get_readonly_admin_class__templates(self) -> None:
+        """Admin class own templates and change list class must be kept."""
+        admin_class = get_readonly_admin_class(admin_class=CustomTemplatesAdmin)
+        model_admin = admin_class(model=Group, admin_site=AdminSite())
+
+        self.assertEqual(
+            first=model_admin.change_list_template, second="custom/change_list.html"
+        )
+        self.assertEqual(
+            first=model_admin.change_form_template, second="custom/change_form.html"
+        )
+        self.assertIs(
+            expr1=model_admin.get_changelist(request=HttpRequest()),
+            expr2=CustomChangeList,
+        )
+
+    def test_get_readonly_admin_class__default_templates(self) -> None:
+        """Read only templates must be used for admin class without own templates."""
+        model_admin = get_readonly_admin_class(admin_class=UserAdmin)(
+            model=User, admin_site=AdminSite()
+        )
+
+        self.assertEqual(
+            first=model_admin.change_list_template,
+            second=ReadonlyAdmin.change_list_template,
+        )
+        self.assertIs(
+            expr1=model_admin.get_changelist(request=HttpRequest()),
+            expr2=ReadonlyChangeList,
+        )
+
+    def test_wrap_admin_site(self) -> None:
+        """Existing admin site registered admins must become read only."""
+        existing = AdminSite(name="existing")
+        existing.register(Group)
+        wrap_admin_site(site=existing)
+        existing.register(Permission)
+
+        self.assertIsInstance(obj=existing, cls=ReadonlyAdminSiteMixin)
+        self.assertIsInstance(obj=existing._registry[Group], cls=ReadonlyAdmin)
+        self.assertIsInstance(obj=existing._registry[Permission], cls=ReadonlyAdmin)
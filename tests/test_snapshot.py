@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_snapshot.py
+
+
+from typing import Any, List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.test.client import RequestFactory
+from django.contrib.auth import get_user_model
+from django.test.utils import override_settings
+from django.contrib.auth.models import Permission
+
+from read_only_admin.cache import get_permissions_generation
+from read_only_admin.resolver import get_read_only_fields_mask
+from read_only_admin.snapshot import (
+    SESSION_KEY,
+    dumps_snapshot,
+    loads_snapshot,
+    restore_snapshot,
+)
+
+
+__all__: List[str] = ["SnapshotTest"]
+
+
+User = get_user_model()
+
+
+class SnapshotTest(TestCase):
+    """Read only permissions snapshot tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        User.objects.create(username="other")
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def test_loads_snapshot(self) -> None:
+        """Snapshot must contain read only content types."""
+        user = User.objects.get(username="test")
+        value = dumps_snapshot(
+            user=user, content_types=frozenset({("auth", "user")}), generation="1"
+        )
+
+        self.assertSetEqual(
+            set1=loads_snapshot(user=user, value=value, generation="1"),  # type: ignore
+            set2={("auth", "user")},
+        )
+
+    def test_loads_snapshot__bad_signature(self) -> None:
+        """Tampered snapshot must be ignored."""
+        user = User.objects.get(username="test")
+        value = dumps_snapshot(user=user, content_types=frozenset(), generation="1")
+
+        self.assertIsNone(
+            obj=loads_snapshot(user=user, value=f"{value}x", generation="1")
+        )
+
+    def test_loads_snapshot__other_user(self) -> None:
+        """Other user snapshot must be ignored."""
+        value = dumps_snapshot(
+            user=User.objects.get(username="test"),
+            content_types=frozenset(),
+            generation="1",
+        )
+
+        self.assertIsNone(
+            obj=loads_snapshot(
+                user=User.objects.get(username="other"), value=value, generation="1"
+            )
+        )
+
+    @override_settings(READ_ONLY_ADMIN_SESSION_SNAPSHOT=True)
+    def test_loads_snapshot__stale(self) -> None:
+        """Snapshot must be stale after permissions change."""
+        user = User.objects.get(username="test")
+        generation = get_permissions_generation()
+        value = dumps_snapshot(
+            user=user, content_types=frozenset(), generation=generation
+        )
+        user.user_permissions.add(
+            *list(Permission.objects.filter(codename__in=["readonly_user"]))
+        )
+
+        self.assertNotEqual(first=get_permissions_generation(), second=generation)
+        self.assertIsNone(
+            obj=loads_snapshot(
+                user=user, value=value, generation=get_permissions_generation()
+            )
+        )
+
+    def restore_snapshot(self, masks: Any) -> Any:
+        """
+        Restore snapshot with given read only fields masks on request user.
+
+        :param masks: read only fields masks
+        :type masks: Any
+        :return: request user
+        :rtype: Any
+        """
+        user = User.objects.get(username="test")
+        request = RequestFactory().get("/")
+        request.user = user
+        request.session = {  # type: ignore
+            SESSION_KEY: dumps_snapshot(
+                user=user,
+                content_types=frozenset(),
+                generation=get_permissions_generation(),
+                masks=masks,
+            )
+        }
+
+        self.assertTrue(expr=restore_snapshot(request=request))
+
+        return user
+
+    @override_settings(
+        READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email", "last_name"]}
+    )
+    def test_restore_snapshot__masks(self) -> None:
+        """Read only fields masks must be restored without queries."""
+        user = self.restore_snapshot(masks={("auth", "user"): 0b10})
+
+        with self.assertNumQueries(num=0):
+            self.assertEqual(
+                first=get_read_only_fields_mask(user=user, model="auth.user"),
+                second=0b10,
+            )
+
+    @override_settings(
+        READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email", "last_name"]}
+    )
+    def test_restore_snapshot__masks__fields_index_changed(self) -> None:
+        """Read only fields masks must be restored against current fields index."""
+        user = User.objects.get(username="test")
+        value = dumps_snapshot(
+            user=user,
+            content_types=frozenset(),
+            generation=get_permissions_generation(),
+            masks={("auth", "user"): 0b10},
+        )
+        request = RequestFactory().get("/")
+        request.user = user
+        request.session = {SESSION_KEY: value}  # type: ignore
+
+        with override_settings(
+            READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["last_name", "email"]}
+        ):
+            restore_snapshot(request=request)
+
+            self.assertEqual(
+                first=get_read_only_fields_mask(user=user, model="auth.user"),
+                second=0b01,
+            )
+
+    @override_settings(
+        READ_ONLY_ADMIN_FIELD_PERMISSIONS={"auth.User": ["email", "last_name"]}
+    )
+    def test_restore_snapshot__without_masks(self) -> None:
+        """Read only fields masks missing in snapshot must be resolved on demand."""
+        user = self.restore_snapshot(masks=None)
+
+        with self.assertNumQueries(num=1):
+            get_read_only_fields_mask(user=user, model="auth.user")
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+
+# django-read-only-admin
+# tests/test_streaming.py
+
+
+import re
+from typing import List
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.test.client import RequestFactory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.admin import UserAdmin
+from django.test.utils import override_settings
+from django.contrib.admin.sites import AdminSite
+from django.contrib.auth.models import Permission
+from django.contrib.admin.views.main import ChangeList
+from django.http import HttpRequest, StreamingHttpResponse
+
+from read_only_admin.admin import ReadonlyAdmin
+from read_only_admin.admission import AdmissionDenied, admission
+from read_only_admin.streaming import (
+    STREAMING_MARKER,
+    StreamedResultList,
+    stream_changelist,
+)
+
+
+__all__: List[str] = ["StreamingReadonlyAdminTest"]
+
+
+User = get_user_model()
+
+
+class ReadOnlyUserAdmin(UserAdmin, ReadonlyAdmin):
+    """Read only admin class."""
+
+    ...
+
+
+@override_settings(
+    READ_ONLY_ADMIN_STREAMING=True,
+    READ_ONLY_ADMIN_STREAMING_CHUNK_SIZE=2,
+    ROOT_URLCONF="tests.test_sites",
+)
+class StreamingReadonlyAdminTest(TestCase):
+    """Read only admin show all change list streaming tests."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up non-modified objects used by all test methods."""
+        user = User.objects.create(
+            username="test",
+            email="test@example.com",
+            password=User.objects.make_random_password(),
+            is_staff=True,
+        )
+        user.user_permissions.add(
+            *list(
+                Permission.objects.filter(codename__in=["readonly_user", "view_user"])
+            )
+        )
+        for number in range(4):
+            User.objects.create(username=f"user{number}")
+
+    def setUp(self) -> None:
+        """Set up admin and request."""
+        self.admin = ReadOnlyUserAdmin(model=get_user_model(), admin_site=AdminSite())
+        self.request: HttpRequest = RequestFactory().get("/", {"all": ""})
+        self.request.user = User.objects.get(username="test")
+
+    def tearDown(self) -> None:
+        """Clean up cache after each test."""
+        cache.clear()
+
+    def get_content(self, content: bytes) -> str:
+        """
+        Get content without whitespaces between tags and CSRF tokens.
+
+        :param content: response content
+        :type content: bytes
+        :return: normalized content
+        :rtype: str
+        """
+        return re.sub(
+            r'name="csrfmiddlewaretoken" value="[^"]*"',
+            "",
+            re.sub(r">\s+<", "><", content.decode("utf-8")),
+        )
+
+    def test_changelist_view(self) -> None:
+        """Streamed change list must be the same as rendered at once."""
+        response = self.admin.changelist_view(request=self.request)
+
+        self.assertIsInstance(obj=response, cls=StreamingHttpResponse)
+
+        content = self.get_content(content=b"".join(response.streaming_content))  # type: ignore  # noqa: E501
+        response.close()
+
+        with override_settings(READ_ONLY_ADMIN_STREAMING=False):
+            expected = self.get_content(
+                content=self.admin.changelist_view(request=self.request).render().content  # type: ignore  # noqa: E501
+            )
+
+        self.assertEqual(first=content, second=expected)
+        self.assertIn(member="user3", container=content)
+
+    def test_changelist_view__results_not_loaded(self) -> None:
+        """Streamed change list results must be loaded only once and never cached."""  # noqa: E501
+        changelists: List[ChangeList] = []
+        get_changelist_instance = self.admin.get_changelist_instance
+
+        def get_changelist(request: HttpRequest) -> ChangeList:
+            """
+            Record created change list.
+
+            :param request: django HTTP request object
+            :type request: HttpRequest
+            :return: change list
+            :rtype: ChangeList
+            """
+            changelists.append(get_changelist_instance(request))
+
+            return changelists[-1]
+
+        self.admin.get_changelist_instance = get_changelist  # type: ignore
+        response = self.admin.changelist_view(request=self.request)
+        content = b"".join(response.streaming_content)  # type: ignore
+        response.close()
+        result_list = changelists[0].result_list
+
+        self.assertIsInstance(obj=result_list, cls=StreamedResultList)
+        self.assertEqual(first=len(result_list), second=5)
+        self.assertIsNone(obj=result_list.queryset._result_cache)
+        self.assertIn(member=b"user3", container=content)
+
+    def test_stream_changelist__striped_rows(self) -> None:
+        """Rows must be striped like marker row if results template stripes them."""
+        cl = self.admin.get_changelist_instance(request=self.request)
+        content = "".join(
+            stream_changelist(
+                cl=cl,
+                content=f'<table><tr class="row1">{STREAMING_MARKER}</tr></table>',
+            )
+        )
+
+        self.assertListEqual(
+            list1=re.findall(r'<tr class="(row\d)">', content),
+            list2=["row1", "row2", "row1", "row2", "row1"],
+        )
+
+    def test_changelist_view__paginated(self) -> None:
+        """Paginated change list must not be streamed."""
+        request: HttpRequest = RequestFactory().get("/")
+        request.user = self.request.user
+
+        self.assertNotIsInstance(
+            obj=self.admin.changelist_view(request=request),
+            cls=StreamingHttpResponse,
+        )
+
+    @override_settings(READ_ONLY_ADMIN_ADMISSION_LIMIT=1)
+    def test_changelist_view__admission(self) -> None:
+        """Admission slot must be taken until rows are streamed."""
+        response = self.admin.changelist_view(request=self.request)
+
+        with self.assertRaises(AdmissionDenied):  # noqa: SIM117
+            with admission():
+                ...
+
+        list(response.streaming_content)  # type: ignore
+        response.close()
+
+        with admission():
+            ...
@@ -5,22 +5,41 @@
 
 
 from typing import List
+from unittest.mock import patch
 
+from django.apps import apps
 from django.test import TestCase
+from django.template import engines
 from django.test.utils import override_settings
+from django.template.loaders.cached import Loader
 
 from read_only_admin.utils import (
+    WARM_UP_TEMPLATES,
+    warm_up_templates,
     get_read_only_permission_name,
     get_read_only_permission_codename,
+    get_read_only_field_permission_name,
+    get_read_only_field_permission_codename,
 )
 
 
 __all__: List[str] = [
     "GetReadOnlyPermissionCodenameUtilTest",
     "GetReadOnlyPermissionNameUtilTest",
+    "GetReadOnlyFieldPermissionCodenameUtilTest",
+    "GetReadOnlyFieldPermissionNameUtilTest",
+    "WarmUpTemplatesUtilTest",
 ]
 
 
+def reset_template_loaders() -> None:  # noqa: CCR001
+    """Forget templates compiled by cached template loaders."""
+    for engine in engines.all():
+        for loader in engine.engine.template_loaders:  # type: ignore
+            if hasattr(loader, "reset"):
+                loader.reset()
+
+
 class GetReadOnlyPermissionCodenameUtilTest(TestCase):
     """get_read_only_permission_codename util tests."""
 
@@ -35,6 +54,17 @@ class GetReadOnlyPermissionCodenameUtilTest(TestCase):
         """Util must return model read only permission codename based on read only prefix setting with broken prefix settings."""  # noqa: E501
         self.assertEqual(get_read_only_permission_codename(model="user"), "_user")
 
+    def test_get_read_only_permission_codename__setting_changed(self) -> None:
+        """Util must return new codename after read only prefix setting changed."""
+        get_read_only_permission_codename(model="user")
+
+        with override_settings(READ_ONLY_ADMIN_PERMISSION_PREFIX="ro"):
+            self.assertEqual(get_read_only_permission_codename(model="user"), "ro_user")
+
+        self.assertEqual(
+            get_read_only_permission_codename(model="user"), "readonly_user"
+        )
+
 
 class GetReadOnlyPermissionNameUtilTest(TestCase):
     """get_read_only_permission_name util tests."""
@@ -47,3 +77,114 @@ class GetReadOnlyPermissionNameUtilTest(TestCase):
     def test_get_read_only_permission_name__without_prefix(self) -> None:
         """Util must return model read only permission name based on read only name prefix setting with broken name prefix settings."""  # noqa: E501
         self.assertEqual(get_read_only_permission_name(model="user"), " user")
+
+    def test_get_read_only_permission_name__setting_changed(self) -> None:
+        """Util must return new name after read only name prefix setting changed."""
+        get_read_only_permission_name(model="user")
+
+        with override_settings(READ_ONLY_ADMIN_PERMISSION_NAME_PREFIX="view"):
+            self.assertEqual(get_read_only_permission_name(model="user"), "View user")
+
+        self.assertEqual(get_read_only_permission_name(model="user"), "Read only user")
+
+
+class GetReadOnlyFieldPermissionCodenameUtilTest(TestCase):
+    """get_read_only_field_permission_codename util tests."""
+
+    def test_get_read_only_field_permission_codename(self) -> None:
+        """Util must return field read only permission codename based on read only prefix setting."""  # noqa: E501
+        self.assertEqual(
+            get_read_only_field_permission_codename(model="user", field="email"),
+            "readonly_user__email",
+        )
+
+    def test_get_read_only_field_permission_codename__setting_changed(self) -> None:
+        """Util must return new codename after read only prefix setting changed."""
+        get_read_only_field_permission_codename(model="user", field="email")
+
+        with override_settings(READ_ONLY_ADMIN_PERMISSION_PREFIX="view"):
+            self.assertEqual(
+                get_read_only_field_permission_codename(model="user", field="email"),
+                "view_user__email",
+            )
+
+
+class GetReadOnlyFieldPermissionNameUtilTest(TestCase):
+    """get_read_only_field_permission_name util tests."""
+
+    def test_get_read_only_field_permission_name(self) -> None:
+        """Util must return field read only permission name based on read only name prefix setting."""  # noqa: E501
+        self.assertEqual(
+            get_read_only_field_permission_name(model="user", field="email"),
+            "Read only user email",
+        )
+
+
+@override_settings(
+    ROOT_URLCONF="tests.test_sites",
+    TEMPLATES=[
+        {
+            "BACKEND": "django.template.backends.django.DjangoTemplates",
+            "APP_DIRS": True,
+            "OPTIONS": {
+                "context_processors": [
+                    "django.template.context_processors.request",
+                    "django.contrib.auth.context_processors.auth",
+                ]
+            },
+        }
+    ],
+)
+class WarmUpTemplatesUtilTest(TestCase):
+    """warm_up_templates util tests."""
+
+    def tearDown(self) -> None:
+        """Clean up after each test."""
+        reset_template_loaders()
+
+    def test_warm_up_templates(self) -> None:
+        """All templates must be loaded to cached template loader."""
+        reset_template_loaders()
+
+        self.assertListEqual(list1=warm_up_templates(), list2=list(WARM_UP_TEMPLATES))
+        with patch(
+            "django.template.loaders.filesystem.Loader.get_contents"
+        ) as get_contents, patch(
+            "django.template.loaders.app_directories.Loader.get_contents"
+        ) as get_app_contents:
+            warm_up_templates()
+
+        get_contents.assert_not_called()
+        get_app_contents.assert_not_called()
+
+    def test_warm_up_templates__cached_loader(self) -> None:
+        """All templates must be kept by cached template loaders after warm up."""
+        reset_template_loaders()
+        warm_up_templates()
+        loaders: List[Loader] = [
+            loader
+            for engine in engines.all()
+            for loader in engine.engine.template_loaders  # type: ignore
+            if isinstance(loader, Loader)
+        ]
+
+        self.assertTrue(expr=loaders)
+        for loader in loaders:
+            self.assertTrue(
+                expr=set(WARM_UP_TEMPLATES) <= set(loader.get_template_cache)
+            )
+
+    @override_settings(READ_ONLY_ADMIN_WARM_UP_TEMPLATES=True)
+    def test_ready(self) -> None:
+        """Templates must be warmed up on application start if enabled."""
+        with patch("read_only_admin.utils.warm_up_templates") as warm_up:
+            apps.get_app_config("read_only_admin").ready()
+
+        warm_up.assert_called_once_with()
+
+    def test_ready__disabled(self) -> None:
+        """Templates must not be warmed up on application start by default."""
+        with patch("read_only_admin.utils.warm_up_templates") as warm_up:
+            apps.get_app_config("read_only_admin").ready()
+
+        warm_up.assert_not_called()